@@ -2,242 +2,16 @@
 
 import json
 from pathlib import Path
-from typing import Any
-
-from .types import (
-    ClassDoc,
-    DocType,
-    FunctionDoc,
-    MethodDoc,
-    ModuleDoc,
-    PageDoc,
-    ParsedDocstring,
-)
-
-
-def _serialize_docstring(docstring: ParsedDocstring) -> dict[str, Any]:
-    result: dict[str, Any] = {
-        "summary": docstring.summary,
-        "description": docstring.description,
-        "doc_type": docstring.doc_type.value,
-        # Function sections
-        "args": [
-            {
-                "name": a.name,
-                "type": a.type,
-                "description": a.description,
-                "default": a.default,
-                "required": a.required,
-            }
-            for a in docstring.args
-        ],
-        "returns": (
-            {
-                "type": docstring.returns.type,
-                "description": docstring.returns.description,
-            }
-            if docstring.returns
-            else None
-        ),
-        "raises": [
-            {"type": r.type, "description": r.description} for r in docstring.raises
-        ],
-        "examples": docstring.examples,
-        "attributes": [
-            {
-                "name": a.name,
-                "type": a.type,
-                "description": a.description,
-                "default": a.default,
-                "required": a.required,
-            }
-            for a in docstring.attributes
-        ],
-        "notes": docstring.notes,
-    }
-
-    # API sections
-    if docstring.doc_type == DocType.API or docstring.http_method or docstring.path:
-        result["http_method"] = docstring.http_method
-        result["path"] = docstring.path
-        result["path_params"] = [
-            {
-                "name": a.name,
-                "type": a.type,
-                "description": a.description,
-                "default": a.default,
-                "required": a.required,
-            }
-            for a in docstring.path_params
-        ]
-        result["query_params"] = [
-            {
-                "name": a.name,
-                "type": a.type,
-                "description": a.description,
-                "default": a.default,
-                "required": a.required,
-            }
-            for a in docstring.query_params
-        ]
-        result["request_body"] = [
-            {
-                "name": a.name,
-                "type": a.type,
-                "description": a.description,
-                "default": a.default,
-                "required": a.required,
-            }
-            for a in docstring.request_body
-        ]
-        result["responses"] = [
-            {
-                "status_code": r.status_code,
-                "description": r.description,
-                "fields": [
-                    {"name": f.name, "type": f.type, "description": f.description}
-                    for f in r.fields
-                ],
-            }
-            for r in docstring.responses
-        ]
-        result["headers"] = [
-            {
-                "name": h.name,
-                "description": h.description,
-                "required": h.required,
-                "example": h.example,
-            }
-            for h in docstring.headers
-        ]
-
-    # Event sections
-    if docstring.doc_type == DocType.EVENT or docstring.trigger or docstring.payload:
-        result["trigger"] = docstring.trigger
-        result["payload"] = [
-            {"name": f.name, "type": f.type, "description": f.description}
-            for f in docstring.payload
-        ]
-
-    # Config sections
-    if docstring.doc_type == DocType.CONFIG or docstring.config_fields:
-        result["config_fields"] = [
-            {
-                "name": f.name,
-                "type": f.type,
-                "description": f.description,
-                "default": f.default,
-                "required": f.required,
-                "env_var": f.env_var,
-            }
-            for f in docstring.config_fields
-        ]
-
-    # Custom sections
-    if docstring.custom_sections:
-        result["custom_sections"] = docstring.custom_sections
-
-    return result
-
-
-def _serialize_method(method: MethodDoc) -> dict[str, Any]:
-    return {
-        "name": method.name,
-        "module": method.module,
-        "signature": method.signature,
-        "docstring": _serialize_docstring(method.docstring),
-        "is_async": method.is_async,
-        "is_classmethod": method.is_classmethod,
-        "is_staticmethod": method.is_staticmethod,
-        "is_property": method.is_property,
-        "source": method.source,
-        "line_number": method.line_number,
-        "decorators": method.decorators,
-        "calls": method.calls,
-        "doc_type": method.doc_type.value,
-        "signature_hash": method.signature_hash,
-        "body_hash": method.body_hash,
-        "complexity": method.complexity,
-        "is_deprecated": method.is_deprecated,
-        "deprecation_message": method.deprecation_message,
-        "deprecation_since": method.deprecation_since,
-        "category": method.category,
-        "version": method.version,
-        "hidden": method.hidden,
-    }
-
-
-def _serialize_function(func: FunctionDoc) -> dict[str, Any]:
-    return {
-        "name": func.name,
-        "module": func.module,
-        "full_path": func.full_path,
-        "signature": func.signature,
-        "docstring": _serialize_docstring(func.docstring),
-        "is_async": func.is_async,
-        "source": func.source,
-        "line_number": func.line_number,
-        "decorators": func.decorators,
-        "calls": func.calls,
-        "doc_type": func.doc_type.value,
-        "signature_hash": func.signature_hash,
-        "body_hash": func.body_hash,
-        "complexity": func.complexity,
-        "is_deprecated": func.is_deprecated,
-        "deprecation_message": func.deprecation_message,
-        "deprecation_since": func.deprecation_since,
-        "category": func.category,
-        "version": func.version,
-        "hidden": func.hidden,
-    }
-
-
-def _serialize_class(cls: ClassDoc) -> dict[str, Any]:
-    return {
-        "name": cls.name,
-        "module": cls.module,
-        "full_path": cls.full_path,
-        "docstring": _serialize_docstring(cls.docstring),
-        "bases": cls.bases,
-        "methods": [_serialize_method(m) for m in cls.methods],
-        "source": cls.source,
-        "line_number": cls.line_number,
-        "decorators": cls.decorators,
-        "doc_type": cls.doc_type.value,
-        "signature_hash": cls.signature_hash,
-        "body_hash": cls.body_hash,
-    }
-
-
-def _serialize_module(module: ModuleDoc) -> dict[str, Any]:
-    return {
-        "name": module.name,
-        "full_path": module.full_path,
-        "file_path": module.file_path,
-        "docstring": module.docstring,
-        "classes": [_serialize_class(c) for c in module.classes],
-        "functions": [_serialize_function(f) for f in module.functions],
-        "todos": [
-            {
-                "tag": t.tag,
-                "text": t.text,
-                "file_path": t.file_path,
-                "line_number": t.line_number,
-                "module": t.module,
-            }
-            for t in module.todos
-        ],
-    }
+from typing import Any, Iterable, Mapping
 
+from .types import ModuleDoc, PageDoc, ParamKind
+from .callgraph import CallGraph, build_call_graph
+from .encoder import DocEncoder, DocView, to_dict
+from .similarity import find_duplicates
+from .store import STORE_FILE, write_store
 
-def _serialize_page(page: PageDoc) -> dict[str, Any]:
-    return {
-        "title": page.title,
-        "slug": page.slug,
-        "content": page.content,
-        "file_path": page.file_path,
-        "order": page.order,
-    }
+# Documentation context for the chat assistant, read by the app on first use
+CHAT_CONTEXT_FILE = "chat_context.txt"
 
 
 def _compute_changes(
@@ -337,6 +111,10 @@ def _compute_changes(
     return changes
 
 
+# Parameter kinds that collect extra arguments (*args, **kwargs)
+_VARIADIC = {ParamKind.VAR_POSITIONAL.value, ParamKind.VAR_KEYWORD.value}
+
+
 def _detect_breaking_changes(
     old_data: dict[str, Any], new_data: dict[str, Any]
 ) -> list[dict[str, Any]]:
@@ -347,8 +125,12 @@ def _detect_breaking_changes(
         - arg_renamed: An argument name changed
         - type_changed: An argument's type annotation changed
         - required_arg_added: A new argument without a default was added
-        - optional_arg_added: A new argument with a default was added (non-breaking)
+        - optional_arg_added: A new argument with a default, or a new
+          ``*args``/``**kwargs``, was added (non-breaking)
         - return_type_changed: Return type annotation changed
+
+    ``*args`` and ``**kwargs`` are matched by kind, so renaming them is
+    not a change.
     """
     breaking: list[dict[str, Any]] = []
 
@@ -356,18 +138,11 @@ def _detect_breaking_changes(
         index: dict[str, dict[str, Any]] = {}
         for lst in ("functions", "api_endpoints"):
             for item in data.get(lst, []):
-                sig = item.get("signature", "")
-                sig_params = _parse_signature_params(sig)
-                # Extract return type from signature
-                ret_type = ""
-                arrow_pos = sig.rfind("->")
-                if arrow_pos != -1:
-                    ret_type = sig[arrow_pos + 2 :].strip()
                 index[item["full_path"]] = {
                     "name": item["name"],
                     "doc_type": item.get("doc_type", "function"),
-                    "params": {p["name"]: p for p in sig_params},
-                    "return_type": ret_type,
+                    "params": {p["name"]: p for p in _signature_params(item)},
+                    "return_type": _return_annotation(item),
                     "signature_hash": item.get("signature_hash", ""),
                 }
         return index
@@ -386,17 +161,18 @@ def _detect_breaking_changes(
 
         old_params = old["params"]
         new_params = new["params"]
+        old_variadic = {p["kind"] for p in old_params.values()} & _VARIADIC
+        new_variadic = {p["kind"] for p in new_params.values()} & _VARIADIC
 
         # Removed params
-        for name in old_params:
-            if name not in new_params:
+        for name, param in old_params.items():
+            if name not in new_params and param["kind"] not in new_variadic:
                 details.append({"type": "arg_removed", "arg": name, "breaking": True})
 
         # New params
-        for name in new_params:
-            if name not in old_params:
-                has_default = new_params[name].get("default") is not None
-                if has_default:
+        for name, param in new_params.items():
+            if name not in old_params and param["kind"] not in old_variadic:
+                if param["default"] or param["kind"] in _VARIADIC:
                     details.append(
                         {"type": "optional_arg_added", "arg": name, "breaking": False}
                     )
@@ -449,11 +225,44 @@ def _detect_breaking_changes(
     return breaking
 
 
+def _signature_params(item: Mapping[str, Any]) -> list[dict[str, str]]:
+    """Parameter names, kinds, types and defaults of a function record.
+
+    Uses the structured ``params`` captured at scan time, excluding
+    'self' and 'cls'; records from a data.json written before params were
+    recorded fall back to parsing the signature string.
+    """
+    params = item.get("params")
+    if params is None:
+        return _parse_signature_params(item.get("signature", ""))
+    return [
+        {
+            "name": p["name"],
+            "kind": ParamKind(p["kind"]).value,
+            "type": p["annotation"],
+            "default": p["default"] or "",
+        }
+        for p in params
+        if p["name"] not in ("self", "cls")
+    ]
+
+
+def _return_annotation(item: Mapping[str, Any]) -> str:
+    """Return annotation of a function record ("" if there is none)."""
+    if "return_annotation" in item:
+        return item["return_annotation"]
+    sig = item.get("signature", "")
+    arrow_pos = sig.rfind("->")
+    return sig[arrow_pos + 2 :].strip() if arrow_pos != -1 else ""
+
+
 def _parse_signature_params(signature: str) -> list[dict[str, str]]:
     """Extract parameter names, types, and defaults from a signature string.
 
     Parses "(self, x: int, y: str = 'hi', *args, **kwargs) -> bool"
-    into a list of param dicts, excluding 'self' and 'cls'.
+    into a list of param dicts, excluding 'self' and 'cls'. Only the
+    variadic kinds are told apart; other params are "positional". Only needed
+    for data.json files that predate structured ``params``.
     """
     params: list[dict[str, str]] = []
     if not signature:
@@ -475,12 +284,6 @@ def _parse_signature_params(signature: str) -> list[dict[str, str]]:
                     break
         inner = inner[1:end]
 
-    # Extract return type
-    rest = signature.strip()
-    arrow_pos = rest.rfind("->")
-    if arrow_pos != -1:
-        rest[arrow_pos + 2 :].strip()
-
     if not inner.strip():
         return params
 
@@ -507,14 +310,17 @@ def _parse_signature_params(signature: str) -> list[dict[str, str]]:
             continue
 
         name = part
+        kind = ParamKind.POSITIONAL
         ptype = ""
         default = None
 
         # Handle *args, **kwargs
         if part.startswith("**"):
             part = part[2:]
+            kind = ParamKind.VAR_KEYWORD
         elif part.startswith("*"):
             part = part[1:]
+            kind = ParamKind.VAR_POSITIONAL
 
         # Split on = for default
         eq_pos = part.find("=")
@@ -534,7 +340,9 @@ def _parse_signature_params(signature: str) -> list[dict[str, str]]:
         if name in ("self", "cls"):
             continue
 
-        params.append({"name": name, "type": ptype, "default": default or ""})
+        params.append(
+            {"name": name, "kind": kind.value, "type": ptype, "default": default or ""}
+        )
 
     return params
 
@@ -551,10 +359,7 @@ def _compute_coverage(json_data: dict[str, Any]) -> dict[str, Any]:
     for lst in ("functions", "api_endpoints"):
         for func in json_data.get(lst, []):
             ds = func.get("docstring", {})
-            sig = func.get("signature", "")
-
-            sig_params = _parse_signature_params(sig)
-            sig_param_names = {p["name"] for p in sig_params}
+            sig_param_names = {p["name"] for p in _signature_params(func)}
             doc_arg_names = {a["name"] for a in ds.get("args", [])}
 
             has_docstring = bool(ds.get("summary"))
@@ -571,7 +376,7 @@ def _compute_coverage(json_data: dict[str, Any]) -> dict[str, Any]:
                 missing_args = []
 
             # Has return type in signature?
-            has_return_annotation = "->" in sig
+            has_return_annotation = bool(_return_annotation(func))
 
             checks = {
                 "has_docstring": has_docstring,
@@ -655,113 +460,103 @@ def _compute_coverage(json_data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _build_reverse_call_map(json_data: dict[str, Any]) -> dict[str, list[str]]:
+def _build_reverse_call_map(graph: CallGraph) -> dict[str, list[str]]:
     """Invert the call graph: for each function, who calls it.
 
+    Resolved callees are keyed by their canonical full_path. Calls that
+    could not be resolved (external libraries, dynamic receivers) keep
+    their raw call string as the key.
+
     Returns a dict mapping function name -> list of callers.
     """
     called_by: dict[str, list[str]] = {}
+    nodes = graph.nodes
 
-    for lst in ("functions", "api_endpoints"):
-        for func in json_data.get(lst, []):
-            caller = func.get("full_path", func["name"])
-            for callee in func.get("calls", []):
-                called_by.setdefault(callee, []).append(caller)
+    for callee in range(len(graph)):
+        callers = graph.predecessors(callee)
+        if callers:
+            called_by[nodes[callee]] = [nodes[i] for i in callers]
 
-    for cls in json_data.get("classes", []):
-        for method in cls.get("methods", []):
-            caller = f"{cls.get('full_path', cls['name'])}.{method['name']}"
-            for callee in method.get("calls", []):
-                called_by.setdefault(callee, []).append(caller)
+    for raw, raw_callers in graph.unresolved.items():
+        called_by.setdefault(raw, []).extend(raw_callers)
 
     # Sort each list for determinism
-    return {k: sorted(v) for k, v in sorted(called_by.items())}
-
-
-def _detect_dead_code(json_data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Find functions/methods that are never called by anything internal.
+    return {k: sorted(set(v)) for k, v in sorted(called_by.items())}
+
+
+# Names that are invoked implicitly by Python or by convention
+_IMPLICIT_ENTRY_NAMES = {
+    "__init__",
+    "__main__",
+    "main",
+    "__str__",
+    "__repr__",
+    "__eq__",
+    "__hash__",
+    "__len__",
+    "__iter__",
+    "__next__",
+    "__enter__",
+    "__exit__",
+    "__call__",
+    "__getattr__",
+    "__setattr__",
+    "__delattr__",
+    "__getitem__",
+    "__setitem__",
+    "__contains__",
+    "__bool__",
+}
+
+
+def _detect_dead_code(
+    json_data: dict[str, Any], graph: CallGraph
+) -> list[dict[str, Any]]:
+    """Find public functions/methods unreachable from any entry point.
 
-    Excludes: __init__, __main__, decorated endpoints, test functions,
-    and anything starting with 'main'.
+    Entry points are everything that is not a dead-code candidate:
+    private and dunder functions, decorated functions (routes, CLI
+    commands, properties), tests, ``main``, calls made at module import
+    time, and methods whose name is called on a receiver of unknown type.
+    A single BFS from those roots marks everything that is still in use.
     """
-    called_by = json_data.get("called_by", {})
-    dead: list[dict[str, Any]] = []
-
-    # Build set of all callee names (both full_path and short name forms)
-    all_called: set[str] = set()
-    for callee in called_by:
-        all_called.add(callee)
-
-    # Exclusion patterns
-    skip_names = {
-        "__init__",
-        "__main__",
-        "main",
-        "__str__",
-        "__repr__",
-        "__eq__",
-        "__hash__",
-        "__len__",
-        "__iter__",
-        "__next__",
-        "__enter__",
-        "__exit__",
-        "__call__",
-        "__getattr__",
-        "__setattr__",
-        "__delattr__",
-        "__getitem__",
-        "__setitem__",
-        "__contains__",
-        "__bool__",
-    }
+    candidates: dict[int, dict[str, Any]] = {}
+
+    def _is_candidate(item: dict[str, Any]) -> bool:
+        name = item["name"]
+        if name.startswith("_") or name in _IMPLICIT_ENTRY_NAMES:
+            return False
+        return not item.get("decorators")
 
     for lst in ("functions", "api_endpoints"):
         for func in json_data.get(lst, []):
-            name = func["name"]
-            full_path = func.get("full_path", name)
-
-            # Skip private, dunder, decorated (likely entry points), tests
-            if name.startswith("_"):
-                continue
-            if name in skip_names:
-                continue
-            if func.get("decorators"):
-                continue
-            if name.startswith("test"):
+            if not _is_candidate(func) or func["name"].startswith("test"):
                 continue
-
-            # Check if anyone calls this
-            if full_path not in all_called and name not in all_called:
-                dead.append(
-                    {
-                        "full_path": full_path,
-                        "name": name,
-                        "doc_type": func.get("doc_type", "function"),
-                        "module": func.get("module", ""),
-                    }
-                )
+            full_path = func.get("full_path", func["name"])
+            candidates[graph.index[full_path]] = {
+                "full_path": full_path,
+                "name": func["name"],
+                "doc_type": func.get("doc_type", "function"),
+                "module": func.get("module", ""),
+            }
 
     for cls in json_data.get("classes", []):
         for method in cls.get("methods", []):
-            name = method["name"]
-            if name.startswith("_") or name in skip_names:
-                continue
-            if method.get("decorators"):
+            if not _is_candidate(method) or method["name"] in graph.dynamic_names:
                 continue
+            method_path = f"{cls.get('full_path', cls['name'])}.{method['name']}"
+            candidates[graph.index[method_path]] = {
+                "full_path": method_path,
+                "name": method["name"],
+                "doc_type": "method",
+                "module": cls.get("module", ""),
+            }
 
-            method_path = f"{cls.get('full_path', cls['name'])}.{name}"
-            if method_path not in all_called and name not in all_called:
-                dead.append(
-                    {
-                        "full_path": method_path,
-                        "name": name,
-                        "doc_type": "method",
-                        "module": cls.get("module", ""),
-                    }
-                )
+    roots = [i for i in range(len(graph)) if i not in candidates]
+    roots.extend(graph.entry_points)
+    live = graph.reachable(roots)
 
-    return dead
+    return [info for i, info in candidates.items() if not live[i]]
 
 
 def _collect_todos(json_data: dict[str, Any]) -> list[dict[str, Any]]:
@@ -772,18 +567,204 @@ def _collect_todos(json_data: dict[str, Any]) -> list[dict[str, Any]]:
     return todos
 
 
+# --- Precomputed views ---
+
+
+def _has_docstring(item: Mapping[str, Any]) -> bool:
+    """Check if an item has a meaningful docstring."""
+    ds = item.get("docstring")
+    if not ds:
+        return False
+    if isinstance(ds, str):
+        return bool(ds.strip())
+    return bool(ds.get("summary") or ds.get("description"))
+
+
+def _count(values: Iterable[str]) -> dict[str, int]:
+    """Occurrences of each value, sorted by value."""
+    counts: dict[str, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return dict(sorted(counts.items()))
+
+
+def _build_views(json_data: dict[str, Any], graph: CallGraph) -> dict[str, Any]:
+    """Precompute the lists and aggregates the generated app displays.
+
+    Documented modules, classes, functions, endpoints and methods are
+    given as indices into the corresponding lists of ``json_data`` so
+    nothing is stored twice; the app picks them out instead of filtering
+    and aggregating the whole documentation at import.
+    """
+
+    def _methods(cls: Mapping[str, Any], skip_hidden: bool) -> list[int]:
+        return [
+            i
+            for i, m in enumerate(cls.get("methods", []))
+            if (_has_docstring(m) or m["name"] == "__init__")
+            and not (skip_hidden and m.get("hidden"))
+        ]
+
+    def _visible(items: list[Any]) -> list[int]:
+        return [
+            i for i, f in enumerate(items) if _has_docstring(f) and not f.get("hidden")
+        ]
+
+    modules = []
+    for mi, mod in enumerate(json_data["modules"]):
+        mod_classes = mod.get("classes", [])
+        class_indices = [
+            ci for ci, c in enumerate(mod_classes) if _has_docstring(c)
+        ]
+        functions = [
+            fi for fi, f in enumerate(mod.get("functions", [])) if _has_docstring(f)
+        ]
+        if mod.get("docstring") or class_indices or functions:
+            modules.append(
+                {
+                    "index": mi,
+                    "classes": [
+                        [ci, _methods(mod_classes[ci], False)] for ci in class_indices
+                    ],
+                    "functions": functions,
+                }
+            )
+
+    class_views: list[dict[str, Any]] = [
+        {"index": i, "methods": _methods(cls, True)}
+        for i, cls in enumerate(json_data["classes"])
+        if _has_docstring(cls)
+    ]
+    function_views = _visible(json_data["functions"])
+    endpoint_views = _visible(json_data["api_endpoints"])
+
+    classes = [json_data["classes"][v["index"]] for v in class_views]
+    endpoints = [json_data["api_endpoints"][i] for i in endpoint_views]
+
+    # Documented functions, endpoints and methods with their full paths
+    callables = [
+        (f["full_path"], f)
+        for f in [json_data["functions"][i] for i in function_views] + endpoints
+    ]
+    for view, cls in zip(class_views, classes):
+        methods = cls.get("methods", [])
+        for i in view["methods"]:
+            callables.append((f'{cls["full_path"]}.{methods[i]["name"]}', methods[i]))
+
+    # Call map: resolved calls, and unresolved ones attributed to the caller
+    called_by = json_data["called_by"]
+    caller_sets: dict[str, set[str]] = {}
+    call_entries = []
+    for caller, item in callables:
+        internal = item.get("resolved_calls", [])
+        external = []
+        for call in item.get("calls", []):
+            callers = caller_sets.get(call)
+            if callers is None:
+                callers = caller_sets[call] = set(called_by.get(call, ()))
+            if caller in callers:
+                external.append(call)
+        if internal or external:
+            call_entries.append(
+                {"caller": caller, "internal": list(internal), "external": external}
+            )
+
+    endpoint_reach = []
+    for ep in endpoints:
+        if ep["full_path"] in graph.index:
+            reached = graph.callees(ep["full_path"], depth=None)
+            endpoint_reach.append(
+                {"endpoint": ep["full_path"], "reaches": len(reached), "sample": reached[:10]}
+            )
+
+    # Endpoints grouped by first path segment, classes by module
+    endpoint_groups: dict[str, list[int]] = {}
+    for pos, ep in enumerate(endpoints):
+        path = ep.get("docstring", {}).get("path", "").strip("/")
+        prefix = "/" + path.split("/")[0] if path else "/"
+        endpoint_groups.setdefault(prefix, []).append(pos)
+    class_groups: dict[str, list[int]] = {}
+    for pos, cls in enumerate(classes):
+        class_groups.setdefault(cls.get("module", ""), []).append(pos)
+
+    hotspots: list[dict[str, Any]] = sorted(
+        (
+            {"full_path": path, "complexity": item.get("complexity", 1)}
+            for path, item in callables
+            if item.get("complexity", 1) >= 6
+        ),
+        key=lambda h: h["complexity"],
+        reverse=True,
+    )[:15]
+    low_coverage = sorted(
+        (i for i in json_data["coverage"].get("items", []) if i["score"] < 100),
+        key=lambda i: i["score"],
+    )[:20]
+
+    return {
+        "modules": modules,
+        "classes": class_views,
+        "functions": function_views,
+        "api_endpoints": endpoint_views,
+        "class_groups": class_groups,
+        "endpoint_groups": endpoint_groups,
+        "api_method_counts": _count(
+            ep.get("docstring", {}).get("http_method", "GET") for ep in endpoints
+        ),
+        "call_entries": call_entries,
+        "endpoint_reach": endpoint_reach,
+        "todo_counts": _count(t["tag"] for t in json_data["todos"]),
+        "deprecated": [
+            {
+                "full_path": path,
+                "doc_type": item.get("doc_type", "function"),
+                "deprecation_since": item.get("deprecation_since", ""),
+                "deprecation_message": item.get("deprecation_message", ""),
+            }
+            for path, item in callables
+            if item.get("is_deprecated")
+        ],
+        "complexity_hotspots": hotspots,
+        "low_coverage": [
+            {
+                "name": i["name"],
+                "doc_type": i["doc_type"],
+                "score": i["score"],
+                "args_missing": i.get("checks", {}).get("args_missing", []),
+            }
+            for i in low_coverage
+        ],
+    }
+
+
 def build_json(
-    modules: list[ModuleDoc], pages: list[PageDoc], config: dict[str, Any]
+    modules: list[ModuleDoc],
+    pages: list[PageDoc],
+    config: dict[str, Any],
+    lazy: bool = False,
 ) -> dict[str, Any]:
-    """Build JSON documentation structure."""
+    """Build JSON documentation structure.
+
+    Args:
+        modules: Scanned modules.
+        pages: Scanned Markdown pages.
+        config: Build configuration.
+        lazy: Represent modules, classes, functions and pages as
+            ``DocView`` mappings over the scanned records instead of
+            plain dicts. Write the result with ``encoder.dump``.
+    """
+    # Resolve calls first so serialized items carry resolved_calls
+    graph = build_call_graph(modules)
+    record = DocView if lazy else to_dict
+
     all_classes = []
     all_functions = []
 
     for module in modules:
         for cls in module.classes:
-            all_classes.append(_serialize_class(cls))
+            all_classes.append(record(cls))
         for func in module.functions:
-            all_functions.append(_serialize_function(func))
+            all_functions.append(record(func))
 
     # Separate API endpoints from regular functions
     api_endpoints = [f for f in all_functions if f["doc_type"] == "api"]
@@ -803,11 +784,11 @@ def build_json(
         )
 
     json_data = {
-        "modules": [_serialize_module(m) for m in modules],
+        "modules": [record(m) for m in modules],
         "classes": all_classes,
         "functions": regular_functions,
         "api_endpoints": api_endpoints,
-        "pages": [_serialize_page(p) for p in pages],
+        "pages": [record(p) for p in pages],
         "config": config,
     }
 
@@ -815,13 +796,22 @@ def build_json(
     json_data["coverage"] = _compute_coverage(json_data)
 
     # Reverse call map
-    json_data["called_by"] = _build_reverse_call_map(json_data)
+    json_data["called_by"] = _build_reverse_call_map(graph)
 
     # Flat TODO list
     json_data["todos"] = _collect_todos(json_data)
 
     # Dead code detection
-    json_data["dead_code"] = _detect_dead_code(json_data)
+    json_data["dead_code"] = _detect_dead_code(json_data, graph)
+
+    # Call graph with precomputed reachability index
+    json_data["call_graph"] = graph.to_dict()
+
+    # Duplicate / near-duplicate function bodies
+    json_data["duplicates"] = find_duplicates(modules)
+
+    # What the generated app displays, filtered and aggregated once
+    json_data["views"] = _build_views(json_data, graph)
 
     return json_data
 
@@ -1012,6 +1002,14 @@ def _is_light_color(hex_color: str) -> bool:
         return False
 
 
+def _chat_context(chunks: list[dict[str, str]]) -> str:
+    """Documentation reference appended to the chat system prompt."""
+    if not chunks:
+        return ""
+    texts = [ch["text"] for ch in chunks[:50]]  # top 50 chunks
+    return "\n\nDocumentation reference:\n" + "\n---\n".join(texts)
+
+
 def _generate_app_code(json_data: dict[str, Any]) -> str:
     """Generate the Cacao app Python code for the documentation."""
     from . import __version__ as self_version
@@ -1058,17 +1056,37 @@ def _generate_app_code(json_data: dict[str, Any]) -> str:
         _provider = _parts[0] if len(_parts) > 1 else "openai"
         _model = _parts[1] if len(_parts) > 1 else _parts[0]
 
-        # Build RAG context summary from chunked docs (embedded in system prompt)
-        _rag_chunks = _chunk_documentation(json_data)
-        _rag_context = ""
-        if _rag_chunks:
-            _rag_texts = [ch["text"] for ch in _rag_chunks[:50]]  # top 50 chunks
-            _rag_context = "\n\nDocumentation reference:\n" + "\n---\n".join(_rag_texts)
+        # The documentation context appended to the system prompt lives in
+        # CHAT_CONTEXT_FILE (see build_docs), so this code does not change
+        # when docstrings do
+        _chat_state_block = f"""# --- Chat ---
+_show_chat = c.signal(False, name="show_chat")
+_chat_messages = c.signal([], name="docs_chat")
 
-        _full_system_prompt = chat_system_prompt + _rag_context
+from cacao.server.llm import ChatConfig as _ChatConfig, register_chat as _register_chat
 
-        _chat_state_block = """# --- Chat ---
-_show_chat = c.signal(False, name="show_chat")"""
+_CHAT_CONTEXT_PATH = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), {CHAT_CONTEXT_FILE!r})
+_CHAT_CONTEXT = None
+
+
+class _DocsChatConfig(_ChatConfig):
+    \"\"\"Chat config that appends the documentation context on first use.\"\"\"
+
+    @property
+    def system_prompt(self):
+        global _CHAT_CONTEXT
+        if _CHAT_CONTEXT is None:
+            try:
+                with open(_CHAT_CONTEXT_PATH, "r", encoding="utf-8") as _cf:
+                    _CHAT_CONTEXT = _cf.read()
+            except OSError:
+                _CHAT_CONTEXT = ""
+        return self._base_prompt + _CHAT_CONTEXT
+
+    @system_prompt.setter
+    def system_prompt(self, value):
+        self._base_prompt = value or ""
+"""
 
         _chat_nav_item = ""
 
@@ -1076,13 +1094,18 @@ _show_chat = c.signal(False, name="show_chat")"""
         # --- Chat (Floating Bubble + Modal) ---
         with c.modal(title="Ask about {title}", signal=_show_chat, size="lg"):
             c.chat(
+                signal=_chat_messages,
                 provider={_provider!r},
                 model={_model!r},
-                system_prompt={_full_system_prompt!r},
                 height="450px",
                 show_clear=True,
                 placeholder="Ask about functions, classes, usage...",
             )
+            _register_chat(_chat_messages.name, _DocsChatConfig(
+                provider={_provider!r},
+                model={_model!r},
+                system_prompt={chat_system_prompt!r},
+            ))
         c.html(\'\'\'<style>
 .cacaodocs-fab {{
     position: fixed;
@@ -1153,54 +1176,57 @@ _show_chat = c.signal(False, name="show_chat")"""
     else:
         _effective_theme = theme
 
+    if config.get("sqlite"):
+        # Entries are fetched from docs.sqlite as the app picks them
+        _data_block = f"""from cacaodocs.store import StoreData
+
+_DATA_PATH = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), {STORE_FILE!r})
+_DATA = StoreData(_DATA_PATH)"""
+    else:
+        _data_block = """_DATA_PATH = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "data.json")
+with open(_DATA_PATH, "r", encoding="utf-8") as _f:
+    _DATA = json.load(_f)"""
+
     code = f'''"""Auto-generated documentation app powered by CacaoDocs + Cacao."""
 import json
 import os as _os
 import cacao as c
 
 # --- Documentation Data ---
-_DATA_PATH = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "data.json")
-with open(_DATA_PATH, "r", encoding="utf-8") as _f:
-    _DATA = json.load(_f)
+{_data_block}
 
 _PAGES = _DATA["pages"]
 _CONFIG = _DATA["config"]
 
+# Filtered lists and aggregates, precomputed by the builder
+_VIEWS = _DATA["views"]
 
-def _has_docstring(item):
-    """Check if an item has a meaningful docstring."""
-    ds = item.get("docstring")
-    if not ds:
-        return False
-    if isinstance(ds, dict):
-        return bool(ds.get("summary") or ds.get("description"))
-    if isinstance(ds, str):
-        return bool(ds.strip())
-    return False
 
+def _pick(items, indices):
+    """Select items by position."""
+    return [items[i] for i in indices]
 
-# Filter: only items with actual docstrings
+
+# Only items with actual docstrings
 _ALL_MODULES = _DATA["modules"]
-_CONTENT_MODULES = [m for m in _ALL_MODULES
-                    if m.get("docstring")
-                    or any(_has_docstring(c) for c in m.get("classes", []))
-                    or any(_has_docstring(f) for f in m.get("functions", []))]
-
-_CLASSES = [c for c in _DATA["classes"] if _has_docstring(c)]
-_FUNCTIONS = [f for f in _DATA["functions"] if _has_docstring(f) and not f.get("hidden")]
-_API_ENDPOINTS = [e for e in _DATA.get("api_endpoints", []) if _has_docstring(e) and not e.get("hidden")]
-
-# Filter methods within classes
-for cls in _CLASSES:
-    cls["methods"] = [m for m in cls.get("methods", [])
-                      if (_has_docstring(m) or m["name"] == "__init__") and not m.get("hidden")]
-
-for mod in _CONTENT_MODULES:
-    mod["classes"] = [c for c in mod.get("classes", []) if _has_docstring(c)]
-    mod["functions"] = [f for f in mod.get("functions", []) if _has_docstring(f)]
-    for cls in mod["classes"]:
-        cls["methods"] = [m for m in cls.get("methods", [])
-                          if _has_docstring(m) or m["name"] == "__init__"]
+_CONTENT_MODULES = _pick(_ALL_MODULES, [v["index"] for v in _VIEWS["modules"]])
+
+_CLASSES = _pick(_DATA["classes"], [v["index"] for v in _VIEWS["classes"]])
+_FUNCTIONS = _pick(_DATA["functions"], _VIEWS["functions"])
+_API_ENDPOINTS = _pick(_DATA.get("api_endpoints", []), _VIEWS["api_endpoints"])
+
+# Documented methods within classes
+for cls, _cv in zip(_CLASSES, _VIEWS["classes"]):
+    cls["methods"] = _pick(cls.get("methods", []), _cv["methods"])
+
+for mod, _mv in zip(_CONTENT_MODULES, _VIEWS["modules"]):
+    _mod_classes = mod.get("classes", [])
+    mod["classes"] = []
+    for _ci, _keep in _mv["classes"]:
+        cls = _mod_classes[_ci]
+        cls["methods"] = _pick(cls.get("methods", []), _keep)
+        mod["classes"].append(cls)
+    mod["functions"] = _pick(mod.get("functions", []), _mv["functions"])
 
 # --- App Config ---
 c.config(
@@ -1501,7 +1527,7 @@ def _render_function_block(func):
     # Used by (reverse call map)
     _called_by = _DATA.get("called_by", {{}})
     full_path = func.get("full_path", name)
-    callers = _called_by.get(full_path, []) or _called_by.get(name, [])
+    callers = _called_by.get(full_path, [])
     if callers:
         c.spacer(2)
         c.title("Used By", level=4)
@@ -1598,10 +1624,17 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
             if _changes_list:
                 c.nav_item("Changelog", key="changelog_panel", icon="clock",
                             badge=str(len(_changes_list)))
+            elif _DATA.get("changelog"):
+                c.nav_item("Changelog", key="changelog_panel", icon="clock")
             _dead_list = _DATA.get("dead_code", [])
             if _dead_list:
                 c.nav_item("Dead Code", key="dead_code_panel", icon="trash",
                             badge=str(len(_dead_list)))
+            _dup_data = _DATA.get("duplicates", {{}})
+            _dup_count = len(_dup_data.get("exact", [])) + len(_dup_data.get("near", []))
+            if _dup_count:
+                c.nav_item("Duplicates", key="duplicates_panel", icon="copy",
+                            badge=str(_dup_count))
 
         if _PAGES:
             with c.nav_group("Pages", icon="book"):
@@ -1703,17 +1736,11 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
                     with _tl.side():
                         c.title("Types", level=3)
                         c.spacer(2)
-                        # Group classes by module
-                        _cls_by_mod = {{}}
-                        for cls in _CLASSES:
-                            mod = cls.get("module", "")
-                            _cls_by_mod.setdefault(mod, []).append(cls)
-
                         with c.subnav(searchable=True):
-                            for mod, classes in _cls_by_mod.items():
+                            for mod, _positions in _VIEWS["class_groups"].items():
                                 if mod:
                                     c.subnav_group(mod)
-                                for cls in classes:
+                                for cls in _pick(_CLASSES, _positions):
                                     method_count = len(cls.get("methods", []))
                                     c.subnav_item(
                                         cls["name"],
@@ -1739,19 +1766,12 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
                     with _al.side():
                         c.title("Endpoints", level=3)
                         c.spacer(2)
-                        # Group by path prefix (first path segment)
-                        _ep_groups = {{}}
-                        for ep in _API_ENDPOINTS:
-                            ds = ep.get("docstring", {{}})
-                            path = ds.get("path", "")
-                            prefix = "/" + path.strip("/").split("/")[0] if path.strip("/") else "/"
-                            _ep_groups.setdefault(prefix, []).append(ep)
-
+                        # Grouped by path prefix (first path segment)
                         _TAG_COLORS = {{"GET": "success", "POST": "info", "PUT": "warning", "PATCH": "warning", "DELETE": "danger"}}
                         with c.subnav(searchable=True):
-                            for prefix, eps in _ep_groups.items():
+                            for prefix, _positions in _VIEWS["endpoint_groups"].items():
                                 c.subnav_group(prefix)
-                                for ep in eps:
+                                for ep in _pick(_API_ENDPOINTS, _positions):
                                     ds = ep.get("docstring", {{}})
                                     method = ds.get("http_method", "GET")
                                     path = ds.get("path", ep["name"])
@@ -1768,12 +1788,8 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
                         c.spacer(3)
 
                         # Summary table
-                        _method_counts = {{}}
-                        for ep in _API_ENDPOINTS:
-                            m = ep.get("docstring", {{}}).get("http_method", "GET")
-                            _method_counts[m] = _method_counts.get(m, 0) + 1
                         with c.row(gap=3, wrap=True):
-                            for m, count in sorted(_method_counts.items()):
+                            for m, count in _VIEWS["api_method_counts"].items():
                                 c.metric(m, count)
                         c.spacer(4)
 
@@ -1810,47 +1826,21 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
             c.text("Function and method call relationships across the codebase.", color="muted")
             c.spacer(3)
 
-            _all_known = set()
-            _call_entries = []
-
-            for func in _FUNCTIONS:
-                _all_known.add(func["full_path"])
-                _all_known.add(func["name"])
-            for ep in _API_ENDPOINTS:
-                _all_known.add(ep["full_path"])
-                _all_known.add(ep["name"])
-            for cls in _CLASSES:
-                _all_known.add(cls["full_path"])
-                for m in cls.get("methods", []):
-                    _all_known.add(f'{{cls["full_path"]}}.{{m["name"]}}')
-                    _all_known.add(m["name"])
-
-            all_funcs = _FUNCTIONS + _API_ENDPOINTS
-            for func in all_funcs:
-                calls = func.get("calls", [])
-                if calls:
-                    internal = [c for c in calls if c in _all_known or c.split(".")[-1] in _all_known]
-                    external = [c for c in calls if c not in internal]
-                    if internal or external:
-                        _call_entries.append({{
-                            "caller": func["full_path"],
-                            "internal": internal,
-                            "external": external,
-                        }})
+            _call_entries = _VIEWS["call_entries"]
 
-            for cls in _CLASSES:
-                for m in cls.get("methods", []):
-                    calls = m.get("calls", [])
-                    if calls:
-                        caller = f'{{cls["full_path"]}}.{{m["name"]}}'
-                        internal = [c for c in calls if c in _all_known or c.split(".")[-1] in _all_known]
-                        external = [c for c in calls if c not in internal]
-                        if internal or external:
-                            _call_entries.append({{
-                                "caller": caller,
-                                "internal": internal,
-                                "external": external,
-                            }})
+            if _API_ENDPOINTS:
+                c.title("Endpoint Reach", level=3)
+                c.text("Everything each endpoint transitively calls.", color="muted")
+                c.spacer(2)
+                _reach_table = []
+                for _r in _VIEWS["endpoint_reach"]:
+                    _reach_table.append({{
+                        "Endpoint": _r["endpoint"],
+                        "Reaches": _r["reaches"],
+                        "Functions": ", ".join(_r["sample"]) + (" ..." if _r["reaches"] > 10 else ""),
+                    }})
+                c.table(_reach_table, searchable=True, page_size=20)
+                c.spacer(4)
 
             if _call_entries:
                 table_data = []
@@ -1902,16 +1892,12 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
             c.spacer(4)
             c.title("TODOs & Debt", level=3)
             c.spacer(2)
-            _all_todos = _DATA.get("todos", [])
+            _todo_counts = _VIEWS["todo_counts"]
             _all_dead = _DATA.get("dead_code", [])
-            _all_deprecated_items = _FUNCTIONS + _API_ENDPOINTS
-            for _dcls in _CLASSES:
-                for _dm in _dcls.get("methods", []):
-                    _all_deprecated_items.append({{**_dm, "full_path": f'{{_dcls["full_path"]}}.{{_dm["name"]}}'}})
-            _all_deprecated = [f for f in _all_deprecated_items if f.get("is_deprecated")]
+            _all_deprecated = _VIEWS["deprecated"]
             with c.row(wrap=True, gap=4):
-                c.metric("TODOs", len([t for t in _all_todos if t.get("tag") == "TODO"]))
-                c.metric("FIXMEs", len([t for t in _all_todos if t.get("tag") == "FIXME"]))
+                c.metric("TODOs", _todo_counts.get("TODO", 0))
+                c.metric("FIXMEs", _todo_counts.get("FIXME", 0))
                 c.metric("Deprecated", len(_all_deprecated))
                 c.metric("Dead Code", len(_all_dead))
 
@@ -1923,7 +1909,7 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
                 _dep_table = []
                 for f in _all_deprecated:
                     _dep_table.append({{
-                        "Name": f.get("full_path", f["name"]),
+                        "Name": f["full_path"],
                         "Since": f.get("deprecation_since", ""),
                         "Message": f.get("deprecation_message", ""),
                         "Type": f.get("doc_type", "function"),
@@ -1936,11 +1922,8 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
                 c.spacer(4)
                 c.title("Recent Changes", level=3)
                 c.spacer(2)
-                _ch_summary = {{}}
-                for ch in _changes_summary:
-                    _ch_summary[ch["change"]] = _ch_summary.get(ch["change"], 0) + 1
                 with c.row(wrap=True, gap=4):
-                    for chtype, cnt in sorted(_ch_summary.items()):
+                    for chtype, cnt in _VIEWS.get("change_counts", {{}}).items():
                         c.metric(chtype.replace("+", " + ").title(), cnt)
                 c.spacer(2)
                 _ch_summary_table = []
@@ -1961,18 +1944,13 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
             c.spacer(4)
             c.title("Complexity Hotspots", level=3)
             c.spacer(2)
-            _all_items = _FUNCTIONS + _API_ENDPOINTS
-            for cls in _CLASSES:
-                for m in cls.get("methods", []):
-                    _all_items.append({{**m, "full_path": f'{{cls["full_path"]}}.{{m["name"]}}'}})
-            _complex = sorted([f for f in _all_items if f.get("complexity", 1) >= 6],
-                              key=lambda x: x.get("complexity", 1), reverse=True)[:15]
+            _complex = _VIEWS["complexity_hotspots"]
             if _complex:
                 _cx_table = []
                 for f in _complex:
-                    cx = f.get("complexity", 1)
+                    cx = f["complexity"]
                     _cx_table.append({{
-                        "Function": f.get("full_path", f["name"]),
+                        "Function": f["full_path"],
                         "Complexity": cx,
                         "Level": "High" if cx >= 15 else ("Medium" if cx >= 8 else "Low"),
                     }})
@@ -1984,15 +1962,12 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
             c.spacer(4)
             c.title("Coverage Details", level=3)
             c.spacer(2)
-            _cov_items = _cov.get("items", [])
-            if _cov_items:
-                _low_cov = sorted([i for i in _cov_items if i["score"] < 100],
-                                  key=lambda x: x["score"])[:20]
+            if _cov.get("items"):
+                _low_cov = _VIEWS["low_coverage"]
                 if _low_cov:
                     _cov_table = []
                     for i in _low_cov:
-                        checks = i.get("checks", {{}})
-                        missing = checks.get("args_missing", [])
+                        missing = i["args_missing"]
                         _cov_table.append({{
                             "Name": i["name"],
                             "Type": i["doc_type"],
@@ -2011,11 +1986,8 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
                 c.text("TODO, FIXME, HACK, and XXX comments found in source code.", color="muted")
                 c.spacer(4)
 
-                _tag_counts = {{}}
-                for t in _todo_list_panel:
-                    _tag_counts[t["tag"]] = _tag_counts.get(t["tag"], 0) + 1
                 with c.row(wrap=True, gap=4):
-                    for tag, cnt in sorted(_tag_counts.items()):
+                    for tag, cnt in _VIEWS["todo_counts"].items():
                         _tc = "danger" if tag == "FIXME" else ("warning" if tag in ("HACK", "XXX") else "info")
                         c.metric(tag, cnt)
 
@@ -2032,60 +2004,70 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
 
         # --- Changelog Panel ---
         _changes_panel = _DATA.get("changes", [])
-        if _changes_panel:
+        _history_panel = _DATA.get("changelog", [])
+        if _changes_panel or _history_panel:
             with c.nav_panel("changelog_panel"):
                 c.title("Recent Changes", level=2)
                 c.text("Functions and endpoints that changed since the last build.", color="muted")
                 c.spacer(4)
 
-                _ch_counts = {{}}
-                for ch in _changes_panel:
-                    _ch_counts[ch["change"]] = _ch_counts.get(ch["change"], 0) + 1
-                with c.row(wrap=True, gap=4):
-                    for chtype, cnt in sorted(_ch_counts.items()):
-                        c.metric(chtype.replace("+", " + ").title(), cnt)
+                if _changes_panel:
+                    with c.row(wrap=True, gap=4):
+                        for chtype, cnt in _VIEWS.get("change_counts", {{}}).items():
+                            c.metric(chtype.replace("+", " + ").title(), cnt)
 
-                c.spacer(3)
-                _breaking = _DATA.get("breaking_changes", [])
-                if _breaking:
-                    c.title("Breaking Changes", level=3)
-                    c.spacer(2)
-                    for b in _breaking:
-                        with c.card(b["full_path"]):
-                            for d in b.get("details", []):
-                                _icon = "!!" if d.get("breaking") else ""
-                                if d["type"] == "arg_removed":
-                                    c.text(f'{{_icon}} Argument removed: {{d["arg"]}}', color="danger")
-                                elif d["type"] == "required_arg_added":
-                                    c.text(f'{{_icon}} Required argument added: {{d["arg"]}}', color="danger")
-                                elif d["type"] == "type_changed":
-                                    c.text(f'{{_icon}} Type changed: {{d["arg"]}} ({{d["from"]}} -> {{d["to"]}})', color="warning")
-                                elif d["type"] == "return_type_changed":
-                                    c.text(f'{{_icon}} Return type changed: {{d["from"]}} -> {{d["to"]}}', color="warning")
-                                elif d["type"] == "optional_arg_added":
-                                    c.text(f'Optional argument added: {{d["arg"]}}', color="success")
                     c.spacer(3)
+                    _breaking = _DATA.get("breaking_changes", [])
+                    if _breaking:
+                        c.title("Breaking Changes", level=3)
+                        c.spacer(2)
+                        for b in _breaking:
+                            with c.card(b["full_path"]):
+                                for d in b.get("details", []):
+                                    _icon = "!!" if d.get("breaking") else ""
+                                    if d["type"] == "arg_removed":
+                                        c.text(f'{{_icon}} Argument removed: {{d["arg"]}}', color="danger")
+                                    elif d["type"] == "required_arg_added":
+                                        c.text(f'{{_icon}} Required argument added: {{d["arg"]}}', color="danger")
+                                    elif d["type"] == "type_changed":
+                                        c.text(f'{{_icon}} Type changed: {{d["arg"]}} ({{d["from"]}} -> {{d["to"]}})', color="warning")
+                                    elif d["type"] == "return_type_changed":
+                                        c.text(f'{{_icon}} Return type changed: {{d["from"]}} -> {{d["to"]}}', color="warning")
+                                    elif d["type"] == "optional_arg_added":
+                                        c.text(f'Optional argument added: {{d["arg"]}}', color="success")
+                        c.spacer(3)
 
-                c.title("All Changes", level=3)
-                c.spacer(2)
-                _ch_table = []
-                for ch in _changes_panel:
-                    _ch_color = {{"new": "success", "removed": "danger", "signature": "warning",
-                                 "body": "info", "signature+body": "danger"}}
-                    _ch_table.append({{
-                        "Name": ch["name"],
-                        "Type": ch["doc_type"],
-                        "Change": ch["change"],
-                        "Path": ch["full_path"],
-                    }})
-                c.table(_ch_table, searchable=True, page_size=25)
+                    c.title("All Changes", level=3)
+                    c.spacer(2)
+                    _ch_table = []
+                    for ch in _changes_panel:
+                        _ch_color = {{"new": "success", "removed": "danger", "signature": "warning",
+                                     "body": "info", "signature+body": "danger"}}
+                        _ch_table.append({{
+                            "Name": ch["name"],
+                            "Type": ch["doc_type"],
+                            "Change": ch["change"],
+                            "Path": ch["full_path"],
+                        }})
+                    c.table(_ch_table, searchable=True, page_size=25)
+
+                if _history_panel:
+                    c.spacer(3)
+                    c.title("Build History", level=3)
+                    c.spacer(2)
+                    c.table([{{
+                        "Build": h["build"],
+                        "Date": h["timestamp"][:19].replace("T", " "),
+                        "Changes": h["changes"],
+                        "Breaking": h["breaking_changes"],
+                    }} for h in _history_panel], page_size=25)
 
         # --- Dead Code Panel ---
         _dead_panel = _DATA.get("dead_code", [])
         if _dead_panel:
             with c.nav_panel("dead_code_panel"):
                 c.title("Dead Code", level=2)
-                c.text("Public functions and methods with no internal callers.", color="muted")
+                c.text("Public functions and methods not reachable from any entry point.", color="muted")
                 c.spacer(4)
 
                 c.metric("Potentially Unused", len(_dead_panel))
@@ -2101,9 +2083,59 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
                 c.table(_dc_table, searchable=True, page_size=25)
 
                 c.spacer(2)
-                c.text("Note: Entry points, decorated functions, and private methods are excluded. "
+                c.text("Note: Entry points, decorated functions, private methods, import-time calls "
+                       "and duck-typed method calls count as roots. "
                        "These may still be used externally.", size="sm", color="muted")
 
+        # --- Duplicates Panel ---
+        if _dup_count:
+            with c.nav_panel("duplicates_panel"):
+                c.title("Duplicates", level=2)
+                c.text("Functions and methods with identical or near-identical bodies.", color="muted")
+                c.spacer(4)
+
+                with c.row(wrap=True, gap=4):
+                    c.metric("Exact Groups", len(_dup_data.get("exact", [])))
+                    c.metric("Near-Duplicate Clusters", len(_dup_data.get("near", [])))
+                    c.metric("Functions Indexed", _dup_data.get("stats", {{}}).get("indexed", 0))
+                c.spacer(4)
+
+                if _dup_data.get("exact"):
+                    c.title("Exact Duplicates", level=3)
+                    c.spacer(2)
+                    _ex_table = []
+                    for i, grp in enumerate(_dup_data["exact"], 1):
+                        for m in grp["members"]:
+                            _ex_table.append({{
+                                "Group": i,
+                                "Function": m["full_path"],
+                                "Type": m["doc_type"],
+                                "Line": m["line_number"],
+                                "Statements": m["statements"],
+                            }})
+                    c.table(_ex_table, searchable=True, page_size=25)
+                    c.spacer(4)
+
+                if _dup_data.get("near"):
+                    c.title("Near Duplicates", level=3)
+                    c.spacer(2)
+                    _nr_table = []
+                    for i, cl in enumerate(_dup_data["near"], 1):
+                        for m in cl["members"]:
+                            _nr_table.append({{
+                                "Cluster": i,
+                                "Similarity": f'{{cl["similarity"]:.0%}}',
+                                "Function": m["full_path"],
+                                "Type": m["doc_type"],
+                                "Line": m["line_number"],
+                            }})
+                    c.table(_nr_table, searchable=True, page_size=25)
+
+                c.spacer(2)
+                c.text("Bodies shorter than "
+                       f'{{_dup_data.get("stats", {{}}).get("min_statements", 0)}} statements are ignored.',
+                       size="sm", color="muted")
+
         # --- Page Panels ---
         for page in _PAGES:
             with c.nav_panel(f"page_{{page['slug']}}"):
@@ -2117,24 +2149,65 @@ with c.app_shell(brand={title!r}, default=_default_key, theme_dark={_theme_dark_
     return code
 
 
+# --- Build outputs ---
+
+# Item counts recorded in the manifest, reported by no-op builds
+_COUNTED = ("modules", "classes", "functions", "api_endpoints", "pages")
+
+
+class _PreviousBuild(Mapping[str, Any]):
+    """The ``data.json`` of an up-to-date build, parsed on first access."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._data: dict[str, Any] | None = None
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
 def build_docs(
     source: str | Path,
     output: str | Path,
     config: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+    stats: dict[str, Any] | None = None,
+) -> Mapping[str, Any]:
     """Build documentation from source directory.
 
-    Scans Python/Markdown files and generates a Cacao app.
+    Scans Python/Markdown files and generates a Cacao app. Outputs whose
+    contents did not change are left untouched, and when the sources,
+    parser and config all match the previous build (see
+    ``BuildManifest``) nothing is rebuilt.
 
     Args:
         source: Source directory containing Python/Markdown files.
         output: Output directory for the generated Cacao app.
         config: Optional configuration dictionary.
+        stats: If given, filled with build statistics: item ``counts``,
+            the changed and unchanged ``outputs``, and for a full build the
+            scan statistics of ``scan_directory``.
 
     Returns:
-        The generated JSON documentation data.
+        The generated JSON documentation data. For a no-op build this is
+        the previous ``data.json``, parsed only when accessed.
     """
-    from .scanner import scan_directory
+    from .cache import ScanCache, cache_dir, content_id, remove_legacy_cache
+    from .changelog import ChangelogStore
+    from .highlight import HighlightCache
+    from .manifest import BuildManifest, input_digest
+    from .scanner import Scanner, scan_directory, scan_fingerprint, source_key
     from .config import load_config
     from .parser import DocstringParser
 
@@ -2143,18 +2216,76 @@ def build_docs(
 
     # Create parser with custom doc types
     custom_types = config.get("custom_doc_types", [])
-    parser = DocstringParser(custom_types=custom_types) if custom_types else None
+    parser = DocstringParser(custom_types=custom_types)
+
+    output_dir = Path(output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    remove_legacy_cache(output_dir)
+    data_path = output_dir / "data.json"
 
+    # Discover sources up front: if they, the parser and the config match
+    # the previous build, its outputs are still current
     exclude_patterns = config.get("exclude_patterns", [])
-    modules, pages = scan_directory(source, exclude_patterns, parser)
+    finder = Scanner(
+        exclude_patterns,
+        parser,
+        respect_gitignore=config.get("respect_gitignore", True),
+        discovery=config.get("discovery", "filesystem"),
+    )
+    base_path = Path(source)
+    sources = list(finder.iter_sources(base_path))
+    fingerprint = scan_fingerprint(source, parser)
+    inputs = input_digest(
+        fingerprint,
+        config,
+        ((source_key(f, base_path), content_id(f, blob)) for f, blob in sources),
+    )
+    manifest = BuildManifest.for_output(output_dir)
+    if stats is None:
+        stats = {}
+    if config.get("cache", True) and manifest.is_current(inputs):
+        stats.update(
+            discovery=finder.last_discovery,
+            files=len(sources),
+            counts=manifest.summary,
+            outputs={**manifest.stats, "up_to_date": True},
+        )
+        return _PreviousBuild(data_path)
+
+    # Scan cache: unchanged files are reused from the previous build
+    cache = None
+    highlighter = None
+    if config.get("cache", True):
+        directory = cache_dir(output_dir, config.get("cache_dir"))
+        cache = ScanCache.in_dir(directory, fingerprint)
+        highlighter = HighlightCache.in_dir(
+            directory, config.get("highlight_cache", 4096)
+        )
 
-    json_data = build_json(modules, pages, config)
+    modules, pages = scan_directory(
+        source,
+        exclude_patterns,
+        parser,
+        respect_gitignore=config.get("respect_gitignore", True),
+        discovery=config.get("discovery", "filesystem"),
+        cache=cache,
+        stats=stats,
+        read_ahead=config.get("read_ahead", 16),
+        render_workers=config.get("render_workers", 1),
+        highlighter=highlighter,
+        sources=sources,
+    )
+    stats["discovery"] = finder.last_discovery
+    if cache is not None:
+        cache.save()
+        stats["cache"] = cache.stats
+    if highlighter is not None:
+        highlighter.save()
+        stats["highlight"] = highlighter.stats
 
-    output_dir = Path(output)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    json_data = build_json(modules, pages, config, lazy=True)
 
     # Compare against previous build to detect changes + breaking changes
-    data_path = output_dir / "data.json"
     if data_path.exists():
         try:
             with open(data_path, "r", encoding="utf-8") as f:
@@ -2162,6 +2293,9 @@ def build_docs(
             changes = _compute_changes(old_data, json_data)
             if changes:
                 json_data["changes"] = changes
+                json_data["views"]["change_counts"] = _count(
+                    ch["change"] for ch in changes
+                )
             breaking = _detect_breaking_changes(old_data, json_data)
             if breaking:
                 json_data["breaking_changes"] = breaking
@@ -2169,33 +2303,35 @@ def build_docs(
             pass
 
     # Append to changelog
-    changelog_path = output_dir / "changelog.json"
+    changelog = ChangelogStore.for_output(output_dir)
     changes_list = json_data.get("changes", [])
     breaking_list = json_data.get("breaking_changes", [])
     if changes_list or breaking_list:
         from datetime import datetime, timezone
 
-        existing_changelog: list[dict[str, Any]] = []
-        if changelog_path.exists():
-            try:
-                with open(changelog_path, "r", encoding="utf-8") as f:
-                    existing_changelog = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                pass
-
         entry: dict[str, Any] = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "changes": changes_list,
         }
         if breaking_list:
             entry["breaking_changes"] = breaking_list
+        changelog.append(entry)
 
-        existing_changelog.append(entry)
-
-        with open(changelog_path, "w", encoding="utf-8") as f:
-            json.dump(existing_changelog, f, indent=2, ensure_ascii=False, default=str)
+    # Recent builds for the changelog panel (newest first)
+    history = changelog.tail(config.get("changelog_tail", 20))
+    if history:
+        json_data["changelog"] = [
+            {
+                "build": e["build"],
+                "timestamp": e.get("timestamp", ""),
+                "changes": len(e.get("changes", [])),
+                "breaking_changes": len(e.get("breaking_changes", [])),
+            }
+            for e in reversed(history)
+        ]
 
-    # Embedding step (if chat is enabled)
+    # Chat context and embedding step (if chat is enabled)
+    embedding_failed = False
     chat_enabled = config.get("chat", False)
     if chat_enabled:
         chat_config = config.get("chat_config", {})
@@ -2204,6 +2340,8 @@ def build_docs(
         )
 
         chunks = _chunk_documentation(json_data)
+        manifest.write_text(CHAT_CONTEXT_FILE, _chat_context(chunks))
+
         if chunks:
             import logging
 
@@ -2216,15 +2354,16 @@ def build_docs(
 
             embeddings = _embed_chunks(chunks, embedding_model)
             if embeddings:
-                emb_path = output_dir / "embeddings.json"
-                with open(emb_path, "w", encoding="utf-8") as f:
-                    json.dump(embeddings, f, ensure_ascii=False)
+                manifest.write_text(
+                    "embeddings.json", json.dumps(embeddings, ensure_ascii=False)
+                )
                 json_data["_embedding_stats"] = {
                     "chunks": len(chunks),
                     "model": embedding_model,
                     "dimensions": embeddings.get("dimensions", 0),
                 }
             else:
+                embedding_failed = True
                 logger.warning(
                     "Embedding failed. Chat will work without RAG context. "
                     "Ensure %s is available (e.g. `ollama pull %s`).",
@@ -2234,11 +2373,7 @@ def build_docs(
                     else embedding_model,
                 )
 
-    app_code = _generate_app_code(json_data)
-    app_path = output_dir / "app.py"
-
-    with open(app_path, "w", encoding="utf-8") as f:
-        f.write(app_code)
+    manifest.write_text("app.py", _generate_app_code(json_data))
 
     # Strip non-serializable objects from config before writing
     safe_config = {
@@ -2248,8 +2383,25 @@ def build_docs(
     }
     safe_data = {**json_data, "config": safe_config}
 
-    data_path = output_dir / "data.json"
-    with open(data_path, "w", encoding="utf-8") as f:
-        json.dump(safe_data, f, indent=2, ensure_ascii=False, default=str)
+    with manifest.open("data.json") as out:
+        DocEncoder().dump(safe_data, out)
+
+    store_path = output_dir / STORE_FILE
+    if config.get("sqlite", False):
+        tmp = store_path.with_name(STORE_FILE + ".tmp")
+        try:
+            write_store(safe_data, tmp)
+            manifest.adopt(STORE_FILE, tmp)
+        finally:
+            tmp.unlink(missing_ok=True)
+    else:
+        # Left over from a build with sqlite on; it would be stale
+        store_path.unlink(missing_ok=True)
+
+    manifest.summary = {key: len(json_data.get(key, [])) for key in _COUNTED}
+    # A failed embedding step is retried by the next build
+    manifest.save("" if embedding_failed else inputs)
+    stats["counts"] = manifest.summary
+    stats["outputs"] = {**manifest.stats, "up_to_date": False}
 
     return json_data
@@ -0,0 +1,198 @@
+"""Persistent scan cache for incremental builds.
+
+Scanned ModuleDoc/PageDoc objects are stored per file, keyed by the file's
+path relative to the source root and a content id. The content id is the
+git blob hash when discovery runs in git mode, or the file's mtime and
+size otherwise, so an unchanged file is recognised without reading it.
+The docstring parser's memo and rendered Markdown HTML (keyed by content
+hash) are stored alongside, so repeated docstrings and unchanged page
+text are processed once even when a file's stat data changes.
+
+The whole cache is invalidated when the cache format version, the
+CacaoDocs version or the parser configuration changes.
+
+Caches live in a per-user cache directory (see ``cache_dir``), not in
+the build output: the output is often committed and published, and a
+pickle planted there would run code on the next build.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any
+
+# Bump when ModuleDoc/PageDoc or scanner output changes shape
+CACHE_VERSION = 4
+
+CACHE_FILE = "scan.pickle"
+
+# Where earlier versions kept their caches, inside the build output
+LEGACY_CACHE_DIR = ".cache"
+LEGACY_CACHE_FILES = (CACHE_FILE, "highlight.pickle")
+
+
+def cache_dir(output_dir: str | Path, configured: str | Path | None = None) -> Path:
+    """Directory holding the build caches for docs built into ``output_dir``.
+
+    Args:
+        output_dir: Build output directory.
+        configured: The ``cache_dir`` config value; None picks a directory
+            under the user cache directory (``$XDG_CACHE_HOME``,
+            ``~/Library/Caches``, ``%LOCALAPPDATA%`` or ``~/.cache``),
+            named after the resolved output path.
+    """
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME")
+    if base:
+        root = Path(base)
+    elif sys.platform == "win32":
+        root = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Caches"
+    else:
+        root = Path.home() / ".cache"
+    key = hashlib.sha256(str(Path(output_dir).resolve()).encode()).hexdigest()[:16]
+    return root / "cacaodocs" / key
+
+
+def prepare_cache_dir(directory: Path) -> None:
+    """Create a cache directory, ignored by git should it sit in a repo."""
+    directory.mkdir(parents=True, exist_ok=True)
+    ignore = directory / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding="utf-8")
+
+
+def remove_legacy_cache(output_dir: str | Path) -> None:
+    """Delete caches that earlier versions wrote into the build output."""
+    legacy = Path(output_dir) / LEGACY_CACHE_DIR
+    for name in LEGACY_CACHE_FILES:
+        (legacy / name).unlink(missing_ok=True)
+    try:
+        legacy.rmdir()
+    except OSError:
+        pass
+
+
+def content_id(file_path: Path, blob_id: str | None = None) -> str:
+    """Cheap identity for a file's contents.
+
+    Args:
+        file_path: File on disk.
+        blob_id: Git blob hash, if known and the working tree matches it.
+
+    Returns:
+        ``git:<blob>`` or ``stat:<mtime_ns>:<size>``.
+    """
+    if blob_id:
+        return f"git:{blob_id}"
+    st = os.stat(file_path)
+    return f"stat:{st.st_mtime_ns}:{st.st_size}"
+
+
+def parser_fingerprint(*parts: Any) -> str:
+    """Hash everything that influences scan output into one string."""
+    from . import __version__
+
+    text = "|".join(repr(p) for p in (CACHE_VERSION, __version__, *parts))
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+class ScanCache:
+    """Pickle-backed store of scan results.
+
+    Args:
+        path: Cache file location. None disables persistence.
+        fingerprint: Parser/config fingerprint; a mismatch on load
+            discards the stored entries.
+    """
+
+    def __init__(self, path: str | Path | None, fingerprint: str = ""):
+        self.path = Path(path) if path is not None else None
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[str, Any]] = {}
+        # DocstringParser.memo_items() snapshot
+        self.parse_memo: list[tuple[Any, Any]] = []
+        # MarkdownRenderer.used snapshot: content key -> HTML
+        self.render_cache: dict[str, str] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    @classmethod
+    def in_dir(cls, directory: str | Path, fingerprint: str) -> ScanCache:
+        """Open the cache stored in ``directory`` (see ``cache_dir``)."""
+        cache = cls(Path(directory) / CACHE_FILE, fingerprint)
+        cache.load()
+        return cache
+
+    def load(self) -> None:
+        """Load entries from disk, ignoring missing, stale or corrupt files."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CACHE_VERSION
+            or data.get("fingerprint") != self.fingerprint
+        ):
+            return
+        self._entries = data.get("entries", {})
+        self.parse_memo = data.get("parse_memo", [])
+        self.render_cache = data.get("render_cache", {})
+
+    def save(self) -> None:
+        """Write entries back to disk, dropping files no longer present."""
+        if self.path is None:
+            return
+        stale = set(self._entries) - self._seen
+        if not self._dirty and not stale:
+            return
+        for key in stale:
+            del self._entries[key]
+        prepare_cache_dir(self.path.parent)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "fingerprint": self.fingerprint,
+                    "entries": self._entries,
+                    "parse_memo": self.parse_memo,
+                    "render_cache": self.render_cache,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def get(self, key: str, cid: str) -> Any | None:
+        """Return the cached result for ``key`` if its content id matches."""
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == cid:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, cid: str, value: Any) -> None:
+        """Store a scan result."""
+        self._seen.add(key)
+        self._entries[key] = (cid, value)
+        self._dirty = True
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,670 @@
+"""Import-aware call resolution and an indexed call graph.
+
+The scanner records calls as they are written in the source
+(``self.parser.parse``, ``json.load``, ``helpers.slugify``). This module
+resolves those strings to canonical ``full_path``s using each module's
+import table, class attribute types and base classes, then stores the
+result as a compact graph with CSR (compressed sparse row) adjacency
+arrays in both directions.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .types import EMPTY_LIST, ClassDoc, FunctionDoc, MethodDoc, ModuleDoc
+
+# Re-export chains longer than this are treated as unresolvable
+_MAX_DEPTH = 16
+
+
+def _csr(num_nodes: int, edges: list[tuple[int, int]]) -> tuple[array, array]:
+    """Pack sorted (src, dst) pairs into offset and target arrays."""
+    offsets = array("l", [0]) * (num_nodes + 1)
+    for src, _ in edges:
+        offsets[src + 1] += 1
+    for i in range(num_nodes):
+        offsets[i + 1] += offsets[i]
+    targets = array("l", [dst for _, dst in edges])
+    return offsets, targets
+
+
+class CallGraph:
+    """Directed call graph over functions and methods.
+
+    Nodes are identified by integer ids; ``nodes[i]`` is the canonical
+    ``full_path`` and ``index`` maps back. Edges are stored as CSR arrays,
+    so neighbours of a node are a contiguous slice.
+
+    Args:
+        nodes: Canonical node names, in id order.
+        edges: (caller id, callee id) pairs. Duplicates are dropped.
+        unresolved: Raw call strings that did not resolve -> callers.
+        entry_points: Node ids called at module import time.
+        dynamic_names: Method names called on receivers of unknown type.
+    """
+
+    def __init__(
+        self,
+        nodes: list[str],
+        edges: Iterable[tuple[int, int]],
+        unresolved: dict[str, list[str]] | None = None,
+        entry_points: Iterable[int] = (),
+        dynamic_names: Iterable[str] = (),
+    ):
+        self.nodes = nodes
+        self.unresolved = unresolved or {}
+        self.entry_points = sorted(set(entry_points))
+        self.dynamic_names = frozenset(dynamic_names)
+        self.index = {name: i for i, name in enumerate(nodes)}
+        forward = sorted(set(edges))
+        backward = sorted((dst, src) for src, dst in forward)
+        self._out_offsets, self._out_targets = _csr(len(nodes), forward)
+        self._in_offsets, self._in_targets = _csr(len(nodes), backward)
+        self._reach: ReachabilityIndex | None = None
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self._out_targets)
+
+    def successors(self, node: int) -> array:
+        """Ids of the nodes called by ``node``."""
+        return self._out_targets[self._out_offsets[node] : self._out_offsets[node + 1]]
+
+    def predecessors(self, node: int) -> array:
+        """Ids of the nodes that call ``node``."""
+        return self._in_targets[self._in_offsets[node] : self._in_offsets[node + 1]]
+
+    def edges(self) -> Iterator[tuple[int, int]]:
+        """Iterate over all (caller, callee) id pairs."""
+        offsets, targets = self._out_offsets, self._out_targets
+        for src in range(len(self.nodes)):
+            for k in range(offsets[src], offsets[src + 1]):
+                yield src, targets[k]
+
+    def id_of(self, name: str) -> int:
+        """Node id for a canonical name.
+
+        Raises:
+            KeyError: If ``name`` is not a node in the graph.
+        """
+        return self.index[name]
+
+    def _bfs(
+        self, start: int, offsets: array, targets: array, depth: int | None
+    ) -> list[int]:
+        """Nodes within ``depth`` hops of ``start`` (excluding ``start``
+        unless it lies on a cycle)."""
+        seen = {start: 0}
+        found: list[int] = []
+        frontier = [start]
+        level = 0
+        while frontier and (depth is None or level < depth):
+            level += 1
+            nxt = []
+            for node in frontier:
+                for k in range(offsets[node], offsets[node + 1]):
+                    t = targets[k]
+                    if t == start and start not in found:
+                        found.append(start)
+                    if t not in seen:
+                        seen[t] = level
+                        found.append(t)
+                        nxt.append(t)
+            frontier = nxt
+        return found
+
+    def callees(self, name: str, depth: int | None = 1) -> list[str]:
+        """Functions called by ``name``, directly or transitively.
+
+        Args:
+            name: Canonical full_path of the caller.
+            depth: Maximum number of hops; None for the full closure.
+
+        Returns:
+            Sorted canonical names.
+        """
+        found = self._bfs(
+            self.id_of(name), self._out_offsets, self._out_targets, depth
+        )
+        return sorted(self.nodes[i] for i in found)
+
+    def callers(self, name: str, depth: int | None = 1) -> list[str]:
+        """Functions that call ``name``, directly or transitively.
+
+        Args:
+            name: Canonical full_path of the callee.
+            depth: Maximum number of hops; None for the full closure.
+
+        Returns:
+            Sorted canonical names.
+        """
+        found = self._bfs(self.id_of(name), self._in_offsets, self._in_targets, depth)
+        return sorted(self.nodes[i] for i in found)
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Whether ``source`` transitively calls ``target``.
+
+        A function only reaches itself if it is (mutually) recursive.
+        Answered from the SCC condensation and interval labels; most
+        negative queries never touch the graph.
+        """
+        return self._reach_index().reaches(self.id_of(source), self.id_of(target))
+
+    def _reach_index(self) -> ReachabilityIndex:
+        if self._reach is None:
+            self._reach = ReachabilityIndex.build(self)
+        return self._reach
+
+    def to_dict(self) -> dict[str, Any]:
+        """Compact JSON-friendly form, including the reachability index."""
+        data: dict[str, Any] = {
+            "nodes": self.nodes,
+            "offsets": self._out_offsets.tolist(),
+            "targets": self._out_targets.tolist(),
+            "entry_points": self.entry_points,
+        }
+        data.update(self._reach_index().to_dict())
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CallGraph:
+        """Rebuild a graph serialized with ``to_dict``."""
+        offsets, targets = data["offsets"], data["targets"]
+        edges = [
+            (src, targets[k])
+            for src in range(len(data["nodes"]))
+            for k in range(offsets[src], offsets[src + 1])
+        ]
+        graph = cls(data["nodes"], edges, entry_points=data.get("entry_points", ()))
+        if "scc" in data:
+            graph._reach = ReachabilityIndex.from_dict(graph, data)
+        return graph
+
+    def reachable(self, roots: Iterable[int]) -> bytearray:
+        """Breadth-first search from ``roots``.
+
+        Returns:
+            A bytearray where ``result[i]`` is 1 if node ``i`` is reachable.
+        """
+        offsets, targets = self._out_offsets, self._out_targets
+        seen = bytearray(len(self.nodes))
+        queue: deque[int] = deque()
+        for root in roots:
+            if not seen[root]:
+                seen[root] = 1
+                queue.append(root)
+        while queue:
+            node = queue.popleft()
+            for k in range(offsets[node], offsets[node + 1]):
+                nxt = targets[k]
+                if not seen[nxt]:
+                    seen[nxt] = 1
+                    queue.append(nxt)
+        return seen
+
+
+def _strongly_connected(graph: CallGraph) -> tuple[list[int], int]:
+    """Iterative Tarjan's algorithm.
+
+    Returns:
+        Tuple of (component id per node, number of components). Component
+        ids are in reverse topological order: callees come first.
+    """
+    n = len(graph)
+    offsets, targets = graph._out_offsets, graph._out_targets
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    comp = [-1] * n
+    stack: list[int] = []
+    counter = 0
+    num_comps = 0
+
+    for start in range(n):
+        if index[start] != -1:
+            continue
+        work = [(start, offsets[start])]
+        index[start] = low[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack[start] = 1
+        while work:
+            node, k = work[-1]
+            if k < offsets[node + 1]:
+                work[-1] = (node, k + 1)
+                nxt = targets[k]
+                if index[nxt] == -1:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack[nxt] = 1
+                    work.append((nxt, offsets[nxt]))
+                elif on_stack[nxt] and index[nxt] < low[node]:
+                    low[node] = index[nxt]
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    comp[member] = num_comps
+                    if member == node:
+                        break
+                num_comps += 1
+
+    return comp, num_comps
+
+
+class ReachabilityIndex:
+    """Reachability labels over the SCC condensation of a call graph.
+
+    Every strongly connected component (a set of mutually recursive
+    functions) collapses to one vertex of a DAG. Each DAG vertex gets
+    ``k`` interval labels ``[low, post]`` from randomized post-order
+    traversals (GRAIL): if ``u`` reaches ``v`` then every label of ``v``
+    nests inside the matching label of ``u``. A query whose labels do not
+    nest is answered "no" in O(k). The first traversal also records
+    spanning-tree intervals, which answer "yes" in O(1) when ``v`` is a
+    tree descendant of ``u``. Anything left is settled by a DFS pruned
+    with both tests.
+
+    Args:
+        graph: The underlying call graph.
+        comp: Component id per node.
+        cyclic: Per component, 1 if it contains a cycle.
+        labels: Flat list of ``k`` (low, post) pairs per component.
+        tree: Per component, the lowest post-order number in its
+            spanning subtree during the first traversal.
+        k: Number of labelings.
+    """
+
+    def __init__(
+        self,
+        graph: CallGraph,
+        comp: list[int],
+        cyclic: bytearray,
+        labels: list[int],
+        tree: list[int],
+        k: int,
+    ):
+        self.graph = graph
+        self.comp = comp
+        self.cyclic = cyclic
+        self.labels = labels
+        self.tree = tree
+        self.k = k
+        num_comps = len(cyclic)
+        dag_edges = {
+            (comp[a], comp[b]) for a, b in graph.edges() if comp[a] != comp[b]
+        }
+        self._offsets, self._targets = _csr(num_comps, sorted(dag_edges))
+
+    @classmethod
+    def build(cls, graph: CallGraph, k: int = 3, seed: int = 1) -> ReachabilityIndex:
+        """Condense ``graph`` and compute ``k`` interval labelings."""
+        comp, num_comps = _strongly_connected(graph)
+        cyclic = bytearray(num_comps)
+        sizes = [0] * num_comps
+        for c in comp:
+            sizes[c] += 1
+        for a, b in graph.edges():
+            if comp[a] == comp[b]:
+                cyclic[comp[a]] = 1
+        for c, size in enumerate(sizes):
+            if size > 1:
+                cyclic[c] = 1
+
+        index = cls(graph, comp, cyclic, [], [], k)
+        index.labels, index.tree = index._label(k, seed)
+        return index
+
+    def _label(self, k: int, seed: int) -> tuple[list[int], list[int]]:
+        import random
+
+        rng = random.Random(seed)
+        n = len(self.cyclic)
+        targets = self._targets
+        has_parent = bytearray(n)
+        for t in targets:
+            has_parent[t] = 1
+        roots = [c for c in range(n) if not has_parent[c]]
+
+        labels = [0] * (2 * k * n)
+        tree = [0] * n
+        for run in range(k):
+            order = roots[:]
+            if run == 1:
+                order.reverse()
+            elif run > 1:
+                rng.shuffle(order)
+            visited = bytearray(n)
+            low = [0] * n
+            post = 0
+            for root in order:
+                if visited[root]:
+                    continue
+                visited[root] = 1
+                work = [(root, self._children(root, run, rng))]
+                low[root] = n
+                if run == 0:
+                    tree[root] = post
+                while work:
+                    node, children = work[-1]
+                    if children:
+                        child = children.pop()
+                        if not visited[child]:
+                            visited[child] = 1
+                            low[child] = n
+                            if run == 0:
+                                tree[child] = post
+                            work.append((child, self._children(child, run, rng)))
+                        elif low[child] < low[node]:
+                            low[node] = low[child]
+                        continue
+                    work.pop()
+                    if post < low[node]:
+                        low[node] = post
+                    base = 2 * (node * k + run)
+                    labels[base] = low[node]
+                    labels[base + 1] = post
+                    post += 1
+                    if work:
+                        parent = work[-1][0]
+                        if low[node] < low[parent]:
+                            low[parent] = low[node]
+        return labels, tree
+
+    def _children(self, node: int, run: int, rng: Any) -> list[int]:
+        children = self._targets[self._offsets[node] : self._offsets[node + 1]].tolist()
+        if run == 1:
+            children.reverse()
+        elif run > 1:
+            rng.shuffle(children)
+        return children
+
+    def _may_reach(self, a: int, b: int) -> bool:
+        """Label containment test: False means ``a`` cannot reach ``b``."""
+        if b > a:
+            # Component ids are reverse topological: callees come first
+            return False
+        labels, k = self.labels, self.k
+        for run in range(k):
+            ia = 2 * (a * k + run)
+            ib = 2 * (b * k + run)
+            if labels[ib] < labels[ia] or labels[ib + 1] > labels[ia + 1]:
+                return False
+        return True
+
+    def _tree_reaches(self, a: int, b: int) -> bool:
+        """Spanning-tree test: True means ``a`` certainly reaches ``b``."""
+        post_b = self.labels[2 * b * self.k + 1]
+        return self.tree[a] <= post_b <= self.labels[2 * a * self.k + 1]
+
+    def reaches(self, source: int, target: int) -> bool:
+        """Whether node ``source`` reaches node ``target`` by a non-empty path."""
+        ca, cb = self.comp[source], self.comp[target]
+        if ca == cb:
+            return bool(self.cyclic[ca])
+        if not self._may_reach(ca, cb):
+            return False
+        if self._tree_reaches(ca, cb):
+            return True
+        offsets, targets = self._offsets, self._targets
+        seen = {ca}
+        stack = [ca]
+        while stack:
+            node = stack.pop()
+            for k in range(offsets[node], offsets[node + 1]):
+                nxt = targets[k]
+                if nxt in seen or not self._may_reach(nxt, cb):
+                    continue
+                if nxt == cb or self._tree_reaches(nxt, cb):
+                    return True
+                seen.add(nxt)
+                stack.append(nxt)
+        return False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "scc": self.comp,
+            "cyclic": [i for i, flag in enumerate(self.cyclic) if flag],
+            "num_sccs": len(self.cyclic),
+            "label_k": self.k,
+            "labels": self.labels,
+            "tree": self.tree,
+        }
+
+    @classmethod
+    def from_dict(cls, graph: CallGraph, data: dict[str, Any]) -> ReachabilityIndex:
+        cyclic = bytearray(data["num_sccs"])
+        for c in data["cyclic"]:
+            cyclic[c] = 1
+        return cls(
+            graph, data["scc"], cyclic, data["labels"], data["tree"], data["label_k"]
+        )
+
+
+class CallResolver:
+    """Resolves raw call strings to canonical ``full_path``s.
+
+    Args:
+        modules: All scanned modules.
+    """
+
+    def __init__(self, modules: list[ModuleDoc]):
+        self.modules = {m.full_path: m for m in modules}
+        self.classes: dict[str, ClassDoc] = {}
+        self.class_module: dict[str, ModuleDoc] = {}
+        self.functions: set[str] = set()
+
+        for module in modules:
+            for func in module.functions:
+                self.functions.add(func.full_path)
+            for cls in module.classes:
+                self.classes[cls.full_path] = cls
+                self.class_module[cls.full_path] = module
+                for method in cls.methods:
+                    self.functions.add(f"{cls.full_path}.{method.name}")
+
+        # A top-level __init__.py is scanned as module "__init__"; absolute
+        # imports of the package by its real name are mapped onto it.
+        root = self.modules.get("__init__")
+        self.root_package = Path(root.file_path).parent.name if root else ""
+
+    def canonical(self, dotted: str, depth: int = 0) -> str | None:
+        """Follow imports and re-exports until a defined symbol is reached.
+
+        Returns:
+            The ``full_path`` of a module, class, function or method, or
+            None if the name is not defined in the scanned code.
+        """
+        if depth > _MAX_DEPTH:
+            return None
+        if dotted in self.functions or dotted in self.classes:
+            return dotted
+        if dotted in self.modules:
+            return dotted
+
+        parts = dotted.split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            prefix = ".".join(parts[:i])
+            rest = parts[i:]
+            if prefix in self.classes:
+                if len(rest) == 1:
+                    return self.lookup_method(prefix, rest[0])
+                return None
+            module = self.modules.get(prefix)
+            if module is not None:
+                target = module.imports.get(rest[0])
+                if target is None:
+                    return None
+                return self.canonical(".".join([target, *rest[1:]]), depth + 1)
+
+        if self.root_package and parts[0] == self.root_package and len(parts) > 1:
+            stripped = ".".join(parts[1:])
+            if stripped.split(".")[0] in self.modules:
+                return self.canonical(stripped, depth + 1)
+            return self.canonical(f"__init__.{stripped}", depth + 1)
+        return None
+
+    def bind(self, module: ModuleDoc, name: str) -> str | None:
+        """Resolve a bare name as seen from inside ``module``."""
+        local = f"{module.full_path}.{name}"
+        if local in self.functions or local in self.classes:
+            return local
+        target = module.imports.get(name)
+        if target is not None:
+            return self.canonical(target)
+        return None
+
+    def resolve_type(self, module: ModuleDoc, type_name: str) -> str | None:
+        """Resolve a type name written in ``module`` to a known class."""
+        head, _, rest = type_name.partition(".")
+        base = self.bind(module, head)
+        if base is None:
+            return None
+        target = self.canonical(f"{base}.{rest}") if rest else base
+        return target if target in self.classes else None
+
+    def mro(self, cls_path: str) -> Iterator[str]:
+        """Known classes in ``cls_path``'s hierarchy, depth-first."""
+        seen: set[str] = set()
+        stack = [cls_path]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            yield current
+            cls = self.classes[current]
+            module = self.class_module[current]
+            bases = []
+            for base in cls.bases:
+                resolved = self.resolve_type(module, base.split("[")[0])
+                if resolved:
+                    bases.append(resolved)
+            stack.extend(reversed(bases))
+
+    def lookup_method(self, cls_path: str, name: str) -> str | None:
+        """Find the method ``name`` on a class or its known bases."""
+        for current in self.mro(cls_path):
+            path = f"{current}.{name}"
+            if path in self.functions:
+                return path
+        return None
+
+    def attribute_class(self, cls_path: str, attr: str) -> str | None:
+        """Resolve the class of ``self.<attr>`` on a class or its bases."""
+        for current in self.mro(cls_path):
+            type_name = self.classes[current].attribute_types.get(attr)
+            if type_name:
+                return self.resolve_type(self.class_module[current], type_name)
+        return None
+
+    def _callable(self, target: str | None) -> str | None:
+        """Map a resolved symbol to the graph node that runs when it is called."""
+        if target is None:
+            return None
+        if target in self.classes:
+            return self.lookup_method(target, "__init__")
+        return target if target in self.functions else None
+
+    def resolve(
+        self, call: str, module: ModuleDoc, cls: ClassDoc | None = None
+    ) -> str | None:
+        """Resolve one call string made from ``module`` (and ``cls``).
+
+        Args:
+            call: Dotted call string as recorded by the scanner.
+            module: Module containing the caller.
+            cls: Enclosing class for method callers.
+
+        Returns:
+            Canonical ``full_path`` of the callee, or None if the callee is
+            external, dynamic or otherwise unknown.
+        """
+        parts = call.split(".")
+        head = parts[0]
+
+        if cls is not None and head in ("self", "cls"):
+            if len(parts) == 2:
+                return self.lookup_method(cls.full_path, parts[1])
+            if len(parts) == 3:
+                attr_cls = self.attribute_class(cls.full_path, parts[1])
+                if attr_cls:
+                    return self.lookup_method(attr_cls, parts[2])
+            return None
+
+        base = self.bind(module, head)
+        if base is None:
+            return None
+        if len(parts) == 1:
+            return self._callable(base)
+        return self._callable(self.canonical(".".join([base, *parts[1:]])))
+
+
+def _iter_callers(
+    modules: list[ModuleDoc],
+) -> Iterator[tuple[str, FunctionDoc | MethodDoc, ModuleDoc, ClassDoc | None]]:
+    for module in modules:
+        for func in module.functions:
+            yield func.full_path, func, module, None
+        for cls in module.classes:
+            for method in cls.methods:
+                yield f"{cls.full_path}.{method.name}", method, module, cls
+
+
+def build_call_graph(modules: list[ModuleDoc]) -> CallGraph:
+    """Resolve every recorded call and build the call graph.
+
+    Also fills in ``resolved_calls`` on each FunctionDoc and MethodDoc.
+
+    Args:
+        modules: All scanned modules.
+
+    Returns:
+        CallGraph over all functions and methods.
+    """
+    resolver = CallResolver(modules)
+    nodes = list(dict.fromkeys(path for path, _, _, _ in _iter_callers(modules)))
+    index = {name: i for i, name in enumerate(nodes)}
+    edges: list[tuple[int, int]] = []
+    unresolved: dict[str, list[str]] = {}
+    dynamic_names: set[str] = set()
+
+    for path, item, module, cls in _iter_callers(modules):
+        src = index[path]
+        resolved = []
+        for call in item.calls:
+            target = resolver.resolve(call, module, cls)
+            if target is None:
+                unresolved.setdefault(call, []).append(path)
+                # obj.method() on a local or attribute of unknown type
+                head, _, attr = call.rpartition(".")
+                if head and resolver.bind(module, head.split(".")[0]) is None:
+                    if head.split(".")[0] not in module.imports:
+                        dynamic_names.add(attr)
+                continue
+            resolved.append(target)
+            edges.append((src, index[target]))
+        item.resolved_calls = sorted(set(resolved)) if resolved else EMPTY_LIST
+
+    entry_points = []
+    for module in modules:
+        for call in module.calls:
+            target = resolver.resolve(call, module)
+            if target is not None:
+                entry_points.append(index[target])
+
+    return CallGraph(nodes, edges, unresolved, entry_points, dynamic_names)
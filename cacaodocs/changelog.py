@@ -0,0 +1,219 @@
+"""Append-only changelog of changes between builds.
+
+Every build that changes something appends one JSON line to the current
+segment under ``<output>/changelog/``. Once a segment grows past
+``max_segment_bytes`` a new one is started, so earlier entries are never
+rewritten. A small index maps build ids to their segment and byte offset,
+which lets readers fetch the most recent entries (``tail``) or one build
+(``get``) without parsing the rest of the history.
+
+A ``changelog.json`` written by older versions is imported on first use.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+# Bump when the index changes shape
+CHANGELOG_VERSION = 1
+
+CHANGELOG_DIR = "changelog"
+INDEX_FILE = "index.json"
+LEGACY_FILE = "changelog.json"
+
+
+class ChangelogStore:
+    """Changelog entries stored as rotating JSON Lines segments.
+
+    Entries are numbered with consecutive build ids starting at 1; the id
+    is stored in the entry under ``"build"``.
+
+    Args:
+        directory: Directory holding the segments and the index.
+        max_segment_bytes: Size after which a new segment is started.
+    """
+
+    def __init__(self, directory: str | Path, max_segment_bytes: int = 1 << 20):
+        self.directory = Path(directory)
+        self.max_segment_bytes = max_segment_bytes
+        # {"file", "first" (build id), "offsets" (byte offset per entry),
+        #  "size" (bytes covered by the index)}, oldest first
+        self._segments: list[dict[str, Any]] = []
+        self._load_index()
+
+    @classmethod
+    def for_output(
+        cls, output_dir: str | Path, max_segment_bytes: int = 1 << 20
+    ) -> ChangelogStore:
+        """Open the changelog of a build output, importing a legacy file."""
+        store = cls(Path(output_dir) / CHANGELOG_DIR, max_segment_bytes)
+        legacy = Path(output_dir) / LEGACY_FILE
+        if not store._segments and legacy.exists():
+            store.import_legacy(legacy)
+        return store
+
+    def __len__(self) -> int:
+        return sum(len(seg["offsets"]) for seg in self._segments)
+
+    @property
+    def last_build(self) -> int:
+        """Id of the newest entry (0 if the changelog is empty)."""
+        if not self._segments:
+            return 0
+        seg = self._segments[-1]
+        return seg["first"] + len(seg["offsets"]) - 1
+
+    # --- Writing ---
+
+    def append(self, entry: dict[str, Any]) -> int:
+        """Append one entry and return its build id."""
+        return self.extend([entry])[-1]
+
+    def extend(self, entries: Iterable[dict[str, Any]]) -> list[int]:
+        """Append entries in order, updating the index once.
+
+        Returns:
+            The build ids assigned to the entries.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        builds: list[int] = []
+        handle = None
+        seg: dict[str, Any] | None = None
+        try:
+            for entry in entries:
+                build = self.last_build + 1
+                if (
+                    not self._segments
+                    or self._segments[-1]["size"] >= self.max_segment_bytes
+                ):
+                    self._segments.append(
+                        {"file": f"{build:08d}.jsonl", "first": build, "offsets": [], "size": 0}
+                    )
+                if seg is not self._segments[-1]:
+                    if handle is not None:
+                        handle.close()
+                    seg = self._segments[-1]
+                    handle = open(self.directory / seg["file"], "ab")
+                    # Drop a line written by an append that failed before
+                    # the index was updated
+                    if handle.tell() != seg["size"]:
+                        handle.truncate(seg["size"])
+                line = json.dumps(
+                    {"build": build, **entry}, ensure_ascii=False, default=str
+                )
+                data = (line + "\n").encode("utf-8")
+                handle.write(data)  # type: ignore[union-attr]
+                seg["offsets"].append(seg["size"])
+                seg["size"] += len(data)
+                builds.append(build)
+        finally:
+            if handle is not None:
+                handle.close()
+        if builds:
+            self._save_index()
+        return builds
+
+    def import_legacy(self, path: str | Path) -> int:
+        """Import a ``changelog.json`` list and remove the file.
+
+        Returns:
+            Number of entries imported (0 if the file is unreadable).
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(entries, list):
+            return 0
+        imported = self.extend(e for e in entries if isinstance(e, dict))
+        os.remove(path)
+        return len(imported)
+
+    # --- Reading ---
+
+    def tail(self, n: int) -> list[dict[str, Any]]:
+        """The last ``n`` entries, oldest first."""
+        result: list[dict[str, Any]] = []
+        for seg in reversed(self._segments):
+            need = n - len(result)
+            if need <= 0:
+                break
+            offsets = seg["offsets"][-need:]
+            if not offsets:
+                continue
+            with open(self.directory / seg["file"], "rb") as f:
+                f.seek(offsets[0])
+                data = f.read(seg["size"] - offsets[0])
+            result[:0] = [json.loads(line) for line in data.splitlines()]
+        return result
+
+    def get(self, build: int) -> dict[str, Any] | None:
+        """The entry for ``build``, or None if there is none."""
+        firsts = [seg["first"] for seg in self._segments]
+        i = bisect.bisect_right(firsts, build) - 1
+        if i < 0:
+            return None
+        seg = self._segments[i]
+        pos = build - seg["first"]
+        if pos >= len(seg["offsets"]):
+            return None
+        with open(self.directory / seg["file"], "rb") as f:
+            f.seek(seg["offsets"][pos])
+            return json.loads(f.readline())
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """All entries, oldest first."""
+        for seg in self._segments:
+            with open(self.directory / seg["file"], "rb") as f:
+                data = f.read(seg["size"])
+            for line in data.splitlines():
+                yield json.loads(line)
+
+    # --- Index ---
+
+    def _load_index(self) -> None:
+        try:
+            with open(self.directory / INDEX_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == CHANGELOG_VERSION:
+            self._segments = data.get("segments", [])
+        else:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Recover the index by reading the segments (index lost or stale)."""
+        self._segments = []
+        if not self.directory.is_dir():
+            return
+        for path in sorted(self.directory.glob("*.jsonl")):
+            offsets: list[int] = []
+            size = 0
+            first = self.last_build + 1
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    offsets.append(size)
+                    size += len(line)
+            if offsets:
+                self._segments.append(
+                    {"file": path.name, "first": first, "offsets": offsets, "size": size}
+                )
+
+    def _save_index(self) -> None:
+        path = self.directory / INDEX_FILE
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": CHANGELOG_VERSION, "segments": self._segments},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp, path)
@@ -23,7 +23,27 @@ def cli():
     "-c", "--config", type=click.Path(), default=None, help="Path to cacao.yaml."
 )
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output.")
-def build(source: str, output: str, config: str | None, verbose: bool):
+@click.option(
+    "--discovery",
+    type=click.Choice(["filesystem", "git"]),
+    default=None,
+    help="How to find source files (default: from config).",
+)
+@click.option("--no-cache", is_flag=True, help="Rescan every file.")
+@click.option(
+    "--sqlite",
+    is_flag=True,
+    help="Also write docs.sqlite, read on demand by the app, with full-text search.",
+)
+def build(
+    source: str,
+    output: str,
+    config: str | None,
+    verbose: bool,
+    discovery: str | None,
+    no_cache: bool,
+    sqlite: bool,
+):
     """Build documentation from Python source files.
 
     SOURCE is the directory containing Python files to document.
@@ -43,18 +63,34 @@ def build(source: str, output: str, config: str | None, verbose: bool):
     cfg = load_config(config)
     if verbose:
         cfg["verbose"] = True
+    if discovery:
+        cfg["discovery"] = discovery
+    if no_cache:
+        cfg["cache"] = False
+    if sqlite:
+        cfg["sqlite"] = True
 
     try:
-        json_data = build_docs(source_path, output_path, cfg)
-
-        num_modules = len(json_data.get("modules", []))
-        num_classes = len(json_data.get("classes", []))
-        num_functions = len(json_data.get("functions", []))
-        num_api = len(json_data.get("api_endpoints", []))
-        num_pages = len(json_data.get("pages", []))
+        build_stats: dict = {}
+        json_data = build_docs(source_path, output_path, cfg, stats=build_stats)
+
+        # Counts come from the build stats so a no-op build never has
+        # to load data.json
+        counts = build_stats.get("counts", {})
+        outputs = build_stats.get("outputs", {})
+        num_modules = counts.get("modules", 0)
+        num_classes = counts.get("classes", 0)
+        num_functions = counts.get("functions", 0)
+        num_api = counts.get("api_endpoints", 0)
+        num_pages = counts.get("pages", 0)
 
         click.echo()
-        click.echo(click.style("Documentation built!", fg="green", bold=True))
+        if outputs.get("up_to_date"):
+            click.echo(
+                click.style("Documentation is up to date.", fg="green", bold=True)
+            )
+        else:
+            click.echo(click.style("Documentation built!", fg="green", bold=True))
         click.echo()
         click.echo(f"  Modules:       {num_modules}")
         click.echo(f"  Classes:       {num_classes}")
@@ -62,9 +98,54 @@ def build(source: str, output: str, config: str | None, verbose: bool):
         if num_api:
             click.echo(f"  API Endpoints: {num_api}")
         click.echo(f"  Pages:         {num_pages}")
-
-        # Embedding stats
-        emb_stats = json_data.get("_embedding_stats")
+        if outputs:
+            changed = outputs.get("changed", [])
+            unchanged = outputs.get("unchanged", [])
+            click.echo(
+                f"  Outputs:       {len(changed)} written, {len(unchanged)} unchanged"
+            )
+            if verbose:
+                for name in changed:
+                    click.echo(f"    written:    {name}")
+                for name in unchanged:
+                    click.echo(f"    unchanged:  {name}")
+
+        if verbose and build_stats:
+            click.echo()
+            click.echo(click.style("  Scan:", fg="cyan"))
+            click.echo(f"    Discovery:  {build_stats.get('discovery', '')}")
+            click.echo(f"    Files:      {build_stats.get('files', 0)}")
+            cache_stats = build_stats.get("cache")
+            if cache_stats:
+                click.echo(
+                    f"    Cache:      {cache_stats['hits']} reused, "
+                    f"{cache_stats['misses']} scanned"
+                )
+            memo_stats = build_stats.get("parse_memo")
+            if memo_stats:
+                total = memo_stats["hits"] + memo_stats["misses"]
+                rate = memo_stats["hits"] / total * 100 if total else 0.0
+                click.echo(
+                    f"    Docstrings: {memo_stats['misses']} parsed, "
+                    f"{memo_stats['hits']} memoized ({rate:.0f}% hit rate)"
+                )
+            render_stats = build_stats.get("render")
+            if render_stats and (render_stats["hits"] or render_stats["misses"]):
+                click.echo(
+                    f"    Pages:      {render_stats['misses']} rendered, "
+                    f"{render_stats['hits']} from cache"
+                )
+            hl_stats = build_stats.get("highlight")
+            if hl_stats and (hl_stats["hits"] or hl_stats["misses"]):
+                click.echo(
+                    f"    Highlight:  {hl_stats['misses']} highlighted, "
+                    f"{hl_stats['hits']} from cache"
+                )
+
+        # Embedding stats (no embedding step runs for a no-op build)
+        emb_stats = None
+        if not outputs.get("up_to_date"):
+            emb_stats = json_data.get("_embedding_stats")
         if emb_stats:
             click.echo()
             click.echo(click.style("  AI/RAG:", fg="cyan"))
@@ -90,14 +171,35 @@ def build(source: str, output: str, config: str | None, verbose: bool):
 @click.argument("directory", type=click.Path(exists=True), default="./docs")
 @click.option("-p", "--port", type=int, default=1502, help="Port to serve on.")
 @click.option("--host", type=str, default="127.0.0.1", help="Host to bind to.")
-def serve(directory: str | Path, port: int, host: str):
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Worker processes sharing one preloaded copy of the docs.",
+)
+@click.option(
+    "--no-reload",
+    is_flag=True,
+    help="Keep serving the docs as loaded at startup.",
+)
+def serve(
+    directory: str | Path, port: int, host: str, workers: int, no_reload: bool
+):
     """Serve generated documentation using Cacao.
 
     DIRECTORY is the path to the generated docs (default: ./docs).
 
+    A rebuild into DIRECTORY is swapped in without a restart: open pages
+    refresh the panels that changed and stay connected.
+
+    With --workers, the docs are loaded once and forked into worker
+    processes that share the data's memory (POSIX only).
+
     Examples:
         cacaodocs serve
         cacaodocs serve ./my-docs -p 3000
+        cacaodocs serve ./my-docs --host 0.0.0.0 --workers 4
     """
     directory = Path(directory).resolve()
     app_file = directory / "app.py"
@@ -112,24 +214,45 @@ def serve(directory: str | Path, port: int, host: str):
         )
         sys.exit(1)
 
-    click.echo(f"Serving docs at http://{host}:{port}")
-    click.echo("Press Ctrl+C to stop.")
+    from functools import partial
 
-    try:
-        subprocess.run(
-            ["cacao", "run", str(app_file), "--port", str(port)],
-            check=True,
-        )
-    except FileNotFoundError:
+    from .server import can_fork, load_app, serve_app, serve_workers
+
+    if workers > 1 and not can_fork():
         click.echo(
             click.style(
-                "Error: Cacao not found. Install it: pip install cacao", fg="red"
+                "Warning: --workers needs fork(); serving with one process.",
+                fg="yellow",
             ),
             err=True,
         )
+        workers = 1
+
+    click.echo(f"Serving docs at http://{host}:{port}")
+    if workers > 1:
+        click.echo(f"Workers: {workers} (sharing one preloaded copy of the docs)")
+    if not no_reload:
+        click.echo("Rebuilds are picked up automatically.")
+    click.echo("Press Ctrl+C to stop.")
+
+    load = partial(load_app, live=not no_reload)
+    try:
+        if workers > 1:
+            status = serve_workers(app_file, host, port, workers, load=load)
+        else:
+            serve_app(app_file, host, port, load=load)
+            status = 0
+    except ImportError as e:
+        click.echo(click.style(f"Error: {e}", fg="red"), err=True)
+        sys.exit(1)
+    except OSError as e:
+        click.echo(click.style(f"Error: {e.strerror or e}", fg="red"), err=True)
         sys.exit(1)
     except KeyboardInterrupt:
-        click.echo("\nStopped.")
+        # uvicorn re-raises Ctrl+C once it has shut down
+        status = 0
+    click.echo("\nStopped.")
+    sys.exit(status)
 
 
 @cli.command()
@@ -147,7 +270,23 @@ def serve(directory: str | Path, port: int, host: str):
     default="",
     help="Base path for deployment (e.g., /my-repo for GitHub Pages).",
 )
-def export(directory: str | Path, output: str | Path, base_path: str):
+@click.option(
+    "--no-shard",
+    is_flag=True,
+    help="Embed every panel in index.html (works when opened from disk).",
+)
+@click.option(
+    "--precompress",
+    is_flag=True,
+    help="Write .gz copies of text assets and fingerprint embeddings.json.",
+)
+def export(
+    directory: str | Path,
+    output: str | Path,
+    base_path: str,
+    no_shard: bool,
+    precompress: bool,
+):
     """Export documentation as a static HTML site.
 
     DIRECTORY is the path to the generated docs (default: ./docs).
@@ -158,6 +297,7 @@ def export(directory: str | Path, output: str | Path, base_path: str):
         cacaodocs export
         cacaodocs export ./docs -o ./dist
         cacaodocs export ./docs --base-path /my-repo
+        cacaodocs export ./docs --precompress
     """
     directory = Path(directory).resolve()
     app_file = directory / "app.py"
@@ -172,31 +312,58 @@ def export(directory: str | Path, output: str | Path, base_path: str):
         )
         sys.exit(1)
 
+    from .export import export_site
+
     output_path = Path(output).resolve()
     click.echo(f"Exporting static site to {output_path}")
 
-    cmd = ["cacao", "build", str(app_file), "-o", str(output_path)]
-    if base_path:
-        cmd.extend(["--base-path", base_path])
-
     try:
-        subprocess.run(cmd, check=True)
-
-        # Copy embeddings.json if it exists (for RAG chat)
-        embeddings_src = directory / "embeddings.json"
-        if embeddings_src.exists():
-            import shutil
-
-            shutil.copy2(embeddings_src, output_path / "embeddings.json")
+        result = export_site(
+            directory,
+            output_path,
+            base_path,
+            shard=not no_shard,
+            precompress=precompress,
+        )
 
         click.echo()
-        click.echo(click.style("Static site exported!", fg="green", bold=True))
+        if result["up_to_date"]:
+            click.echo(
+                click.style("Static site is up to date.", fg="green", bold=True)
+            )
+        else:
+            click.echo(click.style("Static site exported!", fg="green", bold=True))
         click.echo(f"  Output: {output_path}")
-        if embeddings_src.exists():
+        for warning in result["warnings"]:
+            click.echo(click.style(f"  Warning: {warning}", fg="yellow"), err=True)
+        click.echo(
+            f"  Files:  {len(result['written'])} written, "
+            f"{len(result['unchanged'])} unchanged, {len(result['removed'])} removed"
+        )
+        if result["sharded"]:
+            click.echo("  Panels and search index load on demand")
+        if result["compressed"]:
+            click.echo(f"  Precompressed: {len(result['compressed'])} .gz files")
+        if "embeddings.json" in result["files"] or (
+            output_path / "embeddings.json"
+        ).exists():
             click.echo(click.style("  AI chat with RAG enabled", fg="cyan"))
         click.echo()
-        click.echo("You can serve it with any static file server, e.g.:")
-        click.echo(f"  python -m http.server -d {output_path}")
+        click.echo("Host it on any static file server (GitHub Pages, Netlify, nginx).")
+        if result["sharded"] or result["files"]:
+            click.echo(
+                "  Files with a content hash in their name (panels/, search/, "
+                "cacao.*.js, cacao*.css, embeddings.*.json) never change:"
+            )
+            click.echo(
+                "  serve them with Cache-Control: public, max-age=31536000, immutable"
+            )
+            click.echo("  and revalidate manifest.json and *.html on every request.")
+        if result["compressed"]:
+            click.echo(
+                "  Serve the .gz files with Content-Encoding: gzip "
+                "(nginx: gzip_static on;)."
+            )
     except FileNotFoundError:
         click.echo(
             click.style(
@@ -205,7 +372,9 @@ def export(directory: str | Path, output: str | Path, base_path: str):
             err=True,
         )
         sys.exit(1)
-    except subprocess.CalledProcessError:
+    except subprocess.CalledProcessError as e:
+        if e.output:
+            click.echo(e.output, err=True)
         click.echo(
             click.style("Error: Static build failed.", fg="red"),
             err=True,
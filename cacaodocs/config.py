@@ -43,6 +43,15 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "dist",
         "*.egg-info",
     ],
+    "respect_gitignore": True,
+    "discovery": "filesystem",
+    "cache": True,
+    "cache_dir": None,
+    "read_ahead": 16,
+    "render_workers": 1,
+    "highlight_cache": 4096,
+    "changelog_tail": 20,
+    "sqlite": False,
 }
 
 
@@ -106,6 +115,15 @@ def _merge_from_yaml(config: dict[str, Any], yaml_data: dict[str, Any]) -> None:
         "clarity_id",
         "chat",
         "page_order",
+        "respect_gitignore",
+        "discovery",
+        "cache",
+        "cache_dir",
+        "read_ahead",
+        "render_workers",
+        "highlight_cache",
+        "changelog_tail",
+        "sqlite",
     ):
         if key in yaml_data:
             config[key] = yaml_data[key]
@@ -120,8 +138,9 @@ def _merge_from_yaml(config: dict[str, Any], yaml_data: dict[str, Any]) -> None:
 
     # Exclude patterns — merge with defaults
     if "exclude_patterns" in yaml_data:
+        # dict.fromkeys dedupes in order, keeping builds reproducible
         config["exclude_patterns"] = list(
-            set(config["exclude_patterns"] + yaml_data["exclude_patterns"])
+            dict.fromkeys(config["exclude_patterns"] + yaml_data["exclude_patterns"])
         )
 
     # Custom doc types
@@ -209,6 +228,41 @@ exclude_patterns:
   - "build"
   - "dist"
 
+# Skip files ignored by .gitignore (default: true)
+# respect_gitignore: false
+
+# File discovery: "filesystem" walks the tree, "git" lists files from the
+# git index (faster on large checkouts; falls back outside a repository)
+# discovery: git
+
+# Reuse scan results for unchanged files between builds (default: true)
+# cache: false
+
+# Where that cache is kept (default: a directory per output under the
+# user cache directory, e.g. ~/.cache/cacaodocs). Keep it out of the
+# docs output, which is usually committed and published.
+# cache_dir: .cacaodocs-cache
+
+# Files read ahead on background threads while earlier ones are parsed
+# (helps on network filesystems and cold caches; 0 disables)
+# read_ahead: 16
+
+# Processes used to render Markdown pages (default: 1, render inline;
+# 0 = one per CPU for large batches). Builds only: plug() always renders
+# inline.
+# render_workers: 0
+
+# Highlighted code blocks kept in the build cache (least recently used
+# snippets are evicted first)
+# highlight_cache: 4096
+
+# Number of recent builds listed in the changelog panel
+# changelog_tail: 50
+
+# Also write docs.sqlite, which the app reads on demand instead of
+# loading data.json whole, with full-text search (for large projects)
+# sqlite: true
+
 # Page ordering (optional)
 # Control the order of Markdown pages in the sidebar by slug.
 # Pages not listed appear after these, in their default order.
@@ -0,0 +1,356 @@
+"""Single-pass source file discovery.
+
+Walks a directory tree once with ``os.scandir`` and yields every Python
+and Markdown file, applying exclude patterns (compiled into a single
+regex) and ``.gitignore`` rules along the way. Excluded and ignored
+directories are never descended into.
+
+Alternatively, ``git_sources`` asks git for the file list, which skips the
+walk entirely and provides blob hashes usable as cache keys.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+PYTHON_SUFFIXES = (".py",)
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+SOURCE_SUFFIXES = PYTHON_SUFFIXES + MARKDOWN_SUFFIXES
+
+
+def compile_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile fnmatch-style patterns into one alternation regex.
+
+    Matching is equivalent to ``any(fnmatch.fnmatch(s, p) for p in patterns)``.
+    Callers must pass strings through ``os.path.normcase`` first, as
+    ``fnmatch.fnmatch`` does.
+
+    Returns:
+        Compiled regex, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    parts = [fnmatch.translate(os.path.normcase(p)) for p in patterns]
+    return re.compile("|".join(f"(?:{p})" for p in parts))
+
+
+# --- .gitignore support ---
+
+
+def _glob_to_regex(glob: str) -> str:
+    """Translate one gitignore glob (without anchors) into a regex body."""
+    out = []
+    i, n = 0, len(glob)
+    while i < n:
+        ch = glob[i]
+        if ch == "*":
+            if glob[i : i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if glob[i : i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            end = glob.find("]", i + 2 if glob[i + 1 : i + 2] == "!" else i + 1)
+            if end == -1:
+                out.append(re.escape(ch))
+            else:
+                body = glob[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif ch == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(glob[i]))
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return "".join(out)
+
+
+class GitIgnoreRule:
+    """A single compiled line from a ``.gitignore`` file.
+
+    Args:
+        pattern: The raw pattern line.
+    """
+
+    __slots__ = ("negate", "dir_only", "regex")
+
+    def __init__(self, pattern: str):
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+        elif pattern.startswith("\\"):
+            pattern = pattern[1:]
+
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        # A slash anywhere but the end anchors the pattern to its directory
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        body = _glob_to_regex(pattern)
+        prefix = "" if anchored else "(?:.*/)?"
+        self.regex = re.compile(f"{prefix}{body}\\Z", re.DOTALL)
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.match(rel_path) is not None
+
+
+def parse_gitignore(text: str) -> list[GitIgnoreRule]:
+    """Parse the contents of a ``.gitignore`` file."""
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if line.endswith("\\"):
+            line += " "
+        if not line or line.startswith("#"):
+            continue
+        rules.append(GitIgnoreRule(line))
+    return rules
+
+
+class GitIgnore:
+    """Stack of ``.gitignore`` rule sets, one per directory.
+
+    Rules from deeper directories take precedence, and within a file the
+    last matching rule wins, so the stack is evaluated in reverse.
+
+    Args:
+        layers: (base directory, rules) pairs, outermost first. Paths
+            are posix-style strings.
+    """
+
+    def __init__(self, layers: list[tuple[str, list[GitIgnoreRule]]] | None = None):
+        self.layers = layers or []
+
+    def child(self, directory: str, rules: list[GitIgnoreRule]) -> GitIgnore:
+        """Return a new stack with ``rules`` from ``directory`` pushed on top."""
+        if not rules:
+            return self
+        return GitIgnore(self.layers + [(directory, rules)])
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """Whether an absolute posix ``path`` is ignored."""
+        for base, rules in reversed(self.layers):
+            if not path.startswith(base + "/"):
+                continue
+            rel = path[len(base) + 1 :]
+            for rule in reversed(rules):
+                if rule.matches(rel, is_dir):
+                    return not rule.negate
+        return False
+
+
+def _read_gitignore(directory: str) -> list[GitIgnoreRule]:
+    try:
+        with open(
+            os.path.join(directory, ".gitignore"), "r", encoding="utf-8", errors="replace"
+        ) as f:
+            return parse_gitignore(f.read())
+    except OSError:
+        return []
+
+
+def find_repo_root(path: str | Path) -> Path | None:
+    """Return the nearest ancestor of ``path`` that contains ``.git``."""
+    current = Path(path).resolve()
+    for candidate in (current, *current.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def _ancestor_gitignores(root: Path) -> GitIgnore:
+    """Collect ignore rules that apply to ``root`` from above it.
+
+    Covers ``.git/info/exclude`` and the ``.gitignore`` files between the
+    repository root and ``root``, which still apply when only a
+    subdirectory of a repository is scanned.
+    """
+    ignore = GitIgnore()
+    repo = find_repo_root(root)
+    if repo is None:
+        return ignore
+
+    exclude_file = repo / ".git" / "info" / "exclude"
+    if exclude_file.is_file():
+        with open(exclude_file, "r", encoding="utf-8", errors="replace") as f:
+            ignore = ignore.child(repo.as_posix(), parse_gitignore(f.read()))
+
+    root = root.resolve()
+    ancestors = [p for p in root.parents if p == repo or repo in p.parents]
+    for directory in reversed(ancestors):
+        ignore = ignore.child(directory.as_posix(), _read_gitignore(str(directory)))
+    return ignore
+
+
+def walk_sources(
+    root: str | Path,
+    exclude_patterns: list[str],
+    respect_gitignore: bool = True,
+    suffixes: tuple[str, ...] = SOURCE_SUFFIXES,
+) -> Iterator[Path]:
+    """Yield source files under ``root`` in a single traversal.
+
+    Directory entries come from ``os.scandir``, so file type checks reuse
+    the cached ``DirEntry`` information instead of extra ``stat`` calls.
+    Within a directory, files are yielded before subdirectories are
+    visited (the same order as ``os.walk``). Symlinked directories are
+    not followed.
+
+    Args:
+        root: Directory to walk.
+        exclude_patterns: fnmatch patterns; a directory is skipped if its
+            name matches, a file if its name or relative path matches.
+        respect_gitignore: Skip paths ignored by ``.gitignore`` files.
+        suffixes: File suffixes to yield.
+
+    Yields:
+        Paths of matching files.
+    """
+    root = Path(root)
+    exclude = compile_patterns(exclude_patterns)
+    normcase = os.path.normcase
+    root_str = str(root)
+    prefix_len = len(os.path.join(root_str, ""))
+
+    # Ignore rules are matched against resolved posix paths; since symlinked
+    # directories are never entered, children just append their name.
+    ignore = _ancestor_gitignores(root) if respect_gitignore else None
+    root_base = root.resolve().as_posix()
+
+    stack: list[tuple[str, str, GitIgnore | None]] = [(root_str, root_base, ignore)]
+    while stack:
+        directory, base, ignore = stack.pop()
+        if ignore is not None:
+            ignore = ignore.child(base, _read_gitignore(directory))
+
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            if is_dir:
+                if entry.is_symlink():
+                    continue
+                if exclude is not None and exclude.match(normcase(name)):
+                    continue
+                if ignore is not None and ignore.is_ignored(f"{base}/{name}", True):
+                    continue
+                subdirs.append((entry.path, f"{base}/{name}"))
+                continue
+
+            if not name.endswith(suffixes):
+                continue
+            if exclude is not None and (
+                exclude.match(normcase(name))
+                or exclude.match(normcase(entry.path[prefix_len:]))
+            ):
+                continue
+            if ignore is not None and ignore.is_ignored(f"{base}/{name}", False):
+                continue
+            yield Path(entry.path)
+
+        # Reverse so the stack pops subdirectories in scandir order
+        for sub_path, sub_base in reversed(subdirs):
+            stack.append((sub_path, sub_base, ignore))
+
+
+# --- git index discovery ---
+
+
+def _git_lines(root: Path, *args: str) -> list[str] | None:
+    """Run ``git ls-files -z`` with ``args`` in ``root``; None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", *args],
+            cwd=root,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    out = result.stdout.decode("utf-8", errors="surrogateescape")
+    return [line for line in out.split("\0") if line]
+
+
+def git_sources(
+    root: str | Path,
+    exclude_patterns: list[str],
+    suffixes: tuple[str, ...] = SOURCE_SUFFIXES,
+) -> list[tuple[Path, str | None]] | None:
+    """List source files known to git under ``root``, with blob hashes.
+
+    Tracked files come from the index (``git ls-files -s``) together with
+    their blob ids; untracked files that are not ignored are included
+    without one. Files modified in the working tree, or deleted from it,
+    are handled so a returned blob id always matches what is on disk.
+
+    Args:
+        root: Directory inside a git work tree.
+        exclude_patterns: fnmatch patterns applied to every directory
+            name, and to the file name and relative path.
+        suffixes: File suffixes to include.
+
+    Returns:
+        Sorted list of (path, blob id or None), or None if ``root`` is not
+        inside a git repository or git is unavailable.
+    """
+    root = Path(root)
+    staged = _git_lines(root, "-s")
+    if staged is None:
+        return None
+    untracked = _git_lines(root, "--others", "--exclude-standard") or []
+    modified = set(_git_lines(root, "-m") or [])
+    deleted = set(_git_lines(root, "-d") or [])
+
+    exclude = compile_patterns(exclude_patterns)
+    normcase = os.path.normcase
+
+    def _excluded(rel: str) -> bool:
+        if exclude is None:
+            return False
+        parts = rel.split("/")
+        if any(exclude.match(normcase(part)) for part in parts):
+            return True
+        return exclude.match(normcase(rel.replace("/", os.sep))) is not None
+
+    found: dict[str, str | None] = {}
+    for line in staged:
+        meta, _, rel = line.partition("\t")
+        mode, blob, _stage = meta.split(" ")
+        # Skip submodules and symlinks
+        if mode in ("160000", "120000") or rel in deleted:
+            continue
+        if rel.endswith(suffixes) and not _excluded(rel):
+            clean = _stage == "0" and rel not in modified
+            found[rel] = blob if clean else None
+    for rel in untracked:
+        if rel.endswith(suffixes) and not _excluded(rel):
+            found.setdefault(rel, None)
+
+    return [(root / rel, found[rel]) for rel in sorted(found)]
@@ -0,0 +1,485 @@
+"""Streaming JSON encoding of the documentation model.
+
+The JSON shape of every record type (which fields, in which order, under
+which conditions) is declared once as a field spec. From a spec the
+records can be
+
+- encoded straight to JSON (``dump``/``dumps``), byte-identical to
+  ``json.dump(to_dict(...), indent=2, ensure_ascii=False, default=str)``
+  but without building the dicts first;
+- wrapped in a ``DocView``, a read-only mapping that computes values on
+  access, so code that inspects the JSON structure can run on the live
+  dataclasses;
+- materialized with ``to_dict`` when a plain dict is needed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import IO, Any, Callable, Iterator, NamedTuple
+
+from .types import (
+    ArgDoc,
+    ClassDoc,
+    ConfigFieldDoc,
+    DocType,
+    FunctionDoc,
+    HeaderDoc,
+    MethodDoc,
+    ModuleDoc,
+    PageDoc,
+    ParamDoc,
+    ParsedDocstring,
+    PayloadFieldDoc,
+    RaiseDoc,
+    ResponseDoc,
+    ReturnDoc,
+    TodoDoc,
+)
+
+try:
+    from json.encoder import c_encode_basestring as _encode_str  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    from json.encoder import py_encode_basestring as _encode_str
+
+if _encode_str is None:  # pragma: no cover
+    from json.encoder import py_encode_basestring as _encode_str
+
+
+# --- Field specs ---
+
+
+class _Field(NamedTuple):
+    key: str
+    get: Callable[[Any], Any]
+    # Only emitted when this returns true
+    when: Callable[[Any], Any] | None = None
+    # Spec of the record (or list of records) held by the field
+    spec: _Spec | None = None
+
+
+class _Spec:
+    """Ordered JSON fields of one record type."""
+
+    __slots__ = ("fields", "by_key", "prefixes")
+
+    def __init__(self, *fields: _Field | str):
+        self.fields = tuple(
+            f if isinstance(f, _Field) else _Field(f, attrgetter(f)) for f in fields
+        )
+        self.by_key = {f.key: f for f in self.fields}
+        # '"key": ' for each field
+        self.prefixes = tuple(_encode_str(f.key) + ": " for f in self.fields)
+
+
+def _enum(name: str) -> Callable[[Any], Any]:
+    get = attrgetter(name)
+    return lambda obj: get(obj).value
+
+
+def _nested(name: str, spec: _Spec, when: Callable[[Any], Any] | None = None) -> _Field:
+    return _Field(name, attrgetter(name), when, spec)
+
+
+ARG = _Spec("name", "type", "description", "default", "required")
+TYPED_TEXT = _Spec("type", "description")
+NAMED_FIELD = _Spec("name", "type", "description")
+RESPONSE = _Spec("status_code", "description", _nested("fields", NAMED_FIELD))
+HEADER = _Spec("name", "description", "required", "example")
+CONFIG_FIELD = _Spec("name", "type", "description", "default", "required", "env_var")
+PARAM = _Spec("name", _Field("kind", _enum("kind")), "annotation", "default")
+TODO = _Spec("tag", "text", "file_path", "line_number", "module")
+
+
+def _has_api(d: ParsedDocstring) -> Any:
+    return d.doc_type == DocType.API or d.http_method or d.path
+
+
+def _has_event(d: ParsedDocstring) -> Any:
+    return d.doc_type == DocType.EVENT or d.trigger or d.payload
+
+
+def _has_config(d: ParsedDocstring) -> Any:
+    return d.doc_type == DocType.CONFIG or d.config_fields
+
+
+DOCSTRING = _Spec(
+    "summary",
+    "description",
+    _Field("doc_type", _enum("doc_type")),
+    # Function sections
+    _nested("args", ARG),
+    _nested("returns", TYPED_TEXT),
+    _nested("raises", TYPED_TEXT),
+    "examples",
+    _nested("attributes", ARG),
+    "notes",
+    # API sections
+    _Field("http_method", attrgetter("http_method"), _has_api),
+    _Field("path", attrgetter("path"), _has_api),
+    _nested("path_params", ARG, _has_api),
+    _nested("query_params", ARG, _has_api),
+    _nested("request_body", ARG, _has_api),
+    _nested("responses", RESPONSE, _has_api),
+    _nested("headers", HEADER, _has_api),
+    # Event sections
+    _Field("trigger", attrgetter("trigger"), _has_event),
+    _nested("payload", NAMED_FIELD, _has_event),
+    # Config sections
+    _nested("config_fields", CONFIG_FIELD, _has_config),
+    # Custom sections
+    _Field("custom_sections", attrgetter("custom_sections"), attrgetter("custom_sections")),
+)
+
+_CALLABLE_TAIL = (
+    "source",
+    "line_number",
+    "decorators",
+    "calls",
+    "resolved_calls",
+    _Field("doc_type", _enum("doc_type")),
+    "signature_hash",
+    "body_hash",
+    "complexity",
+    "is_deprecated",
+    "deprecation_message",
+    "deprecation_since",
+    "category",
+    "version",
+    "hidden",
+)
+
+METHOD = _Spec(
+    "name",
+    "module",
+    "signature",
+    _nested("params", PARAM),
+    "return_annotation",
+    _nested("docstring", DOCSTRING),
+    "is_async",
+    "is_classmethod",
+    "is_staticmethod",
+    "is_property",
+    *_CALLABLE_TAIL,
+)
+
+FUNCTION = _Spec(
+    "name",
+    "module",
+    "full_path",
+    "signature",
+    _nested("params", PARAM),
+    "return_annotation",
+    _nested("docstring", DOCSTRING),
+    "is_async",
+    *_CALLABLE_TAIL,
+)
+
+CLASS = _Spec(
+    "name",
+    "module",
+    "full_path",
+    _nested("docstring", DOCSTRING),
+    "bases",
+    _nested("methods", METHOD),
+    "source",
+    "line_number",
+    "decorators",
+    _Field("doc_type", _enum("doc_type")),
+    "signature_hash",
+    "body_hash",
+    "attribute_types",
+)
+
+MODULE = _Spec(
+    "name",
+    "full_path",
+    "file_path",
+    "docstring",
+    _nested("classes", CLASS),
+    _nested("functions", FUNCTION),
+    _nested("todos", TODO),
+    "imports",
+)
+
+PAGE = _Spec("title", "slug", "content", "file_path", "order")
+
+# Spec used for a record found outside a field that names one
+SPECS: dict[type, _Spec] = {
+    ArgDoc: ARG,
+    ReturnDoc: TYPED_TEXT,
+    RaiseDoc: TYPED_TEXT,
+    ResponseDoc: RESPONSE,
+    HeaderDoc: HEADER,
+    PayloadFieldDoc: NAMED_FIELD,
+    ConfigFieldDoc: CONFIG_FIELD,
+    ParamDoc: PARAM,
+    ParsedDocstring: DOCSTRING,
+    MethodDoc: METHOD,
+    FunctionDoc: FUNCTION,
+    ClassDoc: CLASS,
+    TodoDoc: TODO,
+    ModuleDoc: MODULE,
+    PageDoc: PAGE,
+}
+
+
+# --- Views ---
+
+
+class DocView(Mapping[str, Any]):
+    """Read-only JSON-shaped mapping over a documentation record.
+
+    Values are computed on access: nested records come back as views and
+    lists of records as lists of views, so no dict tree is built.
+
+    Args:
+        obj: A record from ``cacaodocs.types``.
+        spec: Field spec; defaults to the spec registered for its type.
+    """
+
+    __slots__ = ("_obj", "_spec")
+
+    def __init__(self, obj: Any, spec: _Spec | None = None):
+        self._obj = obj
+        self._spec = spec if spec is not None else SPECS[type(obj)]
+
+    def __getitem__(self, key: str) -> Any:
+        f = self._spec.by_key.get(key)
+        if f is None or (f.when is not None and not f.when(self._obj)):
+            raise KeyError(key)
+        return _view_value(f.get(self._obj), f.spec)
+
+    def __iter__(self) -> Iterator[str]:
+        obj = self._obj
+        return (f.key for f in self._spec.fields if f.when is None or f.when(obj))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"DocView({self._obj!r})"
+
+
+def _view_value(value: Any, spec: _Spec | None) -> Any:
+    if spec is None or value is None:
+        return value
+    if isinstance(value, list):
+        return [DocView(v, spec) for v in value]
+    return DocView(value, spec)
+
+
+def to_dict(obj: Any, spec: _Spec | None = None) -> dict[str, Any]:
+    """Materialize a record (or DocView) as plain dicts and lists."""
+    if isinstance(obj, DocView):
+        obj, spec = obj._obj, obj._spec
+    spec = spec if spec is not None else SPECS[type(obj)]
+    result = {}
+    for f in spec.fields:
+        if f.when is not None and not f.when(obj):
+            continue
+        value = f.get(obj)
+        if f.spec is not None and value is not None:
+            if isinstance(value, list):
+                value = [to_dict(v, f.spec) for v in value]
+            else:
+                value = to_dict(value, f.spec)
+        result[f.key] = value
+    return result
+
+
+# --- Encoding ---
+
+
+def _float_repr(o: float) -> str:
+    if o != o:
+        return "NaN"
+    if o == float("inf"):
+        return "Infinity"
+    if o == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(o)
+
+
+def _key_str(key: Any) -> str:
+    """Convert a dict key the way ``json`` does."""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float):
+        return _float_repr(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+class DocEncoder:
+    """Encode documentation data, records included, as indented JSON.
+
+    Output matches ``json.dump(data, indent=indent, ensure_ascii=False,
+    default=default)`` with every record replaced by ``to_dict(record)``.
+
+    Args:
+        indent: Spaces per nesting level.
+        default: Called for objects JSON cannot represent; its result is
+            encoded instead.
+    """
+
+    def __init__(self, indent: int = 2, default: Callable[[Any], Any] = str):
+        self.indent = " " * indent
+        self.default = default
+        self._newlines: list[str] = []
+
+    def _newline(self, level: int) -> str:
+        newlines = self._newlines
+        while len(newlines) <= level:
+            newlines.append("\n" + self.indent * len(newlines))
+        return newlines[level]
+
+    def encode(self, obj: Any) -> str:
+        """Return ``obj`` as a JSON string."""
+        chunks: list[str] = []
+        self._value(obj, None, 0, chunks.append)
+        return "".join(chunks)
+
+    def dump(self, obj: Any, fp: IO[str], buffer: int = 4096) -> None:
+        """Write ``obj`` to a text file, ``buffer`` chunks at a time."""
+        chunks: list[str] = []
+
+        def write(chunk: str) -> None:
+            chunks.append(chunk)
+            if len(chunks) >= buffer:
+                fp.write("".join(chunks))
+                chunks.clear()
+
+        self._value(obj, None, 0, write)
+        fp.write("".join(chunks))
+
+    def _value(
+        self, v: Any, spec: _Spec | None, level: int, write: Callable[[str], Any]
+    ) -> None:
+        if spec is not None and v is not None:
+            if isinstance(v, list):
+                self._records(v, spec, level, write)
+            else:
+                self._record(v, spec, level, write)
+            return
+        t = type(v)
+        if t is str:
+            write(_encode_str(v))
+        elif v is None:
+            write("null")
+        elif v is True:
+            write("true")
+        elif v is False:
+            write("false")
+        elif t is list or t is tuple:
+            self._list(v, level, write)
+        elif t is dict:
+            self._dict(v, level, write)
+        elif t is DocView:
+            self._record(v._obj, v._spec, level, write)
+        elif t in SPECS:
+            self._record(v, SPECS[t], level, write)
+        elif isinstance(v, str):
+            write(_encode_str(v))
+        elif isinstance(v, int):
+            write(int.__repr__(v))
+        elif isinstance(v, float):
+            write(_float_repr(v))
+        elif isinstance(v, (list, tuple)):
+            self._list(v, level, write)
+        elif isinstance(v, dict):
+            self._dict(v, level, write)
+        else:
+            self._value(self.default(v), None, level, write)
+
+    def _record(
+        self, obj: Any, spec: _Spec, level: int, write: Callable[[str], Any]
+    ) -> None:
+        inner = self._newline(level + 1)
+        sep = "{" + inner
+        for f, prefix in zip(spec.fields, spec.prefixes):
+            if f.when is not None and not f.when(obj):
+                continue
+            write(sep + prefix)
+            sep = "," + inner
+            self._value(f.get(obj), f.spec, level + 1, write)
+        write(self._newline(level) + "}")
+
+    def _records(
+        self, items: list[Any], spec: _Spec, level: int, write: Callable[[str], Any]
+    ) -> None:
+        if not items:
+            write("[]")
+            return
+        inner = self._newline(level + 1)
+        write("[" + inner)
+        first = True
+        for item in items:
+            if not first:
+                write("," + inner)
+            first = False
+            self._record(item, spec, level + 1, write)
+        write(self._newline(level) + "]")
+
+    def _list(self, items: Any, level: int, write: Callable[[str], Any]) -> None:
+        if not items:
+            write("[]")
+            return
+        inner = self._newline(level + 1)
+        if all(type(i) is str for i in items):
+            write("[" + inner + ("," + inner).join(map(_encode_str, items)))
+            write(self._newline(level) + "]")
+            return
+        write("[" + inner)
+        first = True
+        for item in items:
+            if not first:
+                write("," + inner)
+            first = False
+            self._value(item, None, level + 1, write)
+        write(self._newline(level) + "]")
+
+    def _dict(self, items: dict[Any, Any], level: int, write: Callable[[str], Any]) -> None:
+        if not items:
+            write("{}")
+            return
+        inner = self._newline(level + 1)
+        if all(type(v) is str and type(k) is str for k, v in items.items()):
+            write(
+                "{"
+                + inner
+                + ("," + inner).join(
+                    f"{_encode_str(k)}: {_encode_str(v)}" for k, v in items.items()
+                )
+            )
+            write(self._newline(level) + "}")
+            return
+        write("{" + inner)
+        first = True
+        for k, v in items.items():
+            if not first:
+                write("," + inner)
+            first = False
+            write(_encode_str(_key_str(k)) + ": ")
+            self._value(v, None, level + 1, write)
+        write(self._newline(level) + "}")
+
+
+def dumps(obj: Any, indent: int = 2, default: Callable[[Any], Any] = str) -> str:
+    """Encode ``obj`` (which may contain records and DocViews) as JSON."""
+    return DocEncoder(indent, default).encode(obj)
+
+
+def dump(
+    obj: Any, fp: IO[str], indent: int = 2, default: Callable[[Any], Any] = str
+) -> None:
+    """Stream ``obj`` (which may contain records and DocViews) to ``fp``."""
+    DocEncoder(indent, default).dump(obj, fp)
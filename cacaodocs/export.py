@@ -0,0 +1,527 @@
+"""Static export of a built documentation site.
+
+``cacaodocs export`` runs ``cacao build`` on the generated app in a staging
+directory and copies the result into the export directory through a
+``BuildManifest`` (``.cacaodocs-export.json``), so only files whose bytes
+changed are replaced and files the site no longer produces are removed.
+An export whose build outputs and options are unchanged stops before
+running Cacao. Otherwise the whole site is rebuilt; only the writes are
+skipped.
+
+Sharding (the default) moves the contents of every panel out of the page
+tree that Cacao embeds in ``index.html`` into ``panels/<key>.<hash>.json``
+files, fetched when the panel is first shown. A search index over the
+documented names is split by term prefix into ``search/<prefix>.<hash>.json``
+and queried from the command palette (Ctrl+K). A root ``manifest.json``
+maps panel keys and prefixes to their shard files. Shard names change
+only with their contents, so they can be cached indefinitely.
+
+With ``precompress``, ``embeddings.json`` and Cacao's script and
+stylesheets are published under content-hashed names as well (mapped in
+the root manifest's ``files``, and linked under those names from the
+HTML), and every text asset gets a reproducible ``.gz`` sibling for hosts
+that serve precompressed files (nginx ``gzip_static``, CDNs).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import re
+import subprocess
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from .manifest import BuildManifest
+
+EXPORT_MANIFEST = ".cacaodocs-export.json"
+
+# Root manifest of a sharded site, read by the browser
+SITE_MANIFEST = "manifest.json"
+PANEL_DIR = "panels"
+SEARCH_DIR = "search"
+
+# Search terms are grouped into shards by their first characters
+SEARCH_PREFIX = 2
+
+# Assets that get a precompressed .gz sibling, and the size below which
+# compressing is not worth it
+COMPRESSIBLE = (".html", ".js", ".css", ".json", ".svg", ".txt")
+COMPRESS_MIN_SIZE = 1024
+
+# Cacao's script and stylesheets at the root of a site (cacao.js, cacao.css,
+# cacao-core.css, cacao-cat-<category>.css)
+CACAO_ASSETS = re.compile(r"cacao(?:-[\w-]+)?\.(?:js|css)")
+
+# Build outputs the exported site is generated from
+SOURCE_FILES = ("app.py", "data.json", "embeddings.json")
+
+
+def _hash(value: Any) -> str:
+    text = json.dumps(
+        value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+# --- Sharding ---
+
+# Page tree assignment written by `cacao build`
+_PAGES_MARKER = "window.__CACAO_PAGES__ = "
+
+# Loads panel shards on first display and answers command palette queries
+# from the search shards. Runs after cacao.js, before the app mounts.
+_LOADER_JS = """\
+(function () {
+  var h = React.createElement;
+  var base = (window.__CACAO_BASE_PATH__ || ".") + "/";
+  var files = {};
+  function load(file) {
+    if (!files[file]) {
+      files[file] = fetch(base + file).then(function (r) {
+        if (!r.ok) throw new Error(r.status + " " + file);
+        return r.json();
+      });
+    }
+    return files[file];
+  }
+  function render(comp, key, p) {
+    var R = comp && Cacao.renderers[comp.type];
+    if (!R) return null;
+    var props = comp.props || {};
+    var el = h(R, {
+      key: key, props: props, type: comp.type,
+      setActiveTab: p.setActiveTab, activeTab: p.activeTab,
+      children: (comp.children || []).map(function (c, i) { return render(c, i, p); })
+    });
+    return props.id ? React.cloneElement(el, {id: props.id}) : el;
+  }
+  var NavPanel = Cacao.renderers.NavPanel;
+  Cacao.registerComponent("NavPanel", function (p) {
+    var file = p.props.shard;
+    var active = p.props.panelKey === p.activeTab;
+    var st = React.useState(null), tree = st[0], setTree = st[1];
+    React.useEffect(function () {
+      if (active && file && !tree) load(file).then(setTree, console.error);
+    }, [active, file]);
+    if (!file) return h(NavPanel, p);
+    if (!active) return null;
+    var children = tree
+      ? tree.map(function (c, i) { return render(c, i, p); })
+      : [h("div", {key: 0, className: "loading"}, "Loading...")];
+    return h(NavPanel, Object.assign({}, p, {children: children}));
+  });
+
+  var searched = {};
+  function refresh(input) {
+    var set = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    var value = input.value;
+    [value + " ", value].forEach(function (v) {
+      set.call(input, v);
+      input.dispatchEvent(new Event("input", {bubbles: true}));
+    });
+  }
+  document.addEventListener("input", function (e) {
+    var input = e.target;
+    if (!input.closest || !input.closest(".cmd-palette-overlay")) return;
+    var q = input.value.trim().toLowerCase();
+    if (q.length < %(prefix)d || searched[q]) return;
+    searched[q] = true;
+    load("%(manifest)s").then(function (m) {
+      var file = m.search[q.slice(0, %(prefix)d)];
+      return file ? load(file) : {};
+    }).then(function (index) {
+      var seen = {}, added = 0;
+      Object.keys(index).forEach(function (term) {
+        if (term.indexOf(q) !== 0) return;
+        index[term].forEach(function (hit) {
+          var id = "doc:" + hit[1] + ":" + hit[0];
+          if (added >= 50 || seen[id]) return;
+          seen[id] = true;
+          added++;
+          Cacao.registerCommand(id, hit[0], function () {
+            window.location.hash = "#/" + hit[1];
+          });
+        });
+      });
+      if (added && input.value.trim().toLowerCase() === q) refresh(input);
+    }, console.error);
+  });
+})();
+""" % {"prefix": SEARCH_PREFIX, "manifest": SITE_MANIFEST}
+
+
+def _shard_name(directory: str, stem: str, payload: bytes) -> str:
+    stem = re.sub(r"[^A-Za-z0-9_.-]", "_", stem)
+    return f"{directory}/{stem}.{hashlib.sha256(payload).hexdigest()[:12]}.json"
+
+
+def _dump(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _site_manifest() -> dict[str, Any]:
+    # panels: panel key -> shard, search: term prefix -> shard,
+    # files: logical name -> fingerprinted name
+    return {"version": 1, "panels": {}, "search": {}, "files": {}}
+
+
+def search_terms(name: str) -> set[str]:
+    """Lowercase search terms for an identifier or title.
+
+    The whole name is a term, and so is every word of it: ``ScanCache``
+    gives ``scancache``, ``scan`` and ``cache``; ``scan_directory`` gives
+    ``scan_directory``, ``scan`` and ``directory``.
+    """
+    words = re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+", name)
+    terms = {w.lower() for w in words}
+    terms.update(w.lower() for w in re.findall(r"\w+", name))
+    return {t for t in terms if t}
+
+
+def search_index(
+    data: Mapping[str, Any], panels: set[str]
+) -> dict[str, dict[str, list]]:
+    """Term index of documented names, split into shards by term prefix.
+
+    Args:
+        data: Parsed ``data.json``.
+        panels: Keys of the panels present in the site; entries pointing
+            elsewhere are dropped.
+
+    Returns:
+        ``{prefix: {term: [[label, panel key], ...]}}``.
+    """
+    entries: list[tuple[str, str, str]] = []
+    for mod in data.get("modules", []):
+        label = f"{mod['full_path']} (module)"
+        entries.append((mod["name"], label, f"mod_{mod['full_path']}"))
+    for cls in data.get("classes", []):
+        panel = f"mod_{cls.get('module', '')}"
+        entries.append((cls["name"], f"{cls['full_path']} (class)", panel))
+        for method in cls.get("methods", []):
+            label = f"{cls['full_path']}.{method['name']} (method)"
+            entries.append((method["name"], label, panel))
+    for func in data.get("functions", []):
+        label = f"{func['full_path']} (function)"
+        entries.append((func["name"], label, f"mod_{func.get('module', '')}"))
+    for ep in data.get("api_endpoints", []):
+        entries.append((ep["name"], f"{ep['full_path']} (endpoint)", "api_ref"))
+    for page in data.get("pages", []):
+        title = page.get("title", "")
+        entries.append((title, f"{title} (page)", f"page_{page['slug']}"))
+
+    shards: dict[str, dict[str, list]] = {}
+    for name, label, panel in entries:
+        if panel not in panels:
+            continue
+        for term in sorted(search_terms(name)):
+            shard = shards.setdefault(term[:SEARCH_PREFIX], {})
+            shard.setdefault(term, []).append([label, panel])
+    return {prefix: shards[prefix] for prefix in sorted(shards)}
+
+
+def _walk(nodes: list[Any]):
+    for node in nodes:
+        if isinstance(node, list):
+            yield from _walk(node)
+        elif isinstance(node, dict):
+            yield node
+            yield from _walk(node.get("children") or [])
+
+
+def shard_site(
+    site: str | Path, data: Mapping[str, Any] | None = None
+) -> dict[str, Any] | None:
+    """Split a ``cacao build`` site into panel and search shards, in place.
+
+    Args:
+        site: Directory produced by ``cacao build``.
+        data: Parsed ``data.json`` for the search index (none if omitted).
+
+    Returns:
+        The root manifest written to ``manifest.json``, or None if the
+        site's HTML does not have the expected shape (it is then left as
+        it is).
+    """
+    site = Path(site)
+    pages_files = [site / name for name in ("index.html", "404.html")]
+    manifest = _site_manifest()
+    html_out: dict[Path, str] = {}
+    for path in pages_files:
+        if not path.exists():
+            continue
+        html = path.read_text(encoding="utf-8")
+        start = html.find(_PAGES_MARKER)
+        if start < 0:
+            return None
+        start += len(_PAGES_MARKER)
+        try:
+            tree, end = json.JSONDecoder().raw_decode(html, start)
+        except ValueError:
+            return None
+        # The loader goes in before the script that mounts the app. Search
+        # after the page tree: docstrings in it may mention the same call.
+        script = html.rfind("<script>", end, html.find("Cacao.initStatic(", end))
+        if script < 0:
+            return None
+
+        for node in _walk(list(tree.get("pages", {}).values())):
+            children = node.get("children")
+            if node.get("type") != "NavPanel" or not children:
+                continue
+            key = node.get("props", {}).get("panelKey", "")
+            payload = _dump(children)
+            name = _shard_name(PANEL_DIR, key, payload)
+            (site / PANEL_DIR).mkdir(exist_ok=True)
+            (site / name).write_bytes(payload)
+            node["children"] = []
+            node["props"]["shard"] = name
+            manifest["panels"][key] = name
+
+        html_out[path] = (
+            html[:start]
+            + json.dumps(tree).replace("</", "<\\/")
+            + html[end:script]
+            + f"<script>\n{_LOADER_JS}</script>\n\n    "
+            + html[script:]
+        )
+    if not html_out:
+        return None
+
+    if data is not None:
+        for prefix, terms in search_index(data, set(manifest["panels"])).items():
+            payload = _dump(terms)
+            name = _shard_name(SEARCH_DIR, prefix, payload)
+            (site / SEARCH_DIR).mkdir(exist_ok=True)
+            (site / name).write_bytes(payload)
+            manifest["search"][prefix] = name
+
+    for path, html in html_out.items():
+        path.write_text(html, encoding="utf-8")
+    (site / SITE_MANIFEST).write_bytes(_dump(manifest))
+    return manifest
+
+
+# --- Precompression ---
+
+
+def fingerprint(name: str, payload: bytes) -> str:
+    """Content-hashed name of a file: ``a/b.json`` -> ``a/b.<hash>.json``."""
+    digest = hashlib.sha256(payload).hexdigest()[:12]
+    path = Path(name)
+    return path.with_name(f"{path.stem}.{digest}{path.suffix}").as_posix()
+
+
+def fingerprint_assets(site: str | Path) -> dict[str, str]:
+    """Rename Cacao's script and stylesheets to content-hashed names, in place.
+
+    The ``src`` and ``href`` attributes that load them from ``index.html``
+    and ``404.html`` are rewritten to the new names.
+
+    Args:
+        site: Directory produced by ``cacao build``.
+
+    Returns:
+        Logical to published names of the renamed files.
+    """
+    site = Path(site)
+    files = {}
+    for path in sorted(site.iterdir()):
+        if path.is_file() and CACAO_ASSETS.fullmatch(path.name):
+            name = fingerprint(path.name, path.read_bytes())
+            path.rename(site / name)
+            files[path.name] = name
+    if not files:
+        return files
+
+    names = "|".join(re.escape(name) for name in files)
+    link = re.compile(rf'((?:src|href)="[^"]*/)({names})"')
+    for page in ("index.html", "404.html"):
+        path = site / page
+        if path.exists():
+            html = path.read_text(encoding="utf-8")
+            html = link.sub(lambda m: f'{m[1]}{files[m[2]]}"', html)
+            path.write_text(html, encoding="utf-8")
+    return files
+
+
+def precompress_site(site: str | Path) -> list[str]:
+    """Write a gzip-compressed ``.gz`` sibling of every text asset of a site.
+
+    The archives carry no timestamp or file name, so unchanged files give
+    byte-identical ``.gz`` files. Files smaller than
+    ``COMPRESS_MIN_SIZE`` or that do not shrink are skipped.
+
+    Args:
+        site: Static site directory.
+
+    Returns:
+        Relative names of the ``.gz`` files written.
+    """
+    site = Path(site)
+    written = []
+    for path in sorted(site.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE:
+            continue
+        data = path.read_bytes()
+        if len(data) < COMPRESS_MIN_SIZE:
+            continue
+        packed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(packed) >= len(data):
+            continue
+        target = path.with_name(path.name + ".gz")
+        target.write_bytes(packed)
+        written.append(target.relative_to(site).as_posix())
+    return written
+
+
+def _cacao_version() -> str:
+    try:
+        return version("cacao")
+    except PackageNotFoundError:
+        return ""
+
+
+def cacao_build(app_file: Path, output: Path, base_path: str = "") -> None:
+    """Run ``cacao build`` for ``app_file`` into ``output``.
+
+    Cacao's console output is captured (it names the staging directory).
+
+    Raises:
+        FileNotFoundError: The ``cacao`` command is not installed.
+        subprocess.CalledProcessError: The static build failed; its
+            ``output`` holds Cacao's messages.
+    """
+    cmd = ["cacao", "build", str(app_file), "-o", str(output)]
+    if base_path:
+        cmd.extend(["--base-path", base_path])
+    subprocess.run(
+        cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+
+def export_site(
+    directory: str | Path,
+    output: str | Path,
+    base_path: str = "",
+    build: Callable[[Path, Path, str], None] = cacao_build,
+    shard: bool = True,
+    precompress: bool = False,
+) -> dict[str, Any]:
+    """Export a built documentation app as a static site.
+
+    Args:
+        directory: Build output holding ``app.py`` and ``data.json``.
+        output: Static site directory. Files not written by an export
+            are left alone.
+        base_path: Base path for deployment (e.g. ``/my-repo``).
+        build: Callable(app_file, staging_dir, base_path) that renders
+            the site into ``staging_dir``.
+        shard: Split panels and the search index into shards loaded on
+            demand (see ``shard_site``). Without it every panel stays in
+            ``index.html``, which also works when opened from disk. If
+            the site's HTML is not in the shape sharding expects, it is
+            exported unsharded with a warning.
+        precompress: Publish ``embeddings.json``, ``cacao.js`` and
+            Cacao's stylesheets under fingerprinted names and write
+            ``.gz`` siblings of the text assets (see ``fingerprint_assets``
+            and ``precompress_site``).
+
+    Returns:
+        Dict with ``up_to_date``, ``sharded``, ``compressed`` (the
+        ``.gz`` file names), ``files`` (logical to published names of
+        the fingerprinted files), ``warnings`` (messages for the user), and the
+        ``written``, ``unchanged`` and ``removed`` file names.
+    """
+    from . import __version__
+
+    directory = Path(directory)
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    docs = BuildManifest.for_output(directory)
+    sources = {name: docs.digest(name) for name in SOURCE_FILES}
+    inputs = _hash(
+        {
+            "sources": sources,
+            "base_path": base_path,
+            "shard": shard,
+            "precompress": precompress,
+            "versions": [__version__, _cacao_version()],
+        }
+    )
+    site = BuildManifest.for_output(output, EXPORT_MANIFEST)
+    if site.is_current(inputs):
+        return {
+            "up_to_date": True,
+            "sharded": site.summary.get("sharded", False),
+            "compressed": site.summary.get("compressed", []),
+            "files": site.summary.get("files", {}),
+            "warnings": site.summary.get("warnings", []),
+            "written": [],
+            "unchanged": site.unchanged,
+            "removed": [],
+        }
+
+    try:
+        with open(directory / "data.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+
+    with tempfile.TemporaryDirectory(prefix="cacaodocs-export-") as tmp:
+        staging = Path(tmp)
+        build(directory / "app.py", staging, base_path)
+        manifest = shard_site(staging, data) if shard else None
+        warnings = []
+        if shard and manifest is None:
+            warnings.append(
+                "Sharding skipped: the HTML written by cacao build does not have "
+                "the expected page tree and mount script. Every panel stays in "
+                "index.html."
+            )
+
+        files = fingerprint_assets(staging) if precompress else {}
+
+        # Embeddings for RAG chat
+        if sources["embeddings.json"] is not None:
+            payload = (directory / "embeddings.json").read_bytes()
+            name = "embeddings.json"
+            if precompress:
+                name = fingerprint(name, payload)
+                files["embeddings.json"] = name
+            (staging / name).write_bytes(payload)
+        if files:
+            manifest = manifest or _site_manifest()
+            manifest["files"] = files
+            (staging / SITE_MANIFEST).write_bytes(_dump(manifest))
+
+        compressed = precompress_site(staging) if precompress else []
+        for path in sorted(staging.rglob("*")):
+            if path.is_file():
+                name = path.relative_to(staging).as_posix()
+                site.write_bytes(name, path.read_bytes())
+
+    removed = site.prune()
+    sharded = bool(manifest and manifest["panels"])
+    site.summary = {
+        "sharded": sharded,
+        "compressed": compressed,
+        "files": files,
+        "warnings": warnings,
+    }
+    site.save(inputs)
+    return {
+        "up_to_date": False,
+        "sharded": sharded,
+        "compressed": compressed,
+        "files": files,
+        "warnings": warnings,
+        "written": site.changed,
+        "unchanged": site.unchanged,
+        "removed": removed,
+    }
@@ -0,0 +1,290 @@
+"""Content-addressed syntax-highlight cache.
+
+Highlighted HTML is keyed by a hash of the Pygments token stream, the
+formatter and its options (style, line numbers, CSS class, ...) together
+with the Pygments version, so identical snippets are formatted once no
+matter which page they come from. The cache is a bounded LRU that can be
+persisted in the build cache directory and reused by later builds.
+
+The cache plugs into Markdown through the documented
+``pygments_formatter`` setting of ``codehilite``, which ``fenced_code``
+honours too: ``CachedCodeHiliteExtension`` is a drop-in replacement for
+``codehilite`` whose output is identical to it. Lexing happens before a
+formatter runs, so it is not saved; unchanged pages are not lexed again
+because the page renderer caches whole pages.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    from markdown.extensions.codehilite import (  # type: ignore[import-untyped]
+        CodeHilite,
+        CodeHiliteExtension,
+    )
+
+    _HAS_MARKDOWN = True
+except ImportError:
+    _HAS_MARKDOWN = False
+
+# Bump when the cached HTML changes shape
+HIGHLIGHT_VERSION = 2
+
+HIGHLIGHT_FILE = "highlight.json"
+
+
+def _pygments_version() -> str:
+    try:
+        import pygments
+
+        return pygments.__version__
+    except ImportError:
+        return ""
+
+
+class HighlightCache:
+    """Bounded LRU of highlighted HTML keyed by content hash.
+
+    Args:
+        max_entries: Entries kept before the least recently used ones are
+            evicted.
+        entries: Initial (key, html) pairs, oldest first.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        entries: Iterable[tuple[str, str]] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.path: Path | None = None
+        self._entries: OrderedDict[str, str] = OrderedDict(entries or ())
+        self._prefix = f"{HIGHLIGHT_VERSION}|{_pygments_version()}|".encode()
+        # Entries created since the last ``take_added`` call
+        self._added: list[tuple[str, str]] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._evict()
+
+    @classmethod
+    def in_dir(cls, directory: str | Path, max_entries: int = 4096) -> HighlightCache:
+        """Open the cache stored in ``directory`` (see ``cache.cache_dir``)."""
+        cache = cls(max_entries)
+        cache.path = Path(directory) / HIGHLIGHT_FILE
+        cache.load(cache.path)
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def key(self, formatter: type, options: dict[str, Any], tokens: list[Any]) -> str:
+        """Cache key for ``tokens`` formatted by ``formatter`` with ``options``."""
+        opts = repr(sorted(options.items(), key=lambda kv: kv[0]))
+        name = f"{formatter.__module__}.{formatter.__qualname__}"
+        digest = hashlib.sha256(self._prefix + f"{name}|{opts}".encode())
+        for ttype, value in tokens:
+            digest.update(f"\0{ttype}\0".encode())
+            digest.update(value.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the HTML stored under ``key``, marking it recently used."""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def put(self, key: str, html: str) -> None:
+        """Store highlighted HTML, evicting the oldest entries if full."""
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            self._added.append((key, html))
+            self._dirty = True
+            self._evict()
+
+    def merge(self, items: Iterable[tuple[str, str]]) -> None:
+        """Add entries produced elsewhere (e.g. by a worker process)."""
+        for key, html in items:
+            self.put(key, html)
+
+    def take_added(self) -> list[tuple[str, str]]:
+        """Return and forget the entries created since the last call."""
+        with self._lock:
+            added, self._added = self._added, []
+        return added
+
+    def items(self) -> list[tuple[str, str]]:
+        """All entries, least recently used first."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # --- Highlighting ---
+
+    def highlight(self, code: str, lang: str | None = None, **options: Any) -> str:
+        """Highlight ``code`` the way ``codehilite`` would, via the cache.
+
+        Args:
+            code: Source text.
+            lang: Pygments lexer name; None guesses it from the code.
+            **options: ``CodeHilite`` options (``linenums``,
+                ``pygments_style``, ``css_class``, ...).
+
+        Returns:
+            HTML, or the escaped code in a ``<pre>`` if Markdown is not
+            installed.
+        """
+        if not _HAS_MARKDOWN:
+            from html import escape
+
+            return f"<pre><code>{escape(code)}</code></pre>"
+        style = options.pop("pygments_style", "default")
+        formatter = self.formatter(options.pop("pygments_formatter", "html"))
+        return CodeHilite(
+            code, lang=lang, style=style, pygments_formatter=formatter, **options
+        ).hilite(shebang=False)
+
+    def formatter(self, name: Any = "html") -> Any:
+        """Pygments formatter class whose output is cached here.
+
+        For ``codehilite``'s ``pygments_formatter`` setting. Its output is
+        keyed by the token stream and the formatter options, so a block is
+        still lexed, but formatted only once.
+
+        Args:
+            name: Formatter name or class to wrap, as ``pygments_formatter``
+                takes it. Returned as is if Pygments is not installed.
+        """
+        base = _formatter_base(name)
+        if base is None:
+            return name
+        cache = self
+
+        class CachedFormatter(base):  # type: ignore[misc, valid-type]
+            def format(self, tokensource: Iterable[Any], outfile: Any) -> None:
+                tokens = list(tokensource)
+                key = cache.key(base, self.options, tokens)
+                html = cache.get(key)
+                if html is None:
+                    buffer = io.StringIO()
+                    super().format(tokens, buffer)
+                    html = buffer.getvalue()
+                    cache.put(key, html)
+                outfile.write(html)
+
+        return CachedFormatter
+
+    # --- Persistence ---
+
+    def load(self, path: str | Path) -> None:
+        """Load entries from ``path``, ignoring missing or corrupt files."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != HIGHLIGHT_VERSION:
+            return
+        entries = data.get("entries")
+        if not isinstance(entries, list):
+            return
+        with self._lock:
+            stored = OrderedDict(
+                (entry[0], entry[1])
+                for entry in entries
+                if isinstance(entry, list)
+                and len(entry) == 2
+                and isinstance(entry[0], str)
+                and isinstance(entry[1], str)
+            )
+            stored.update(self._entries)
+            self._entries = stored
+            self._evict()
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Write entries to ``path`` (default: where they were loaded from).
+
+        Nothing is written if no entry was added since loading.
+        """
+        path = Path(path) if path is not None else self.path
+        if path is None or not self._dirty:
+            return
+        from .cache import prepare_cache_dir
+
+        prepare_cache_dir(path.parent)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": HIGHLIGHT_VERSION, "entries": self.items()},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp, path)
+        self._dirty = False
+
+
+# --- Markdown integration ---
+
+
+def _formatter_base(name: Any) -> Any:
+    """Pygments formatter class for a ``pygments_formatter`` setting.
+
+    Returns None if Pygments is not installed.
+    """
+    if not isinstance(name, str):
+        return name
+    try:
+        from pygments.formatters import HtmlFormatter, find_formatter_class
+    except ImportError:
+        return None
+
+    # codehilite falls back to HTML for unknown names too
+    return find_formatter_class(name) or HtmlFormatter
+
+
+if _HAS_MARKDOWN:
+
+    class CachedCodeHiliteExtension(CodeHiliteExtension):
+        """``codehilite`` with formatted blocks served from a HighlightCache.
+
+        Fenced and indented blocks go through Markdown's own processors;
+        only the ``pygments_formatter`` setting is replaced, by a formatter
+        class from ``HighlightCache.formatter``.
+
+        Args:
+            cache: Cache to use; a private one is created if omitted.
+            **kwargs: ``codehilite`` configuration.
+        """
+
+        def __init__(self, cache: HighlightCache | None = None, **kwargs: Any):
+            super().__init__(**kwargs)
+            self.cache = cache if cache is not None else HighlightCache()
+            self.setConfig(
+                "pygments_formatter",
+                self.cache.formatter(self.getConfig("pygments_formatter")),
+            )
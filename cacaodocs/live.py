@@ -0,0 +1,361 @@
+"""Live reload of a served documentation app.
+
+``cacaodocs serve`` watches the build manifest (``manifest.json``, see
+``cacaodocs.manifest``) of the docs it serves. The builder saves the
+manifest after every other output, so when it records new inputs the
+build is complete. The app is then rendered again from the new
+``app.py``/``data.json`` in a background thread and swapped into the
+running Cacao app in one step: requests in flight keep the tree they
+started with, new ones get the new one, and websocket sessions stay
+connected.
+
+Open pages follow along through ``/_cacaodocs/changes``, a long poll
+answered when the content hash of the site changes. The answer carries a
+hash per panel, and the page refetches only the panels whose hash
+changed; it reloads fully only if the navigation itself changed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import traceback
+from pathlib import Path
+from typing import Any
+
+from .manifest import MANIFEST_FILE, BuildManifest
+
+# Seconds between checks of the build manifest
+POLL_INTERVAL = 0.2
+
+# Seconds a /changes request waits for a new build before answering
+LONG_POLL_TIMEOUT = 15.0
+
+ROUTE_PREFIX = "/_cacaodocs"
+
+# App attributes replaced by those of the newly rendered app
+SWAPPED_ATTRS = (
+    "_pages",
+    "events",
+    "title",
+    "theme",
+    "branding",
+    "_custom_themes",
+    "_shortcuts",
+)
+
+# Refetches changed panels in open pages. Loaded after cacao.js.
+LIVE_JS = """\
+(function () {
+  var h = React.createElement;
+  var base = "%(prefix)s";
+  var fresh = {}, listeners = {};
+  var state = null;
+  function render(comp, key, p) {
+    var R = comp && Cacao.renderers[comp.type];
+    if (!R) return null;
+    var props = comp.props || {};
+    var el = h(R, {
+      key: key, props: props, type: comp.type,
+      setActiveTab: p.setActiveTab, activeTab: p.activeTab,
+      children: (comp.children || []).map(function (c, i) { return render(c, i, p); })
+    });
+    return props.id ? React.cloneElement(el, {id: props.id}) : el;
+  }
+  var NavPanel = Cacao.renderers.NavPanel;
+  Cacao.registerComponent("NavPanel", function (p) {
+    var key = p.props.panelKey;
+    var bump = React.useState(0)[1];
+    React.useEffect(function () {
+      var fn = function () { bump(function (n) { return n + 1; }); };
+      (listeners[key] = listeners[key] || []).push(fn);
+      return function () { listeners[key].splice(listeners[key].indexOf(fn), 1); };
+    }, [key]);
+    if (!fresh[key]) return h(NavPanel, p);
+    var children = fresh[key].map(function (c, i) { return render(c, i, p); });
+    return h(NavPanel, Object.assign({}, p, {children: children}));
+  });
+
+  function json(url) {
+    return fetch(url).then(function (r) {
+      if (!r.ok) throw new Error(r.status + " " + url);
+      return r.json();
+    });
+  }
+  function apply(next) {
+    if (!state || next.version === state.version) return Promise.resolve(next);
+    if (next.nav !== state.nav) {
+      window.location.reload();
+      return new Promise(function () {});
+    }
+    var keys = Object.keys(next.panels).filter(function (k) {
+      return state.panels[k] !== next.panels[k];
+    });
+    if (!keys.length) return Promise.resolve(next);
+    if (keys.length > 50) {
+      window.location.reload();
+      return new Promise(function () {});
+    }
+    return json(base + "/panels?keys=" + keys.map(encodeURIComponent).join(","))
+      .then(function (res) {
+        // Another worker may not have switched yet; ask again
+        if (res.version !== next.version) return state;
+        keys.forEach(function (k) {
+          fresh[k] = res.panels[k] || [];
+          (listeners[k] || []).forEach(function (fn) { fn(); });
+        });
+        return next;
+      });
+  }
+  function poll() {
+    var url = base + "/changes" + (state ? "?since=" + state.version : "");
+    json(url).then(apply).then(function (next) {
+      var retry = state && next === state;
+      state = next;
+      setTimeout(poll, retry ? 300 : 0);
+    }, function () { setTimeout(poll, 2000); });
+  }
+  poll();
+})();
+""" % {"prefix": ROUTE_PREFIX}
+
+
+def _hash(value: Any) -> str:
+    text = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _split_panels(nodes: list[Any], panels: dict[str, list]) -> None:
+    """Move NavPanel children into ``panels``, by panel key."""
+    for node in nodes:
+        if isinstance(node, list):
+            _split_panels(node, panels)
+        elif isinstance(node, dict):
+            if node.get("type") == "NavPanel":
+                key = node.get("props", {}).get("panelKey", "")
+                panels[key] = node.get("children") or []
+                node["children"] = []
+            else:
+                _split_panels(node.get("children") or [], panels)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def render_app(app_file: Path) -> Any:
+    """Run a generated ``app.py`` again and return the Cacao app it defines.
+
+    The module runs against a fresh simple-mode app; the global app that
+    the server uses is restored afterwards.
+    """
+    import cacao
+    import cacao.simple as simple
+    from cacao.cli.runner import load_app_module
+
+    # Importing the cacao.config submodule (which Cacao does to read
+    # cacao.yaml) shadows the c.config() function on the package
+    if not callable(cacao.config):
+        cacao.config = simple.config
+    previous = simple._global_app
+    simple._global_app = None
+    try:
+        load_app_module(app_file)
+        return simple._global_app
+    finally:
+        simple._global_app = previous
+
+
+def _snapshot(app: Any) -> tuple[str, dict[str, str], dict[str, list]]:
+    """Navigation hash, panel hashes and panel contents of an app."""
+    tree = app.get_all_pages()
+    panels: dict[str, list] = {}
+    _split_panels(list(tree.values()), panels)
+    hashes = {key: _hash(children) for key, children in panels.items()}
+    return _hash(tree), hashes, panels
+
+
+class LiveApp:
+    """Keeps a served Cacao app in sync with its build output.
+
+    Args:
+        app: The Cacao app being served.
+        app_file: Its generated ``app.py``.
+        interval: Seconds between checks of the build manifest.
+    """
+
+    def __init__(self, app: Any, app_file: str | Path, interval: float = POLL_INTERVAL):
+        self.app = app
+        self.app_file = Path(app_file).resolve()
+        self.interval = interval
+        self.version = ""
+        self.nav = ""
+        self.hashes: dict[str, str] = {}
+        # Panel contents by key; built when first requested, or kept from
+        # the render of a reload (the pages that are open will ask)
+        self._panels: dict[str, list] | None = None
+        self._manifest = self.app_file.parent / MANIFEST_FILE
+        self._stamp = self._manifest_stamp()
+        self._inputs = BuildManifest.for_output(self.app_file.parent).inputs
+        self._lock = threading.Lock()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        nav, hashes, _ = _snapshot(app)
+        self._set(nav, hashes, None)
+
+    def _manifest_stamp(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self._manifest)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _set(self, nav: str, hashes: dict[str, str], panels: dict | None) -> None:
+        with self._lock:
+            self.nav = nav
+            self.hashes = hashes
+            self.version = _hash([nav, hashes])
+            self._panels = panels
+
+    def panels(self) -> tuple[str, dict[str, list]]:
+        """Current version and panel contents by panel key."""
+        with self._lock:
+            version, panels = self.version, self._panels
+        if panels is None:
+            panels = _snapshot(self.app)[2]
+            with self._lock:
+                if self.version == version:
+                    self._panels = panels
+        return version, panels
+
+    # --- Reloading ---
+
+    def check(self) -> bool:
+        """Reload if a build with new inputs finished since the last check.
+
+        Returns:
+            True if the app was reloaded.
+        """
+        stamp = self._manifest_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        manifest = BuildManifest.for_output(self.app_file.parent)
+        if manifest.inputs == self._inputs:
+            return False
+        self._inputs = manifest.inputs
+        self.reload()
+        return True
+
+    def reload(self) -> None:
+        """Render the app from its current build output and switch to it."""
+        app = render_app(self.app_file)
+        snapshot = _snapshot(app)
+        previous = self.version
+        for attr in SWAPPED_ATTRS:
+            if hasattr(app, attr):
+                setattr(self.app, attr, getattr(app, attr))
+        self._set(*snapshot)
+        if self.version != previous:
+            self._wake()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                # Keep serving the current docs; the next build retries
+                traceback.print_exc()
+
+    def start(self) -> None:
+        """Start watching the build manifest in a background thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._watch, name="cacaodocs-live", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and answer pending long polls."""
+        self._stop.set()
+        self._wake()
+        self._thread = None
+
+    # --- Long polling ---
+
+    def state(self) -> dict[str, Any]:
+        """Version, navigation hash and panel hashes, as sent to pages."""
+        with self._lock:
+            return {"version": self.version, "nav": self.nav, "panels": self.hashes}
+
+    async def wait(self, version: str, timeout: float = LONG_POLL_TIMEOUT) -> None:
+        """Wait until the version differs from ``version`` (or ``timeout``)."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+        with self._lock:
+            if self.version != version or self._stop.is_set():
+                return
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _wake(self) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    # --- HTTP ---
+
+    def install(self, asgi: Any) -> None:
+        """Add the live reload routes and script to a Cacao server.
+
+        The watcher runs while the server does (started by its lifespan,
+        so in each worker process).
+        """
+        from cacao.server.plugin import get_registry
+        from starlette.responses import JSONResponse, Response
+        from starlette.routing import Route
+
+        from . import __version__
+
+        async def changes(request: Any) -> JSONResponse:
+            since = request.query_params.get("since")
+            if since is not None:
+                await self.wait(since)
+            return JSONResponse(self.state())
+
+        async def panels(request: Any) -> JSONResponse:
+            keys = request.query_params.get("keys", "").split(",")
+            version, contents = self.panels()
+            found = {k: contents[k] for k in keys if k in contents}
+            return JSONResponse({"version": version, "panels": found})
+
+        async def script(request: Any) -> Response:
+            return Response(LIVE_JS, media_type="text/javascript")
+
+        # Ahead of Cacao's catch-all page route
+        asgi.router.routes[:0] = [
+            Route(f"{ROUTE_PREFIX}/changes", changes),
+            Route(f"{ROUTE_PREFIX}/panels", panels),
+            Route(f"{ROUTE_PREFIX}/live.js", script),
+        ]
+        asgi.router.on_startup.append(self.start)
+        asgi.router.on_shutdown.append(self.stop)
+        # Separate from the app's own "cacaodocs" plugin, which each
+        # reload registers again
+        plugin = get_registry().register("cacaodocs-live", version=__version__)
+        plugin.metadata["js_urls"] = [f"{ROUTE_PREFIX}/live.js"]
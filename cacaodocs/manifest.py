@@ -0,0 +1,251 @@
+"""Build manifest: content hashes of generated outputs.
+
+``<output>/manifest.json`` records the SHA-256 of every artifact written
+by the last build (``app.py``, ``data.json``, ...) together with a digest
+of the build's inputs. Outputs are only replaced when their bytes change,
+so unchanged files keep their mtimes (no Cacao reload, no CDN or CI cache
+invalidation), and a build whose inputs match the manifest can stop
+before scanning anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+# Bump when the manifest changes shape
+MANIFEST_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+
+def input_digest(
+    fingerprint: str, config: dict[str, Any], sources: Iterable[tuple[str, str]]
+) -> str:
+    """Hash everything a build's outputs are derived from.
+
+    Args:
+        fingerprint: Scanner fingerprint (source root, parser settings,
+            CacaoDocs version).
+        config: Build configuration. ``custom_doc_types`` is skipped; it
+            is covered by the parser fingerprint.
+        sources: (relative path, content id) pairs of the source files.
+
+    Returns:
+        Hex digest.
+    """
+    h = hashlib.sha256(fingerprint.encode())
+    h.update(
+        json.dumps(
+            {k: v for k, v in config.items() if k != "custom_doc_types"},
+            sort_keys=True,
+            default=str,
+        ).encode()
+    )
+    for key, cid in sorted(sources):
+        h.update(f"\0{key}\0{cid}".encode())
+    return h.hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class BuildManifest:
+    """Writes build outputs only when their contents change.
+
+    Each ``write_*``/``open`` call records the artifact as changed or
+    unchanged; ``save`` stores the new hashes.
+
+    Args:
+        directory: Build output directory.
+        filename: Manifest file name inside ``directory``.
+    """
+
+    def __init__(self, directory: str | Path, filename: str = MANIFEST_FILE):
+        self.directory = Path(directory)
+        self.filename = filename
+        self.inputs = ""
+        # Small facts about the build (e.g. item counts) for no-op builds
+        self.summary: dict[str, Any] = {}
+        # name -> {"sha256", "size", "mtime_ns"}
+        self.artifacts: dict[str, dict[str, Any]] = {}
+        self.changed: list[str] = []
+        self.unchanged: list[str] = []
+        self._previous: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def for_output(
+        cls, output_dir: str | Path, filename: str = MANIFEST_FILE
+    ) -> BuildManifest:
+        """Open the manifest stored in a build output directory."""
+        manifest = cls(output_dir, filename)
+        manifest.load()
+        return manifest
+
+    def load(self) -> None:
+        """Read the previous manifest, ignoring missing or stale files."""
+        try:
+            with open(self.directory / self.filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return
+        self.inputs = data.get("inputs", "")
+        self.summary = data.get("summary", {})
+        self._previous = data.get("artifacts", {})
+
+    def is_current(self, inputs: str) -> bool:
+        """Whether the last build used ``inputs`` and its outputs are intact.
+
+        Artifacts are checked by size and mtime, so this costs one ``stat``
+        per output.
+        """
+        if not self._previous or inputs != self.inputs:
+            return False
+        for name, record in self._previous.items():
+            try:
+                st = os.stat(self.directory / name)
+            except OSError:
+                return False
+            if st.st_size != record["size"] or st.st_mtime_ns != record["mtime_ns"]:
+                return False
+        self.unchanged = sorted(self._previous)
+        return True
+
+    def digest(self, name: str) -> str | None:
+        """SHA-256 of an artifact on disk (None if it does not exist).
+
+        The recorded hash is used while the file's size and mtime still
+        match the manifest.
+        """
+        path = self.directory / name
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        record = self._previous.get(name)
+        if (
+            record is not None
+            and st.st_size == record["size"]
+            and st.st_mtime_ns == record["mtime_ns"]
+        ):
+            return record["sha256"]
+        return _file_sha256(path)
+
+    # --- Writing ---
+
+    def write_text(self, name: str, text: str) -> bool:
+        """Write a UTF-8 text artifact if it changed."""
+        return self.write_bytes(name, text.encode("utf-8"))
+
+    def write_bytes(self, name: str, data: bytes) -> bool:
+        """Write an artifact if its bytes changed.
+
+        Returns:
+            True if the file was (re)written.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if self.digest(name) == digest:
+            return self._record(name, digest, changed=False)
+        path = self.directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return self._record(name, digest, changed=True)
+
+    @contextmanager
+    def open(self, name: str) -> Iterator[TextIO]:
+        """Stream a text artifact to a temporary file.
+
+        The file replaces ``name`` on exit only if its contents differ;
+        nothing is replaced if the block raises.
+        """
+        path = self.directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                yield f
+            self.adopt(name, tmp)
+        finally:
+            if tmp.exists():
+                os.remove(tmp)
+
+    def adopt(self, name: str, path: str | Path) -> bool:
+        """Move a finished file over the artifact ``name`` if it differs.
+
+        ``path`` must be on the same filesystem as the output directory;
+        it is removed either way.
+
+        Returns:
+            True if the artifact was replaced.
+        """
+        digest = _file_sha256(Path(path))
+        if self.digest(name) == digest:
+            os.remove(path)
+            return self._record(name, digest, changed=False)
+        os.replace(path, self.directory / name)
+        return self._record(name, digest, changed=True)
+
+    def prune(self) -> list[str]:
+        """Delete artifacts of the previous build that were not written now.
+
+        Returns:
+            Names of the removed files.
+        """
+        removed = []
+        for name in sorted(set(self._previous) - set(self.artifacts)):
+            try:
+                os.remove(self.directory / name)
+            except OSError:
+                continue
+            removed.append(name)
+        return removed
+
+    def save(self, inputs: str = "") -> None:
+        """Store the hashes of the artifacts written by this build."""
+        self.inputs = inputs
+        path = self.directory / self.filename
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "inputs": inputs,
+                    "summary": self.summary,
+                    "artifacts": self.artifacts,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp, path)
+        self._previous = dict(self.artifacts)
+
+    @property
+    def stats(self) -> dict[str, list[str]]:
+        return {"changed": list(self.changed), "unchanged": list(self.unchanged)}
+
+    # --- Internals ---
+
+    def _record(self, name: str, digest: str, changed: bool) -> bool:
+        st = os.stat(self.directory / name)
+        self.artifacts[name] = {
+            "sha256": digest,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        (self.changed if changed else self.unchanged).append(name)
+        return changed
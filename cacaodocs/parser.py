@@ -4,10 +4,16 @@ Parses Google-style docstrings extended with CacaoDocs doc types.
 Supports built-in types (function, api, config, event) and custom types.
 """
 
+import hashlib
 import re
-from typing import Optional
+import sys
+from collections import OrderedDict
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Optional
 
 from .types import (
+    EMPTY_DICT,
+    EMPTY_LIST,
     ArgDoc,
     ConfigFieldDoc,
     CustomDocTypeDef,
@@ -20,6 +26,27 @@ from .types import (
     ReturnDoc,
 )
 
+# Section handler: (header as written, content lines, result) -> None
+SectionHandler = Callable[[str, list[str], ParsedDocstring], None]
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters but
+# str.lower() does not map to them
+_HEADER_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _fold_header(name: str) -> str:
+    """Case-fold a header name the way a case-insensitive regex compares it."""
+    return name.translate(_HEADER_FOLD).lower()
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(ParsedDocstring))
+
+# ParsedDocstring fields holding lists/dicts, copied (unless empty) when a
+# memoized result is handed out
+_CONTAINER_FIELDS = tuple(
+    f.name for f in fields(ParsedDocstring) if f.default_factory is not MISSING
+)
+
 
 class DocstringParser:
     """Parser for CacaoDocs-style docstrings.
@@ -66,6 +93,36 @@ class DocstringParser:
         "Configuration",
     ]
 
+    # Built-in sections: header -> (ParsedDocstring field, parse method).
+    # Other headers are stored as text in custom_sections.
+    BUILTIN_SECTIONS = {
+        "Args": ("args", "_parse_args"),
+        "Arguments": ("args", "_parse_args"),
+        "Attributes": ("attributes", "_parse_args"),
+        "Returns": ("returns", "_parse_returns"),
+        "Return": ("returns", "_parse_returns"),
+        "Yields": ("returns", "_parse_returns"),
+        "Yield": ("returns", "_parse_returns"),
+        "Raises": ("raises", "_parse_raises"),
+        "Raise": ("raises", "_parse_raises"),
+        "Exceptions": ("raises", "_parse_raises"),
+        "Examples": ("examples", "_parse_examples"),
+        "Example": ("examples", "_parse_examples"),
+        "Notes": ("notes", "_parse_notes"),
+        "Note": ("notes", "_parse_notes"),
+        "Path Params": ("path_params", "_parse_args"),
+        "Path Parameters": ("path_params", "_parse_args"),
+        "Query Params": ("query_params", "_parse_args"),
+        "Query Parameters": ("query_params", "_parse_args"),
+        "Request Body": ("request_body", "_parse_args"),
+        "Body": ("request_body", "_parse_args"),
+        "Headers": ("headers", "_parse_headers"),
+        "Payload": ("payload", "_parse_payload"),
+        "Fields": ("config_fields", "_parse_config_fields"),
+        "Config": ("config_fields", "_parse_config_fields"),
+        "Configuration": ("config_fields", "_parse_config_fields"),
+    }
+
     # Response sections are matched separately: "Response (200):", "Response (404):", etc.
     RESPONSE_PATTERN = re.compile(r"^\s*Response\s*\((\d{3})\)\s*:\s*$", re.IGNORECASE)
 
@@ -81,21 +138,41 @@ class DocstringParser:
     # Trigger directive: "Trigger: When a user signs up"
     TRIGGER_DIRECTIVE_PATTERN = re.compile(r"^\s*Trigger\s*:\s*(.+)\s*$", re.IGNORECASE)
 
-    def __init__(self, custom_types: list[CustomDocTypeDef] | None = None):
+    def __init__(
+        self,
+        custom_types: list[CustomDocTypeDef] | None = None,
+        memo_size: int = 8192,
+    ):
         self.custom_types = {ct.name: ct for ct in (custom_types or [])}
 
-        # Add custom section headers
-        all_headers = list(self.SECTION_HEADERS)
+        self.memo_size = memo_size
+        self.memo_hits = 0
+        self.memo_misses = 0
+        # LRU of parse results keyed by (docstring, hint_type); None marks
+        # a docstring seen once, whose result was not kept
+        self._memo: OrderedDict[
+            tuple[str, DocType | None], ParsedDocstring | None
+        ] = OrderedDict()
+
+        # Identifies the parser configuration (for caches)
+        self.fingerprint = hashlib.sha256(
+            repr(sorted(self.custom_types.items())).encode()
+        ).hexdigest()[:16]
+
+        # Section dispatch: lowercased header name -> handler. Header lines
+        # are recognised structurally plus a set lookup on the folded name;
+        # only non-ASCII header names need a regex.
+        self.section_handlers: dict[str, SectionHandler] = {}
+        self._header_keys: set[str] = set()
+        self._unicode_headers: list[str] = []
+        self._unicode_header_pattern: re.Pattern[str] | None = None
+        for header, (attr, method) in self.BUILTIN_SECTIONS.items():
+            self.register_section(header, _FieldHandler(attr, getattr(self, method)))
+        for header in self.SECTION_HEADERS:
+            self.register_section(header)
         for ct in custom_types or []:
             for section in ct.sections:
-                if section.name not in all_headers:
-                    all_headers.append(section.name)
-
-        # Build regex pattern for section headers
-        headers_pattern = "|".join(re.escape(h) for h in all_headers)
-        self.section_pattern = re.compile(
-            rf"^\s*({headers_pattern}):\s*$", re.MULTILINE | re.IGNORECASE
-        )
+                self.register_section(section.name)
 
         # Pattern for argument lines: name (type): description
         self.arg_pattern = re.compile(
@@ -112,6 +189,15 @@ class DocstringParser:
     ) -> ParsedDocstring:
         """Parse a docstring into structured sections.
 
+        Results are memoized per (docstring, hint_type) in a bounded LRU,
+        so repeated docstrings (overrides, mixins, generated endpoints)
+        stop being re-parsed after their second occurrence. Each call
+        returns a fresh ParsedDocstring whose non-empty lists and dicts may
+        be replaced or extended freely; empty ones are the shared
+        ``EMPTY_LIST``/``EMPTY_DICT`` and must be replaced. The records
+        inside them may be shared with the memo and must not be modified
+        in place.
+
         Args:
             docstring: The raw docstring text.
             hint_type: Doc type hint from auto-detection (decorator analysis).
@@ -122,298 +208,301 @@ class DocstringParser:
         """
         if not docstring:
             return ParsedDocstring()
+        if self.memo_size <= 0:
+            return self._parse(docstring, hint_type)
+
+        key = (docstring, hint_type)
+        memo = self._memo
+        if key in memo:
+            memo.move_to_end(key)
+            cached = memo[key]
+            if cached is not None:
+                self.memo_hits += 1
+                return _copy_parsed(cached)
+            # Second sighting: keep a private result from now on
+            self.memo_misses += 1
+            cached = memo[key] = self._parse(docstring, hint_type)
+            return _copy_parsed(cached)
+
+        # Most docstrings are unique, so the first sighting only records
+        # the key and hands out the parse result without copying it
+        self.memo_misses += 1
+        memo[key] = None
+        if len(memo) > self.memo_size:
+            memo.popitem(last=False)
+        return self._parse(docstring, hint_type)
+
+    def register_section(
+        self, name: str, handler: SectionHandler | None = None
+    ) -> None:
+        """Register a section header and the handler that parses it.
+
+        Headers match case-insensitively. Without a handler, the section
+        is stored as text in ``custom_sections`` unless the header is
+        already registered. An explicit handler replaces any existing one
+        and changes the parser ``fingerprint``.
 
-        # Normalize indentation
-        lines = docstring.expandtabs(4).splitlines()
-        docstring = self._dedent(lines)
+        Args:
+            name: Section header, without the trailing colon.
+            handler: Called as ``handler(header, lines, result)`` with the
+                header as written in the docstring and the section's
+                content lines.
+        """
+        key = name.lower()
+        self._header_keys.add(_fold_header(name))
+        if handler is None:
+            if key in self.section_handlers:
+                return
+            handler = _custom_section
+        elif not isinstance(handler, _FieldHandler):
+            qualname = getattr(handler, "__qualname__", repr(handler))
+            self.fingerprint = hashlib.sha256(
+                f"{self.fingerprint}|{key}|{handler.__module__}.{qualname}".encode()
+            ).hexdigest()[:16]
+            self._memo.clear()
+        self.section_handlers[key] = handler
+
+        if not name.isascii() and name not in self._unicode_headers:
+            self._unicode_headers.append(name)
+            alternation = "|".join(re.escape(h) for h in self._unicode_headers)
+            self._unicode_header_pattern = re.compile(
+                rf"^\s*({alternation}):\s*$", re.IGNORECASE
+            )
 
-        # Extract Type: directive and other top-level directives
-        doc_type, docstring = self._extract_type_directive(docstring, hint_type)
+    def _match_header(self, line: str) -> tuple[str | None, int | None]:
+        """Classify ``line`` as a section or response header.
 
-        # Extract Method/Path/Trigger directives
-        directives, docstring = self._extract_directives(docstring)
+        Returns:
+            (header as written, None), (None, status code) or (None, None).
+        """
+        stripped = line.strip()
+        if not stripped.endswith(":"):
+            return None, None
+        name = stripped[:-1]
+        key = _fold_header(name)
+        if key.startswith("response"):
+            match = self.RESPONSE_PATTERN.match(line)
+            if match:
+                return None, int(match.group(1))
+        if key in self._header_keys:
+            return name, None
+        if self._unicode_header_pattern is not None:
+            match = self._unicode_header_pattern.match(line)
+            if match:
+                return match.group(1), None
+        return None, None
 
-        # Split into summary and rest
-        summary, rest = self._split_summary(docstring)
+    @property
+    def memo_stats(self) -> dict[str, int]:
+        return {"hits": self.memo_hits, "misses": self.memo_misses}
 
-        # Find all sections (including Response(NNN) sections)
-        sections, response_sections = self._split_sections(rest)
+    def memo_items(self) -> list[tuple[Any, ParsedDocstring]]:
+        """Snapshot of memoized results, least recently used first."""
+        return [(k, v) for k, v in self._memo.items() if v is not None]
 
-        # Parse each section based on doc type
-        result = ParsedDocstring(
-            summary=summary,
-            doc_type=doc_type,
-            http_method=directives.get("method", ""),
-            path=directives.get("path", ""),
-            trigger=directives.get("trigger", ""),
-        )
+    def load_memo(self, items: list[tuple[Any, ParsedDocstring]]) -> None:
+        """Seed the memo with entries from ``memo_items``.
 
+        Entries are only valid for a parser with the same ``fingerprint``.
+        """
+        for key, parsed in items:
+            self._memo[key] = parsed
+            self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def _parse(self, docstring: str, hint_type: DocType | None) -> ParsedDocstring:
+        """Parse a non-empty docstring (uncached).
+
+        The docstring is read in a single pass. Each line is classified
+        once (directive, section header, response header or content) and
+        drives a small state machine: summary lines come first, then
+        content is collected into the current section, which is parsed as
+        soon as the next header closes it.
+        """
+        # Sections that accumulate get private containers while parsing;
+        # they go back to the shared empties below if nothing was added
+        result = ParsedDocstring(responses=[], custom_sections={})
         description_parts: list[str] = []
+        explicit_type: DocType | None = None
+        directives: dict[str, str] = {}
 
-        for section_name, section_content in sections:
-            self._parse_section(
-                section_name, section_content, result, description_parts
-            )
-
-        # Parse response sections
-        for status_code, content in response_sections:
-            desc_lines = []
-            fields = []
-            for line in content.split("\n"):
-                match = self.arg_pattern.match(line)
-                if match:
-                    fields.append(
-                        ArgDoc(
-                            name=match.group(1),
-                            type=match.group(2) or "",
-                            description=match.group(3) or "",
-                        )
-                    )
-                elif line.strip() and not fields:
-                    desc_lines.append(line.strip())
-            result.responses.append(
-                ResponseDoc(
-                    status_code=status_code,
-                    description=" ".join(desc_lines),
-                    fields=fields,
+        summary_lines: list[str] = []
+        in_summary = True
+        section = ""
+        response_code: int | None = None
+        content: list[str] = []
+
+        for line in self._dedent(docstring.expandtabs(4).splitlines()):
+            header = None
+            code = None
+
+            # Directives and headers all contain a colon
+            if ":" in line:
+                if explicit_type is None:
+                    match = self.TYPE_DIRECTIVE_PATTERN.match(line)
+                    if match:
+                        explicit_type = self._lookup_type(match.group(1))
+                        if explicit_type is not None:
+                            continue
+                if self._take_directive(line, directives):
+                    continue
+                header, code = self._match_header(line)
+
+            if in_summary:
+                if header is None and code is None:
+                    stripped = line.strip()
+                    if stripped:
+                        summary_lines.append(stripped)
+                        continue
+                    # A blank line ends the summary and is dropped
+                    in_summary = False
+                    continue
+                in_summary = False
+
+            if code is not None or header is not None:
+                self._close_section(
+                    section, content, response_code, result, description_parts
                 )
-            )
-
-        result.description = "\n\n".join(description_parts)
-
-        # For custom types, parse remaining sections into custom_sections
-        if doc_type == DocType.CUSTOM and doc_type.value in self.custom_types:
-            # Already handled in _parse_section
-            pass
-
-        return result
-
-    def _extract_type_directive(
-        self, docstring: str, hint: DocType | None
-    ) -> tuple[DocType, str]:
-        """Extract the Type: directive from the docstring."""
-        lines = docstring.split("\n")
-        new_lines = []
-        explicit_type = None
-
-        for line in lines:
-            match = self.TYPE_DIRECTIVE_PATTERN.match(line)
-            if match and explicit_type is None:
-                type_str = match.group(1).lower()
-                try:
-                    explicit_type = DocType(type_str)
-                except ValueError:
-                    # Could be a custom type
-                    if type_str in self.custom_types:
-                        explicit_type = DocType.CUSTOM
-                    else:
-                        # Unknown type, keep line and default
-                        new_lines.append(line)
+                section = header or ""
+                response_code = code
+                content = []
             else:
-                new_lines.append(line)
-
-        doc_type = explicit_type or hint or DocType.FUNCTION
-        return doc_type, "\n".join(new_lines)
+                content.append(line)
 
-    def _extract_directives(self, docstring: str) -> tuple[dict[str, str], str]:
-        """Extract Method:, Path:, Trigger: directives."""
-        lines = docstring.split("\n")
-        new_lines = []
-        directives: dict[str, str] = {}
+        self._close_section(
+            section, content, response_code, result, description_parts
+        )
 
-        for line in lines:
-            m = self.METHOD_DIRECTIVE_PATTERN.match(line)
-            if m and "method" not in directives:
-                directives["method"] = m.group(1).upper()
-                continue
-            m = self.PATH_DIRECTIVE_PATTERN.match(line)
-            if m and "path" not in directives:
-                directives["path"] = m.group(1).strip()
-                continue
-            m = self.TRIGGER_DIRECTIVE_PATTERN.match(line)
-            if m and "trigger" not in directives:
-                directives["trigger"] = m.group(1).strip()
-                continue
-            new_lines.append(line)
-
-        return directives, "\n".join(new_lines)
-
-    def _split_summary(self, docstring: str) -> tuple[str, str]:
-        """Split docstring into summary and rest."""
-        lines = docstring.split("\n")
-        summary_lines = []
-        rest_start = 0
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if not stripped:
-                rest_start = i + 1
-                break
-            if self.section_pattern.match(line) or self.RESPONSE_PATTERN.match(line):
-                rest_start = i
-                break
-            summary_lines.append(stripped)
-            rest_start = i + 1
-
-        summary = " ".join(summary_lines)
-        rest = "\n".join(lines[rest_start:])
-        return summary, rest
-
-    def _split_sections(
-        self, text: str
-    ) -> tuple[list[tuple[str, str]], list[tuple[int, str]]]:
-        """Split text into named sections and response sections."""
-        if not text.strip():
-            return [], []
-
-        sections: list[tuple[str, str]] = []
-        response_sections: list[tuple[int, str]] = []
-        lines = text.split("\n")
-        current_section = ""
-        current_content: list[str] = []
-        current_response_code: int | None = None
+        result.summary = " ".join(summary_lines)
+        result.description = "\n\n".join(description_parts)
+        result.doc_type = explicit_type or hint_type or DocType.FUNCTION
+        result.http_method = directives.get("method", "")
+        result.path = directives.get("path", "")
+        result.trigger = directives.get("trigger", "")
+        if not result.responses:
+            result.responses = EMPTY_LIST
+        if not result.custom_sections:
+            result.custom_sections = EMPTY_DICT
+        return result
 
-        for line in lines:
-            # Check for Response(NNN): pattern
-            resp_match = self.RESPONSE_PATTERN.match(line)
-            if resp_match:
-                # Save previous
-                self._save_current(
-                    current_section,
-                    current_content,
-                    current_response_code,
-                    sections,
-                    response_sections,
-                )
-                current_response_code = int(resp_match.group(1))
-                current_section = ""
-                current_content = []
-                continue
+    def _lookup_type(self, type_str: str) -> DocType | None:
+        """Map a Type: directive value to a DocType, or None if unknown."""
+        type_str = type_str.lower()
+        try:
+            return DocType(type_str)
+        except ValueError:
+            # Could be a custom type
+            if type_str in self.custom_types:
+                return DocType.CUSTOM
+        return None
 
-            # Check for regular section header
-            match = self.section_pattern.match(line)
-            if match:
-                self._save_current(
-                    current_section,
-                    current_content,
-                    current_response_code,
-                    sections,
-                    response_sections,
-                )
-                current_section = match.group(1)
-                current_response_code = None
-                current_content = []
-            else:
-                current_content.append(line)
-
-        # Save last
-        self._save_current(
-            current_section,
-            current_content,
-            current_response_code,
-            sections,
-            response_sections,
-        )
+    def _take_directive(self, line: str, directives: dict[str, str]) -> bool:
+        """Record a Method:, Path: or Trigger: directive found on ``line``.
 
-        return sections, response_sections
+        Only the first occurrence of each directive is taken; later ones
+        stay in the text.
 
-    def _save_current(
+        Returns:
+            True if the line was consumed as a directive.
+        """
+        m = self.METHOD_DIRECTIVE_PATTERN.match(line)
+        if m and "method" not in directives:
+            directives["method"] = m.group(1).upper()
+            return True
+        m = self.PATH_DIRECTIVE_PATTERN.match(line)
+        if m and "path" not in directives:
+            directives["path"] = m.group(1).strip()
+            return True
+        m = self.TRIGGER_DIRECTIVE_PATTERN.match(line)
+        if m and "trigger" not in directives:
+            directives["trigger"] = m.group(1).strip()
+            return True
+        return False
+
+    def _close_section(
         self,
         section: str,
         content: list[str],
         response_code: int | None,
-        sections: list[tuple[str, str]],
-        response_sections: list[tuple[int, str]],
+        result: ParsedDocstring,
+        description_parts: list[str],
     ):
-        """Helper to save current section or response section."""
+        """Parse a finished section or response section into ``result``."""
         if not content and not section and response_code is None:
             return
-        text = "\n".join(content)
         if response_code is not None:
-            response_sections.append((response_code, text))
-        elif content or section:
-            sections.append((section, text))
+            result.responses.append(self._parse_response(response_code, content))
+        else:
+            self._parse_section(section, content, result, description_parts)
+
+    def _parse_response(self, status_code: int, lines: list[str]) -> ResponseDoc:
+        """Parse a Response (NNN) section."""
+        desc_lines = []
+        fields = []
+        for line in lines:
+            match = self.arg_pattern.match(line)
+            if match:
+                fields.append(
+                    ArgDoc(
+                        name=sys.intern(match.group(1)),
+                        type=sys.intern(match.group(2) or ""),
+                        description=match.group(3) or "",
+                    )
+                )
+            elif line.strip() and not fields:
+                desc_lines.append(line.strip())
+        return ResponseDoc(
+            status_code=status_code,
+            description=" ".join(desc_lines),
+            fields=fields or EMPTY_LIST,
+        )
 
     def _parse_section(
         self,
         section_name: str,
-        content: str,
+        content: list[str],
         result: ParsedDocstring,
         description_parts: list[str],
     ):
         """Parse a single section and populate the result."""
-        section_lower = section_name.lower()
-
-        # Standard function sections
-        if section_lower in ("args", "arguments"):
-            result.args = self._parse_args(content)
-        elif section_lower == "attributes":
-            result.attributes = self._parse_args(content)
-        elif section_lower in ("returns", "return", "yields", "yield"):
-            result.returns = self._parse_returns(content)
-        elif section_lower in ("raises", "raise", "exceptions"):
-            result.raises = self._parse_raises(content)
-        elif section_lower in ("examples", "example"):
-            result.examples = self._parse_examples(content)
-        elif section_lower in ("notes", "note"):
-            result.notes = self._parse_notes(content)
-
-        # API sections
-        elif section_lower in ("path params", "path parameters"):
-            result.path_params = self._parse_args(content)
-        elif section_lower in ("query params", "query parameters"):
-            result.query_params = self._parse_args(content)
-        elif section_lower in ("request body", "body"):
-            result.request_body = self._parse_args(content)
-        elif section_lower == "headers":
-            result.headers = self._parse_headers(content)
-
-        # Event sections
-        elif section_lower == "payload":
-            result.payload = self._parse_payload(content)
-
-        # Config sections
-        elif section_lower in ("fields", "config", "configuration"):
-            result.config_fields = self._parse_config_fields(content)
-
         # Description (no section name)
-        elif section_name == "":
-            stripped = content.strip()
+        if section_name == "":
+            stripped = "\n".join(content).strip()
             if stripped:
                 description_parts.append(stripped)
+            return
 
-        # Custom sections
-        else:
-            result.custom_sections[section_name] = content.strip()
+        handler = self.section_handlers.get(section_name.lower())
+        if handler is None:
+            handler = _custom_section
+        handler(section_name, content, result)
+
+    def _dedent(self, lines: list[str]) -> list[str]:
+        """Remove common leading whitespace from lines.
 
-    def _dedent(self, lines: list[str]) -> str:
-        """Remove common leading whitespace from lines."""
+        The first line is stripped; blank lines become empty strings.
+        """
         if not lines:
-            return ""
+            return [""]
 
-        min_indent = float("inf")
+        min_indent = None
         for line in lines[1:]:
             stripped = line.lstrip()
             if stripped:
                 indent = len(line) - len(stripped)
-                min_indent = min(min_indent, indent)
-
-        if min_indent == float("inf"):
-            min_indent = 0
+                if min_indent is None or indent < min_indent:
+                    min_indent = indent
+        min_indent = min_indent or 0
 
         result = [lines[0].strip()]
         for line in lines[1:]:
-            if line.strip():
-                result.append(line[int(min_indent) :])
-            else:
-                result.append("")
-
-        return "\n".join(result)
+            result.append(line[min_indent:] if line.strip() else "")
+        return result
 
-    def _parse_args(self, content: str) -> list[ArgDoc]:
+    def _parse_args(self, lines: list[str]) -> list[ArgDoc]:
         """Parse Args-style section content."""
         args = []
-        lines = content.split("\n")
         current_arg = None
         current_desc_lines: list[str] = []
 
@@ -442,8 +531,8 @@ class DocstringParser:
                     ).strip()
 
                 current_arg = ArgDoc(
-                    name=name,
-                    type=type_hint.strip(),
+                    name=sys.intern(name),
+                    type=sys.intern(type_hint.strip()),
                     description="",
                     default=default,
                     required=required,
@@ -458,32 +547,26 @@ class DocstringParser:
 
         return args
 
-    def _parse_returns(self, content: str) -> Optional[ReturnDoc]:
+    def _parse_returns(self, lines: list[str]) -> Optional[ReturnDoc]:
         """Parse Returns section content."""
-        content = content.strip()
-        if not content:
+        stripped = [s for s in (line.strip() for line in lines) if s]
+        if not stripped:
             return None
 
-        lines = content.split("\n")
-        first_line = lines[0].strip()
-
-        match = self.return_type_pattern.match(first_line)
+        match = self.return_type_pattern.match(stripped[0])
         if match:
             type_hint = match.group(1).strip()
             desc = match.group(2).strip()
-            if len(lines) > 1:
-                rest = " ".join(line.strip() for line in lines[1:] if line.strip())
-                if rest:
-                    desc = f"{desc} {rest}" if desc else rest
-            return ReturnDoc(type=type_hint, description=desc)
+            rest = " ".join(stripped[1:])
+            if rest:
+                desc = f"{desc} {rest}" if desc else rest
+            return ReturnDoc(type=sys.intern(type_hint), description=desc)
 
-        desc = " ".join(line.strip() for line in lines if line.strip())
-        return ReturnDoc(type="", description=desc)
+        return ReturnDoc(type="", description=" ".join(stripped))
 
-    def _parse_raises(self, content: str) -> list[RaiseDoc]:
+    def _parse_raises(self, lines: list[str]) -> list[RaiseDoc]:
         """Parse Raises section content."""
         raises = []
-        lines = content.split("\n")
         current_raise = None
         current_desc_lines: list[str] = []
 
@@ -495,7 +578,7 @@ class DocstringParser:
                     raises.append(current_raise)
                 exc_type = match.group(1)
                 desc = match.group(3) or ""
-                current_raise = RaiseDoc(type=exc_type, description="")
+                current_raise = RaiseDoc(type=sys.intern(exc_type), description="")
                 current_desc_lines = [desc] if desc else []
             elif line.strip():
                 stripped = line.strip()
@@ -503,7 +586,8 @@ class DocstringParser:
                     if ":" in stripped:
                         exc_type, desc = stripped.split(":", 1)
                         current_raise = RaiseDoc(
-                            type=exc_type.strip(), description=desc.strip()
+                            type=sys.intern(exc_type.strip()),
+                            description=desc.strip(),
                         )
                         current_desc_lines = []
                 elif current_raise:
@@ -515,10 +599,9 @@ class DocstringParser:
 
         return raises
 
-    def _parse_examples(self, content: str) -> list[str]:
+    def _parse_examples(self, lines: list[str]) -> list[str]:
         """Parse Examples section content."""
         examples = []
-        lines = content.split("\n")
         current_example: list[str] = []
 
         for line in lines:
@@ -532,17 +615,17 @@ class DocstringParser:
 
         return examples
 
-    def _parse_notes(self, content: str) -> list[str]:
+    def _parse_notes(self, lines: list[str]) -> list[str]:
         """Parse Notes section content."""
-        content = content.strip()
+        content = "\n".join(lines).strip()
         if not content:
             return []
         return [content]
 
-    def _parse_headers(self, content: str) -> list[HeaderDoc]:
+    def _parse_headers(self, lines: list[str]) -> list[HeaderDoc]:
         """Parse Headers section content."""
         headers = []
-        for line in content.split("\n"):
+        for line in lines:
             match = self.arg_pattern.match(line)
             if match:
                 name = match.group(1)
@@ -558,25 +641,24 @@ class DocstringParser:
                 )
         return headers
 
-    def _parse_payload(self, content: str) -> list[PayloadFieldDoc]:
+    def _parse_payload(self, lines: list[str]) -> list[PayloadFieldDoc]:
         """Parse Payload section content."""
         fields = []
-        for line in content.split("\n"):
+        for line in lines:
             match = self.arg_pattern.match(line)
             if match:
                 fields.append(
                     PayloadFieldDoc(
-                        name=match.group(1),
-                        type=match.group(2) or "",
+                        name=sys.intern(match.group(1)),
+                        type=sys.intern(match.group(2) or ""),
                         description=match.group(3) or "",
                     )
                 )
         return fields
 
-    def _parse_config_fields(self, content: str) -> list[ConfigFieldDoc]:
+    def _parse_config_fields(self, lines: list[str]) -> list[ConfigFieldDoc]:
         """Parse Config/Fields section content."""
         fields = []
-        lines = content.split("\n")
         current_field = None
         current_desc_lines: list[str] = []
 
@@ -613,8 +695,8 @@ class DocstringParser:
                     type_hint = ", ".join(type_parts)
 
                 current_field = ConfigFieldDoc(
-                    name=name,
-                    type=type_hint.strip(),
+                    name=sys.intern(name),
+                    type=sys.intern(type_hint.strip()),
                     description="",
                     default=default,
                     required=required,
@@ -629,3 +711,33 @@ class DocstringParser:
             fields.append(current_field)
 
         return fields
+
+
+def _copy_parsed(parsed: ParsedDocstring) -> ParsedDocstring:
+    """Copy a memoized result: new object and containers, shared records."""
+    clone = object.__new__(ParsedDocstring)
+    for name in _FIELD_NAMES:
+        setattr(clone, name, getattr(parsed, name))
+    for name in _CONTAINER_FIELDS:
+        value = getattr(parsed, name)
+        if value:
+            setattr(clone, name, value.copy())
+    return clone
+
+
+class _FieldHandler:
+    """Built-in handler that stores ``parse(lines)`` on ``result.<attr>``."""
+
+    __slots__ = ("attr", "parse")
+
+    def __init__(self, attr: str, parse: Callable[[list[str]], Any]):
+        self.attr = attr
+        self.parse = parse
+
+    def __call__(self, header: str, lines: list[str], result: ParsedDocstring) -> None:
+        setattr(result, self.attr, self.parse(lines))
+
+
+def _custom_section(header: str, lines: list[str], result: ParsedDocstring) -> None:
+    """Default handler: keep the section text under its header."""
+    result.custom_sections[header] = "\n".join(lines).strip()
@@ -22,25 +22,58 @@ Alternatively, plug() auto-injects into the sidebar slot if no manual
 calls are needed:
 
     cacaodocs.plug("./src", auto_inject=True)
+
+Given the output of ``cacaodocs build --sqlite`` instead of sources,
+plug() reads the built ``docs.sqlite`` as it renders instead of scanning:
+
+    docs = cacaodocs.plug("./docs")
 """
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
+
+from .callgraph import CallGraph
+from .store import STORE_FILE, DocStore, StoreData
+
+
+def _pick(items: list[Any], indices: list[int]) -> list[Any]:
+    """Select items by position."""
+    return [items[i] for i in indices]
 
 
 class DocsPlugin:
-    """Runtime docs plugin that provides sidebar and panel rendering."""
+    """Runtime docs plugin that provides sidebar and panel rendering.
 
-    def __init__(self, data: dict[str, Any], nav_key: str = "docs"):
+    ``data`` is the documentation data (as in ``data.json``); with a
+    ``StoreData`` the call graph and search queries go to SQLite.
+    """
+
+    def __init__(self, data: Mapping[str, Any], nav_key: str = "docs"):
         self.data = data
         self.nav_key = nav_key
+        self._call_graph: CallGraph | None = None
+        self.store: DocStore | None = (
+            data.store if isinstance(data, StoreData) else None
+        )
 
-        # Filter to items with docstrings (same logic as generated app)
         self.pages = data.get("pages", [])
         self.config = data.get("config", {})
 
+        views = data.get("views")
+        if views is not None:
+            # Items with docstrings, as selected by the builder
+            self.modules = _pick(data["modules"], [v["index"] for v in views["modules"]])
+            self.classes = _pick(data["classes"], [v["index"] for v in views["classes"]])
+            self.functions = _pick(data["functions"], views["functions"])
+            self.api_endpoints = _pick(data["api_endpoints"], views["api_endpoints"])
+            for cls, view in zip(self.classes, views["classes"]):
+                cls["methods"] = _pick(cls.get("methods", []), view["methods"])
+            return
+
+        # Data built without views: filter here (same logic as the builder)
         def _has_ds(item: dict) -> bool:
             ds = item.get("docstring")
             if not ds:
@@ -75,6 +108,78 @@ class DocsPlugin:
                 if (_has_ds(m) or m["name"] == "__init__") and not m.get("hidden")
             ]
 
+    @property
+    def call_graph(self) -> CallGraph | None:
+        """Call graph with reachability index, loaded on first use."""
+        if self._call_graph is None and self.data.get("call_graph"):
+            self._call_graph = CallGraph.from_dict(self.data["call_graph"])
+        return self._call_graph
+
+    def callers(self, name: str, depth: int | None = 1) -> list[str]:
+        """Functions that call ``name`` (transitively when depth is None)."""
+        if self.store is not None:
+            return self.store.callers(name, depth)
+        graph = self.call_graph
+        if graph is None or name not in graph.index:
+            return []
+        return graph.callers(name, depth)
+
+    def callees(self, name: str, depth: int | None = 1) -> list[str]:
+        """Functions called by ``name`` (transitively when depth is None)."""
+        if self.store is not None:
+            return self.store.callees(name, depth)
+        graph = self.call_graph
+        if graph is None or name not in graph.index:
+            return []
+        return graph.callees(name, depth)
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Whether ``source`` transitively calls ``target``."""
+        if self.store is not None:
+            return self.store.reaches(source, target)
+        graph = self.call_graph
+        if graph is None or source not in graph.index or target not in graph.index:
+            return False
+        return graph.reaches(source, target)
+
+    def search(self, query: str, limit: int = 20) -> list[dict[str, str]]:
+        """Documentation matching every word of ``query``.
+
+        Answered by the full-text index of ``docs.sqlite`` when there is
+        one; otherwise the names and summaries of the documented items
+        are scanned.
+
+        Returns:
+            Dicts with ``kind``, ``name``, ``full_path`` and ``summary``.
+        """
+        if self.store is not None:
+            return self.store.search(query, limit)
+        terms = [t.lower() for t in re.findall(r"\w+", query)]
+        if not terms:
+            return []
+        items = [("module", m) for m in self.modules]
+        items += [("class", c) for c in self.classes]
+        items += [("function", f) for f in self.functions]
+        items += [("api", e) for e in self.api_endpoints]
+        results = []
+        for kind, item in items:
+            ds = item.get("docstring") or {}
+            summary = ds.get("summary", "") if isinstance(ds, dict) else ds.strip()
+            summary = summary.split("\n")[0]
+            text = f"{item['name']} {item['full_path']} {summary}".lower()
+            if all(t in text for t in terms):
+                results.append(
+                    {
+                        "kind": kind,
+                        "name": item["name"],
+                        "full_path": item["full_path"],
+                        "summary": summary,
+                    }
+                )
+                if len(results) == limit:
+                    break
+        return results
+
     def sidebar(self) -> None:
         """Render sidebar nav items for documentation."""
         import cacao as c
@@ -320,12 +425,46 @@ class DocsPlugin:
                 c.html(page.get("content", ""))
 
 
+def _scan(source: str | Path, config: dict[str, Any] | None) -> dict[str, Any]:
+    """Documentation data of a source directory."""
+    from .config import load_config
+    from .parser import DocstringParser
+    from .scanner import scan_directory
+    from .builder import build_json
+
+    if config is None:
+        config = load_config()
+
+    custom_types = config.get("custom_doc_types", [])
+    parser = DocstringParser(custom_types=custom_types) if custom_types else None
+    exclude_patterns = config.get("exclude_patterns", [])
+
+    modules, pages = scan_directory(
+        source,
+        exclude_patterns,
+        parser,
+        respect_gitignore=config.get("respect_gitignore", True),
+        read_ahead=config.get("read_ahead", 16),
+        # Runs while the user's app is imported: no process pool there
+        render_workers=1,
+    )
+    return build_json(modules, pages, config)
+
+
 def _lazy_version() -> str:
     from . import __version__
 
     return __version__
 
 
+def _built_store(source: str | Path) -> Path | None:
+    """The ``docs.sqlite`` of a build output given as ``source``, if any."""
+    path = Path(source)
+    if path.is_dir():
+        path = path / STORE_FILE
+    return path if path.suffix == ".sqlite" and path.is_file() else None
+
+
 def plug(
     source: str | Path,
     config: dict[str, Any] | None = None,
@@ -338,7 +477,9 @@ def plug(
     and returns a DocsPlugin with sidebar() and panels() methods.
 
     Args:
-        source: Source directory containing Python/Markdown files.
+        source: Source directory containing Python/Markdown files, or a
+            build output with ``docs.sqlite`` (or that file), which is
+            then read on demand instead of scanning.
         config: Optional config dict (defaults to cacao.yaml).
         nav_key: Key prefix for nav items (default "docs").
         auto_inject: If True, auto-inject sidebar via plugin slot system
@@ -349,22 +490,11 @@ def plug(
     """
     import cacao as c
 
-    from .config import load_config
-    from .parser import DocstringParser
-    from .scanner import scan_directory
-    from .builder import build_json
-
-    if config is None:
-        config = load_config()
-
-    custom_types = config.get("custom_doc_types", [])
-    parser = DocstringParser(custom_types=custom_types) if custom_types else None
-    exclude_patterns = config.get("exclude_patterns", [])
-
-    modules, pages = scan_directory(source, exclude_patterns, parser)
-    json_data = build_json(modules, pages, config)
-
-    docs = DocsPlugin(json_data, nav_key=nav_key)
+    store = _built_store(source)
+    if store is not None:
+        docs = DocsPlugin(StoreData(store), nav_key=nav_key)
+    else:
+        docs = DocsPlugin(_scan(source, config), nav_key=nav_key)
 
     # Register as Cacao plugin
     plugin = c.register_plugin(
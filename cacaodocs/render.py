@@ -0,0 +1,205 @@
+"""Markdown page rendering.
+
+A ``Markdown`` converter with the ``fenced_code``/``tables``/``codehilite``/
+``toc`` extensions is expensive to build, so each thread (and each worker
+process) keeps one and resets it between pages. Rendered HTML is cached by
+a hash of the page text, the extension set and the library versions, and
+large batches of pages can be rendered on a process pool when asked for
+(``render_workers``; inline rendering is the default). Code blocks are
+highlighted through a shared HighlightCache, so a snippet that appears in
+several pages (or in a changed page) is only formatted once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from .highlight import HighlightCache
+
+try:
+    import markdown  # type: ignore[import-untyped]
+
+    _HAS_MARKDOWN = True
+except ImportError:
+    _HAS_MARKDOWN = False
+
+MARKDOWN_EXTENSIONS = ("fenced_code", "tables", "codehilite", "toc")
+
+# Batches smaller than this are rendered inline; a process pool does not
+# pay for its startup below it
+PARALLEL_MIN_PAGES = 64
+
+
+def _versions() -> str:
+    """Versions of the libraries that shape the rendered HTML."""
+    if not _HAS_MARKDOWN:
+        return "plain"
+    try:
+        import pygments
+
+        pygments_version = pygments.__version__
+    except ImportError:
+        pygments_version = ""
+    return f"markdown={markdown.__version__};pygments={pygments_version}"
+
+
+def _build_markdown(extensions: tuple[str, ...], highlighter: HighlightCache) -> Any:
+    """Create a converter, with ``codehilite`` backed by ``highlighter``."""
+    from .highlight import CachedCodeHiliteExtension
+
+    exts: list[Any] = [
+        CachedCodeHiliteExtension(cache=highlighter) if name == "codehilite" else name
+        for name in extensions
+    ]
+    return markdown.Markdown(extensions=exts)
+
+
+class MarkdownRenderer:
+    """Render Markdown to HTML with reusable converters and an HTML cache.
+
+    Args:
+        extensions: Markdown extensions to enable.
+        cache: Previously rendered HTML by cache key (see ``used``), e.g.
+            restored from a ScanCache.
+        highlighter: Highlight cache for code blocks; a private one is
+            created if omitted.
+    """
+
+    def __init__(
+        self,
+        extensions: tuple[str, ...] = MARKDOWN_EXTENSIONS,
+        cache: dict[str, str] | None = None,
+        highlighter: HighlightCache | None = None,
+    ):
+        self.extensions = tuple(extensions)
+        self.highlighter = highlighter if highlighter is not None else HighlightCache()
+        self._prefix = f"{','.join(self.extensions)}|{_versions()}|".encode()
+        self.cache: dict[str, str] = dict(cache or {})
+        # Entries looked up during this run (what is worth persisting)
+        self.used: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def key(self, text: str) -> str:
+        """Cache key for ``text`` under this renderer's configuration."""
+        data = self._prefix + text.encode("utf-8", "surrogatepass")
+        return hashlib.sha256(data).hexdigest()
+
+    def render(self, text: str) -> str:
+        """Render one page, serving it from the cache when possible."""
+        key = self.key(text)
+        with self._lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                self.used[key] = cached
+                return cached
+        rendered = self._convert(text)
+        with self._lock:
+            self.misses += 1
+            self.cache[key] = self.used[key] = rendered
+        return rendered
+
+    def render_many(self, texts: list[str], workers: int = 1) -> list[str]:
+        """Render a batch of pages.
+
+        Cached and duplicate pages are rendered once. With ``workers``
+        other than 1 and enough pages left, they are spread over a process
+        pool. Its workers are started fresh (``forkserver``, or ``spawn``
+        where that is missing) rather than forked from this process, which
+        may be running threads.
+
+        Args:
+            texts: Page sources.
+            workers: Worker processes; 1 (the default) renders inline, 0
+                picks ``os.cpu_count()`` (capped at 8) for large batches.
+
+        Returns:
+            HTML for each input, in order.
+        """
+        keys = [self.key(t) for t in texts]
+        todo: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in self.cache:
+                self.hits += 1
+            elif key not in todo:
+                self.misses += 1
+                todo[key] = text
+            else:
+                self.hits += 1
+
+        if workers == 0:
+            workers = min(os.cpu_count() or 1, 8)
+        pending = list(todo.items())
+        if workers > 1 and _HAS_MARKDOWN and len(pending) >= PARALLEL_MIN_PAGES:
+            chunksize = max(1, len(pending) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_pool_context(),
+                initializer=_init_worker,
+                initargs=(self.extensions, self.highlighter.items()),
+            ) as pool:
+                rendered = pool.map(
+                    _render_in_worker,
+                    [text for _, text in pending],
+                    chunksize=chunksize,
+                )
+                for (key, _), (out, highlighted) in zip(pending, rendered):
+                    self.cache[key] = out
+                    self.highlighter.merge(highlighted)
+        else:
+            for key, text in pending:
+                self.cache[key] = self._convert(text)
+
+        result = []
+        for key in keys:
+            self.used[key] = self.cache[key]
+            result.append(self.cache[key])
+        return result
+
+    def _convert(self, text: str) -> str:
+        if not _HAS_MARKDOWN:
+            return f"<pre>{text}</pre>"
+        md = getattr(self._local, "md", None)
+        if md is None:
+            md = self._local.md = _build_markdown(self.extensions, self.highlighter)
+        return md.reset().convert(text)
+
+
+# --- Process pool workers ---
+
+_worker_md: Any = None
+_worker_highlighter: HighlightCache | None = None
+
+
+def _pool_context() -> Any:
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def _init_worker(
+    extensions: tuple[str, ...], highlighted: list[tuple[str, str]]
+) -> None:
+    global _worker_md, _worker_highlighter
+    _worker_highlighter = HighlightCache(max(len(highlighted), 4096), highlighted)
+    _worker_md = _build_markdown(extensions, _worker_highlighter)
+
+
+def _render_in_worker(text: str) -> tuple[str, list[tuple[str, str]]]:
+    """Render one page; also return the code blocks it newly highlighted."""
+    assert _worker_highlighter is not None
+    html = _worker_md.reset().convert(text)
+    return html, _worker_highlighter.take_added()
@@ -1,12 +1,14 @@
 """File discovery and AST parsing for Python source files."""
 
 import ast
-import fnmatch
 import hashlib
-import os
+import importlib.util
 import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, Iterable, Iterator
 
 try:
     from tukuy.plugins.ast_fingerprint import (
@@ -24,18 +26,35 @@ try:
 except ImportError:
     _HAS_TUKUY = False
 
+from .cache import ScanCache, content_id, parser_fingerprint
+from .discovery import (
+    MARKDOWN_SUFFIXES,
+    PYTHON_SUFFIXES,
+    SOURCE_SUFFIXES,
+    git_sources,
+    walk_sources,
+)
+from .highlight import HighlightCache
 from .parser import DocstringParser
+from .render import MarkdownRenderer
 from .types import (
+    EMPTY_DICT,
+    EMPTY_LIST,
     ClassDoc,
     DocType,
     FunctionDoc,
     MethodDoc,
     ModuleDoc,
     PageDoc,
+    ParamDoc,
+    ParamKind,
     ParsedDocstring,
     TodoDoc,
 )
 
+# Parameter kinds after which a bare ``*`` marks keyword-only parameters
+_BEFORE_KEYWORD_ONLY = (ParamKind.POSITIONAL_ONLY, ParamKind.POSITIONAL)
+
 # Decorator patterns that indicate an API endpoint
 API_DECORATOR_PATTERNS = [
     # Flask
@@ -239,6 +258,138 @@ def _cognitive_weight(node: ast.AST) -> int:
     return weight
 
 
+# --- Source segments ---
+
+# Line terminators recognised by ast.get_source_segment
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+
+
+class _SourceIndex:
+    """Line-offset table for slicing node source out of a module.
+
+    ``ast.get_source_segment`` re-splits the whole module on every call,
+    which is quadratic for large files with many definitions. This encodes
+    the source once and records the byte offset of each line start, so a
+    segment is a single slice. AST column offsets are UTF-8 byte offsets,
+    which is why the table works on bytes.
+
+    Args:
+        source: Module source text.
+    """
+
+    __slots__ = ("data", "line_starts")
+
+    def __init__(self, source: str):
+        self.data = source.encode("utf-8", "surrogatepass")
+        self.line_starts = [0]
+        self.line_starts.extend(m.end() for m in _LINE_END.finditer(self.data))
+
+    def segment(self, node: ast.stmt | ast.expr) -> str:
+        """Return the source text of ``node``, or "" if it has no position."""
+        try:
+            lineno, end_lineno = node.lineno, node.end_lineno
+            col, end_col = node.col_offset, node.end_col_offset
+        except AttributeError:
+            return ""
+        if end_lineno is None or end_col is None:
+            return ""
+        start = self.line_starts[lineno - 1] + col
+        end = self.line_starts[end_lineno - 1] + end_col
+        return self.data[start:end].decode("utf-8", "surrogatepass")
+
+
+# --- File reading ---
+
+
+def _read_bytes(file_path: Path) -> bytes:
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 with replacement and universal newlines (text-mode open)."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _decode_python(data: bytes) -> str:
+    """Decode Python source honouring its PEP 263 coding cookie or BOM.
+
+    Falls back to lenient UTF-8 when the declared encoding is unknown or
+    the bytes do not decode.
+    """
+    try:
+        return importlib.util.decode_source(data)
+    except (SyntaxError, UnicodeDecodeError, LookupError):
+        return _decode_text(data)
+
+
+def prefetch_files(
+    paths: Iterable[Path], depth: int = 16, workers: int = 4
+) -> Iterator[tuple[Path, bytes]]:
+    """Read files ahead of their consumer on a thread pool.
+
+    Up to ``depth`` files are read (or being read) ahead of the one being
+    yielded, so memory stays bounded while slow or cold storage is kept
+    busy. Files are yielded in input order. Read errors are raised when
+    the affected file is reached.
+
+    Args:
+        paths: Files to read.
+        depth: Read-ahead queue depth; 0 reads each file on demand.
+        workers: Reader threads (at most ``depth``).
+
+    Yields:
+        (path, contents) pairs.
+    """
+    if depth <= 0:
+        for path in paths:
+            yield path, _read_bytes(path)
+        return
+
+    it = iter(paths)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, depth))) as pool:
+        pending: deque = deque()
+        for path in it:
+            pending.append((path, pool.submit(_read_bytes, path)))
+            if len(pending) >= depth:
+                break
+        try:
+            while pending:
+                path, future = pending.popleft()
+                nxt = next(it, None)
+                if nxt is not None:
+                    pending.append((nxt, pool.submit(_read_bytes, nxt)))
+                yield path, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+# --- Interning ---
+
+
+def _compact(items: list[str]) -> list[str]:
+    """Intern repeated identifiers; an empty list becomes ``EMPTY_LIST``.
+
+    Module paths, decorator, base class and call names recur across a
+    whole scan, so one shared string per distinct name keeps large
+    scans small.
+    """
+    if not items:
+        return EMPTY_LIST
+    return [sys.intern(s) for s in items]
+
+
+def _compact_map(items: dict[str, str]) -> dict[str, str]:
+    """Dict counterpart of ``_compact``."""
+    if not items:
+        return EMPTY_DICT
+    return {sys.intern(k): sys.intern(v) for k, v in items.items()}
+
+
 # Pattern for TODO/FIXME/HACK/XXX in comments
 _TODO_PATTERN = re.compile(r"#\s*(TODO|FIXME|HACK|XXX)\b[:\s]*(.*)", re.IGNORECASE)
 
@@ -251,14 +402,14 @@ def _extract_todos(source: str, file_path: str, module_path: str) -> list[TodoDo
         if match:
             todos.append(
                 TodoDoc(
-                    tag=match.group(1).upper(),
+                    tag=sys.intern(match.group(1).upper()),
                     text=match.group(2).strip(),
                     file_path=file_path,
                     line_number=i,
                     module=module_path,
                 )
             )
-    return todos
+    return todos or EMPTY_LIST
 
 
 def _ast_to_value(node: ast.expr) -> Any:
@@ -633,12 +784,20 @@ class Scanner:
     Args:
         exclude_patterns: Glob patterns to exclude from scanning.
         parser: Optional pre-configured DocstringParser.
+        respect_gitignore: Skip files ignored by ``.gitignore``.
+        discovery: ``"filesystem"`` to walk the tree, or ``"git"`` to list
+            files from the git index (falls back to walking outside a
+            repository).
+        renderer: Optional MarkdownRenderer for Markdown pages.
     """
 
     def __init__(
         self,
         exclude_patterns: list[str] | None = None,
         parser: DocstringParser | None = None,
+        respect_gitignore: bool = True,
+        discovery: str = "filesystem",
+        renderer: MarkdownRenderer | None = None,
     ):
         self.exclude_patterns = exclude_patterns or [
             "__pycache__",
@@ -651,6 +810,59 @@ class Scanner:
             "dist",
         ]
         self.parser = parser or DocstringParser()
+        self.renderer = renderer or MarkdownRenderer()
+        self.respect_gitignore = respect_gitignore
+        if discovery not in ("filesystem", "git"):
+            raise ValueError(f"Unknown discovery mode: {discovery!r}")
+        self.discovery = discovery
+        self.last_discovery = discovery
+
+    def iter_sources(
+        self, path: str | Path
+    ) -> Generator[tuple[Path, str | None], None, None]:
+        """Find all Python and Markdown files, with git blob ids if known.
+
+        In git discovery mode the blob id of each unmodified tracked file
+        is returned alongside its path; otherwise the id is None.
+        ``last_discovery`` records which mode actually ran.
+
+        Args:
+            path: Directory (or single file) to search.
+
+        Yields:
+            (path, blob id or None) tuples.
+        """
+        path = Path(path)
+
+        if path.is_file():
+            if path.suffix in SOURCE_SUFFIXES:
+                yield path, None
+            return
+
+        if self.discovery == "git":
+            listed = git_sources(path, self.exclude_patterns)
+            if listed is not None:
+                self.last_discovery = "git"
+                yield from listed
+                return
+
+        self.last_discovery = "filesystem"
+        for file_path in walk_sources(
+            path, self.exclude_patterns, self.respect_gitignore
+        ):
+            yield file_path, None
+
+    def find_source_files(self, path: str | Path) -> Generator[Path, None, None]:
+        """Find all Python and Markdown files in a single traversal.
+
+        Args:
+            path: Directory (or single file) to search.
+
+        Yields:
+            Path objects for each source file found.
+        """
+        for file_path, _ in self.iter_sources(path):
+            yield file_path
 
     def find_python_files(self, path: str | Path) -> Generator[Path, None, None]:
         """Find all Python files in a directory.
@@ -668,22 +880,9 @@ class Scanner:
                 yield path
             return
 
-        for root, dirs, files in os.walk(path):
-            dirs[:] = [
-                d
-                for d in dirs
-                if not any(fnmatch.fnmatch(d, p) for p in self.exclude_patterns)
-            ]
-
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = Path(root) / file
-                    rel_path = str(file_path.relative_to(path))
-                    if not any(
-                        fnmatch.fnmatch(rel_path, p) or fnmatch.fnmatch(file, p)
-                        for p in self.exclude_patterns
-                    ):
-                        yield file_path
+        yield from walk_sources(
+            path, self.exclude_patterns, self.respect_gitignore, PYTHON_SUFFIXES
+        )
 
     def find_markdown_files(self, path: str | Path) -> Generator[Path, None, None]:
         """Find all Markdown files in a directory.
@@ -697,39 +896,30 @@ class Scanner:
         path = Path(path)
 
         if path.is_file():
-            if path.suffix in (".md", ".markdown"):
+            if path.suffix in MARKDOWN_SUFFIXES:
                 yield path
             return
 
-        for root, dirs, files in os.walk(path):
-            dirs[:] = [
-                d
-                for d in dirs
-                if not any(fnmatch.fnmatch(d, p) for p in self.exclude_patterns)
-            ]
-
-            for file in files:
-                if file.endswith((".md", ".markdown")):
-                    file_path = Path(root) / file
-                    rel_path = str(file_path.relative_to(path))
-                    if not any(
-                        fnmatch.fnmatch(rel_path, p) or fnmatch.fnmatch(file, p)
-                        for p in self.exclude_patterns
-                    ):
-                        yield file_path
+        yield from walk_sources(
+            path, self.exclude_patterns, self.respect_gitignore, MARKDOWN_SUFFIXES
+        )
 
-    def scan_module(self, file_path: Path, base_path: Path) -> ModuleDoc:
+    def scan_module(
+        self, file_path: Path, base_path: Path, data: bytes | None = None
+    ) -> ModuleDoc:
         """Scan a Python module and extract documentation.
 
         Args:
             file_path: Path to the Python file.
             base_path: Base path for calculating module name.
+            data: File contents, if already read; read from disk otherwise.
 
         Returns:
             ModuleDoc with extracted documentation.
         """
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            source = f.read()
+        if data is None:
+            data = _read_bytes(file_path)
+        source = _decode_python(data)
 
         try:
             tree = ast.parse(source, filename=str(file_path))
@@ -739,53 +929,62 @@ class Scanner:
                 full_path=self._get_module_path(file_path, base_path),
                 file_path=str(file_path),
                 docstring="",
-                classes=[],
-                functions=[],
             )
 
         module_docstring = ast.get_docstring(tree) or ""
-        module_path = self._get_module_path(file_path, base_path)
+        module_path = sys.intern(self._get_module_path(file_path, base_path))
 
         classes = []
         functions = []
+        index = _SourceIndex(source)
 
         for node in ast.iter_child_nodes(tree):
             if isinstance(node, ast.ClassDef):
-                class_doc = self._extract_class(node, module_path, source)
+                class_doc = self._extract_class(node, module_path, index)
                 classes.append(class_doc)
             elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                func_doc = self._extract_function(node, module_path, source)
+                func_doc = self._extract_function(node, module_path, index)
                 functions.append(func_doc)
 
         todos = _extract_todos(source, str(file_path), module_path)
+        imports = self._extract_imports(
+            tree, module_path, is_package=file_path.name == "__init__.py"
+        )
 
         return ModuleDoc(
-            name=file_path.stem,
+            name=sys.intern(file_path.stem),
             full_path=module_path,
             file_path=str(file_path),
             docstring=module_docstring,
-            classes=classes,
-            functions=functions,
+            classes=classes or EMPTY_LIST,
+            functions=functions or EMPTY_LIST,
             todos=todos,
+            imports=_compact_map(imports),
+            calls=_compact(self._extract_module_calls(tree)),
         )
 
-    def scan_markdown(self, file_path: Path, base_path: Path) -> PageDoc:
+    def scan_markdown(
+        self,
+        file_path: Path,
+        base_path: Path,
+        data: bytes | None = None,
+        html: str | None = None,
+    ) -> PageDoc:
         """Scan a Markdown file and extract content.
 
         Args:
             file_path: Path to the Markdown file.
             base_path: Base path for calculating slug.
+            data: File contents, if already read; read from disk otherwise.
+            html: Rendered HTML, if already rendered (see
+                ``MarkdownRenderer.render_many``).
 
         Returns:
             PageDoc with extracted content.
         """
-        try:
-            import markdown  # type: ignore[import-untyped]
-        except ImportError:
-            markdown = None
-
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
+        if data is None:
+            data = _read_bytes(file_path)
+        content = _decode_text(data)
 
         title = file_path.stem.replace("_", " ").replace("-", " ").title()
         lines = content.split("\n")
@@ -805,13 +1004,7 @@ class Scanner:
         except ValueError:
             slug = file_path.stem.replace(" ", "-").lower()
 
-        if markdown:
-            html_content = markdown.markdown(
-                content,
-                extensions=["fenced_code", "tables", "codehilite", "toc"],
-            )
-        else:
-            html_content = f"<pre>{content}</pre>"
+        html_content = html if html is not None else self.renderer.render(content)
 
         order = 0
         if file_path.stem[0].isdigit():
@@ -862,7 +1055,9 @@ class Scanner:
 
         return DocType.FUNCTION, "", ""
 
-    def _extract_class(self, node: ast.ClassDef, module: str, source: str) -> ClassDoc:
+    def _extract_class(
+        self, node: ast.ClassDef, module: str, index: _SourceIndex
+    ) -> ClassDoc:
         """Extract documentation from a class definition."""
         docstring = ast.get_docstring(node) or ""
         parsed = self.parser.parse(docstring, hint_type=DocType.CLASS)
@@ -873,27 +1068,31 @@ class Scanner:
         methods = []
         for item in node.body:
             if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                method_doc = self._extract_method(item, module, source)
+                method_doc = self._extract_method(item, module, index)
                 methods.append(method_doc)
 
-        class_source = ast.get_source_segment(source, node) or ""
+        class_source = index.segment(node)
 
         return ClassDoc(
             name=node.name,
             module=module,
             full_path=f"{module}.{node.name}",
             docstring=parsed,
-            bases=bases,
-            methods=methods,
+            bases=_compact(bases),
+            methods=methods or EMPTY_LIST,
             source=class_source,
             line_number=node.lineno,
-            decorators=decorators,
+            decorators=_compact(decorators),
             signature_hash=_hash_class_signature(node),
             body_hash=_hash_class_body(node),
+            attribute_types=_compact_map(self._extract_attribute_types(node)),
         )
 
     def _extract_function(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef, module: str, source: str
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        module: str,
+        index: _SourceIndex,
     ) -> FunctionDoc:
         """Extract documentation from a function definition."""
         docstring = ast.get_docstring(node) or ""
@@ -922,8 +1121,12 @@ class Scanner:
         if doc_meta:
             _apply_doc_meta(parsed, doc_meta)
 
-        signature = self._build_signature(node)
-        func_source = ast.get_source_segment(source, node) or ""
+        params = self._build_params(node)
+        return_annotation = (
+            sys.intern(self._get_annotation(node.returns)) if node.returns else ""
+        )
+        signature = self._build_signature(params, return_annotation)
+        func_source = index.segment(node)
         calls = self._extract_calls(node)
         is_deprecated, dep_msg, dep_since = _detect_deprecation(node, docstring)
 
@@ -940,16 +1143,18 @@ class Scanner:
             module=module,
             full_path=f"{module}.{node.name}",
             signature=signature,
+            params=params,
+            return_annotation=return_annotation,
             docstring=parsed,
             is_async=isinstance(node, ast.AsyncFunctionDef),
             source=func_source,
             line_number=node.lineno,
-            decorators=decorators,
-            calls=calls,
+            decorators=_compact(decorators),
+            calls=_compact(calls),
             doc_type=parsed.doc_type,
             signature_hash=_hash_signature(node),
             body_hash=_hash_body(node),
-            body_statement_hashes=_hash_body_per_statement(node),
+            body_statement_hashes=_compact(_hash_body_per_statement(node)),
             call_graph_hash=_call_graph_hash(node),
             complexity=_cyclomatic_complexity(node),
             cognitive_weight=_cognitive_weight(node),
@@ -962,7 +1167,10 @@ class Scanner:
         )
 
     def _extract_method(
-        self, node: ast.FunctionDef | ast.AsyncFunctionDef, module: str, source: str
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        module: str,
+        index: _SourceIndex,
     ) -> MethodDoc:
         """Extract documentation from a method definition."""
         docstring = ast.get_docstring(node) or ""
@@ -996,8 +1204,12 @@ class Scanner:
             ".setter" in d or ".getter" in d or ".deleter" in d for d in decorators
         )
 
-        signature = self._build_signature(node)
-        method_source = ast.get_source_segment(source, node) or ""
+        params = self._build_params(node)
+        return_annotation = (
+            sys.intern(self._get_annotation(node.returns)) if node.returns else ""
+        )
+        signature = self._build_signature(params, return_annotation)
+        method_source = index.segment(node)
         calls = self._extract_calls(node)
         is_deprecated, dep_msg, dep_since = _detect_deprecation(node, docstring)
 
@@ -1013,6 +1225,8 @@ class Scanner:
             name=node.name,
             module=module,
             signature=signature,
+            params=params,
+            return_annotation=return_annotation,
             docstring=parsed,
             is_async=isinstance(node, ast.AsyncFunctionDef),
             is_classmethod=is_classmethod,
@@ -1020,12 +1234,12 @@ class Scanner:
             is_property=is_property,
             source=method_source,
             line_number=node.lineno,
-            decorators=decorators,
-            calls=calls,
+            decorators=_compact(decorators),
+            calls=_compact(calls),
             doc_type=parsed.doc_type,
             signature_hash=_hash_signature(node),
             body_hash=_hash_body(node),
-            body_statement_hashes=_hash_body_per_statement(node),
+            body_statement_hashes=_compact(_hash_body_per_statement(node)),
             call_graph_hash=_call_graph_hash(node),
             complexity=_cyclomatic_complexity(node),
             cognitive_weight=_cognitive_weight(node),
@@ -1051,6 +1265,165 @@ class Scanner:
 
         return sorted(calls)
 
+    def _extract_module_calls(self, tree: ast.Module) -> list[str]:
+        """Extract calls made at import time, outside function and class bodies."""
+        calls: set[str] = set()
+        for stmt in tree.body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                continue
+            for child in ast.walk(stmt):
+                if isinstance(child, ast.Call):
+                    name = self._get_call_name(child.func)
+                    if name:
+                        calls.add(name)
+        return sorted(calls)
+
+    def _extract_imports(
+        self, tree: ast.Module, module: str, is_package: bool
+    ) -> dict[str, str]:
+        """Build the module's import table.
+
+        Maps each locally bound name to the dotted path it refers to.
+        Relative imports are resolved against the module path; imports
+        inside functions are included, but never shadow module-level ones.
+
+        Args:
+            tree: Parsed module.
+            module: Dotted module path (e.g. "pkg.sub.mod").
+            is_package: True for ``__init__.py`` files.
+
+        Returns:
+            Dict of local name -> dotted target.
+        """
+        parts = module.split(".")
+        if is_package:
+            package = [] if module == "__init__" else parts
+        else:
+            package = parts[:-1]
+
+        imports: dict[str, str] = {}
+        # ast.walk is breadth-first, so module-level imports are seen first
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        imports.setdefault(alias.asname, alias.name)
+                    else:
+                        head = alias.name.split(".")[0]
+                        imports.setdefault(head, head)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    keep = len(package) - (node.level - 1)
+                    if keep < 0:
+                        continue
+                    base_parts = package[:keep]
+                    if node.module:
+                        base_parts = base_parts + node.module.split(".")
+                    base = ".".join(base_parts)
+                else:
+                    base = node.module or ""
+                for alias in node.names:
+                    if alias.name == "*":
+                        continue
+                    target = f"{base}.{alias.name}" if base else alias.name
+                    imports.setdefault(alias.asname or alias.name, target)
+        return imports
+
+    def _extract_attribute_types(self, node: ast.ClassDef) -> dict[str, str]:
+        """Infer the types of instance attributes.
+
+        Looks at class-level annotations and ``self.x = ...`` assignments in
+        methods, where the value is a constructor call (``Foo()``), a
+        fallback expression (``x or Foo()``) or an annotated parameter.
+
+        Returns:
+            Dict of attribute name -> type name as written in the source.
+        """
+        types: dict[str, str] = {}
+
+        for item in node.body:
+            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+                type_name = self._annotation_type(item.annotation)
+                if type_name:
+                    types.setdefault(item.target.id, type_name)
+
+        for item in node.body:
+            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            params: dict[str, str] = {}
+            all_args = item.args.posonlyargs + item.args.args + item.args.kwonlyargs
+            for arg in all_args:
+                if arg.annotation:
+                    type_name = self._annotation_type(arg.annotation)
+                    if type_name:
+                        params[arg.arg] = type_name
+
+            for child in ast.walk(item):
+                value: ast.expr | None
+                if isinstance(child, ast.Assign):
+                    targets, value, annotation = child.targets, child.value, None
+                elif isinstance(child, ast.AnnAssign):
+                    targets = [child.target]
+                    value, annotation = child.value, child.annotation
+                else:
+                    continue
+                for target in targets:
+                    if not (
+                        isinstance(target, ast.Attribute)
+                        and isinstance(target.value, ast.Name)
+                        and target.value.id == "self"
+                    ):
+                        continue
+                    type_name = None
+                    if annotation is not None:
+                        type_name = self._annotation_type(annotation)
+                    if not type_name and value is not None:
+                        type_name = self._value_type(value, params)
+                    if type_name:
+                        types.setdefault(target.attr, type_name)
+
+        return types
+
+    def _value_type(self, node: ast.expr, params: dict[str, str]) -> str | None:
+        """Guess the type of an assigned value, if it is obvious."""
+        if isinstance(node, ast.Call):
+            return self._get_call_name(node.func)
+        if isinstance(node, ast.Name):
+            return params.get(node.id)
+        if isinstance(node, ast.BoolOp):
+            for value in node.values:
+                type_name = self._value_type(value, params)
+                if type_name:
+                    return type_name
+        return None
+
+    def _annotation_type(self, node: ast.expr) -> str | None:
+        """Reduce an annotation to a single dotted type name.
+
+        Unwraps ``Optional[X]``, ``X | None`` and string annotations;
+        returns None for anything more complex.
+        """
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            try:
+                node = ast.parse(node.value, mode="eval").body
+            except SyntaxError:
+                return None
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            sides = [
+                side
+                for side in (node.left, node.right)
+                if not (isinstance(side, ast.Constant) and side.value is None)
+            ]
+            return self._annotation_type(sides[0]) if len(sides) == 1 else None
+        if isinstance(node, ast.Subscript):
+            if self._get_name(node.value).split(".")[-1] == "Optional":
+                return self._annotation_type(node.slice)
+            return None
+        if isinstance(node, (ast.Name, ast.Attribute)):
+            name = self._get_name(node)
+            return None if name == "None" else name
+        return None
+
     def _get_call_name(self, node: ast.expr) -> str | None:
         """Get the name of a function being called."""
         if isinstance(node, ast.Name):
@@ -1064,56 +1437,69 @@ class Scanner:
             return self._get_call_name(node.value)
         return None
 
-    def _build_signature(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
-        """Build a function signature string."""
+    def _build_params(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[ParamDoc]:
+        """Collect a function's parameters, in declaration order."""
         args = node.args
-        parts = []
-
-        if hasattr(args, "posonlyargs"):
-            for arg in args.posonlyargs:
-                parts.append(self._format_arg(arg))
-            if args.posonlyargs:
-                parts.append("/")
-
-        num_defaults = len(args.defaults)
-        num_args = len(args.args)
-        for i, arg in enumerate(args.args):
-            default_idx = i - (num_args - num_defaults)
-            if default_idx >= 0:
-                default = args.defaults[default_idx]
-                parts.append(f"{self._format_arg(arg)}={self._get_default(default)}")
-            else:
-                parts.append(self._format_arg(arg))
-
+        positional = [(arg, ParamKind.POSITIONAL_ONLY) for arg in args.posonlyargs]
+        positional += [(arg, ParamKind.POSITIONAL) for arg in args.args]
+        # Defaults belong to the last positional parameters
+        first_default = len(positional) - len(args.defaults)
+
+        params = []
+        for i, (arg, kind) in enumerate(positional):
+            default = args.defaults[i - first_default] if i >= first_default else None
+            params.append(self._param(arg, kind, default))
         if args.vararg:
-            parts.append(f"*{self._format_arg(args.vararg)}")
-        elif args.kwonlyargs:
-            parts.append("*")
-
-        len(args.kw_defaults)
-        for i, arg in enumerate(args.kwonlyargs):
-            if args.kw_defaults[i] is not None:
-                parts.append(
-                    f"{self._format_arg(arg)}={self._get_default(args.kw_defaults[i])}"  # type: ignore[arg-type]
-                )
-            else:
-                parts.append(self._format_arg(arg))
-
+            params.append(self._param(args.vararg, ParamKind.VAR_POSITIONAL))
+        for arg, kw_default in zip(args.kwonlyargs, args.kw_defaults):
+            params.append(self._param(arg, ParamKind.KEYWORD_ONLY, kw_default))
         if args.kwarg:
-            parts.append(f"**{self._format_arg(args.kwarg)}")
+            params.append(self._param(args.kwarg, ParamKind.VAR_KEYWORD))
+        return params or EMPTY_LIST
+
+    def _param(
+        self, arg: ast.arg, kind: ParamKind, default: ast.expr | None = None
+    ) -> ParamDoc:
+        """Build a ParamDoc from an AST argument and its default."""
+        return ParamDoc(
+            name=sys.intern(arg.arg),
+            kind=kind,
+            annotation=sys.intern(self._get_annotation(arg.annotation))
+            if arg.annotation
+            else "",
+            default=self._get_default(default) if default is not None else None,
+        )
 
-        signature = f"({', '.join(parts)})"
-        if node.returns:
-            signature += f" -> {self._get_annotation(node.returns)}"
+    @staticmethod
+    def _build_signature(params: list[ParamDoc], return_annotation: str = "") -> str:
+        """Format parameters as a signature string, e.g. ``(a, *, b=1) -> int``."""
+        parts = []
+        for i, param in enumerate(params):
+            kind = param.kind
+            if kind is ParamKind.KEYWORD_ONLY and (
+                i == 0 or params[i - 1].kind in _BEFORE_KEYWORD_ONLY
+            ):
+                parts.append("*")
+            text = param.name
+            if param.annotation:
+                text += f": {param.annotation}"
+            if param.default is not None:
+                text += f"={param.default}"
+            if kind is ParamKind.VAR_POSITIONAL:
+                text = "*" + text
+            elif kind is ParamKind.VAR_KEYWORD:
+                text = "**" + text
+            parts.append(text)
+            if kind is ParamKind.POSITIONAL_ONLY and (
+                i + 1 == len(params) or params[i + 1].kind is not ParamKind.POSITIONAL_ONLY
+            ):
+                parts.append("/")
 
+        signature = f"({', '.join(parts)})"
+        if return_annotation:
+            signature += f" -> {return_annotation}"
         return signature
 
-    def _format_arg(self, arg: ast.arg) -> str:
-        """Format a function argument with optional type annotation."""
-        if arg.annotation:
-            return f"{arg.arg}: {self._get_annotation(arg.annotation)}"
-        return arg.arg
-
     def _get_annotation(self, node: ast.expr) -> str:
         """Get string representation of a type annotation."""
         if isinstance(node, ast.Constant):
@@ -1173,10 +1559,38 @@ class Scanner:
             return ast.unparse(node) if hasattr(ast, "unparse") else "..."
 
 
+def scan_fingerprint(path: str | Path, parser: DocstringParser | None = None) -> str:
+    """Fingerprint of everything besides file contents that affects scanning.
+
+    Used to invalidate a ScanCache when the source root, parser
+    configuration or hashing backend changes.
+    """
+    parser = parser or DocstringParser()
+    return parser_fingerprint(
+        str(Path(path).resolve()), parser.fingerprint, _HAS_TUKUY
+    )
+
+
+def source_key(file_path: Path, base_path: Path) -> str:
+    """Cache key of a source file: its POSIX path relative to the root."""
+    try:
+        return file_path.relative_to(base_path).as_posix()
+    except ValueError:
+        return file_path.as_posix()
+
+
 def scan_directory(
     path: str | Path,
     exclude_patterns: list[str] | None = None,
     parser: DocstringParser | None = None,
+    respect_gitignore: bool = True,
+    discovery: str = "filesystem",
+    cache: ScanCache | None = None,
+    stats: dict[str, Any] | None = None,
+    read_ahead: int = 16,
+    render_workers: int = 1,
+    highlighter: HighlightCache | None = None,
+    sources: list[tuple[Path, str | None]] | None = None,
 ) -> tuple[list[ModuleDoc], list[PageDoc]]:
     """Scan a directory for Python and Markdown files.
 
@@ -1184,25 +1598,84 @@ def scan_directory(
         path: Directory path to scan.
         exclude_patterns: Patterns to exclude.
         parser: Optional pre-configured DocstringParser.
+        respect_gitignore: Skip files ignored by ``.gitignore``.
+        discovery: ``"filesystem"`` or ``"git"``.
+        cache: Optional ScanCache; unchanged files are served from it,
+            and the parser's docstring memo and rendered Markdown are
+            restored from and saved to it.
+        stats: Optional dict that receives discovery and parse statistics.
+        read_ahead: Number of files read ahead on a thread pool while
+            earlier ones are parsed; 0 reads files one at a time.
+        render_workers: Processes for rendering Markdown pages; 1 renders
+            inline, 0 picks one per CPU for large batches.
+        highlighter: Optional HighlightCache shared by code blocks in
+            Markdown pages (e.g. one persisted with the build output).
+        sources: Files to scan as (path, git blob id) pairs from
+            ``Scanner.iter_sources``; discovered under ``path`` if None.
 
     Returns:
         Tuple of (modules, pages) lists.
     """
-    scanner = Scanner(exclude_patterns, parser)
+    renderer = MarkdownRenderer(
+        cache=cache.render_cache if cache else None, highlighter=highlighter
+    )
+    scanner = Scanner(
+        exclude_patterns, parser, respect_gitignore, discovery, renderer
+    )
     base_path = Path(path)
+    if cache is not None:
+        scanner.parser.load_memo(cache.parse_memo)
+
+    if sources is None:
+        sources = list(scanner.iter_sources(base_path))
+    docs: list[Any] = [None] * len(sources)
+
+    # Serve unchanged files from the cache; the rest go through read-ahead
+    to_scan: list[tuple[int, str, str]] = []
+    for i, (file_path, blob_id) in enumerate(sources):
+        key = cid = ""
+        if cache is not None:
+            key = source_key(file_path, base_path)
+            cid = content_id(file_path, blob_id)
+            docs[i] = cache.get(key, cid)
+            if docs[i] is not None:
+                continue
+        to_scan.append((i, key, cid))
+
+    # Markdown pages are rendered as one batch once everything is read
+    markdown_pages: list[tuple[int, str, str, bytes]] = []
+    contents = prefetch_files((sources[i][0] for i, _, _ in to_scan), read_ahead)
+    for (i, key, cid), (file_path, data) in zip(to_scan, contents):
+        if file_path.suffix != ".py":
+            markdown_pages.append((i, key, cid, data))
+            continue
+        docs[i] = scanner.scan_module(file_path, base_path, data)
+        if cache is not None:
+            cache.put(key, cid, docs[i])
 
-    modules = []
-    pages = []
-
-    for py_file in scanner.find_python_files(base_path):
-        module_doc = scanner.scan_module(py_file, base_path)
-        modules.append(module_doc)
+    rendered = renderer.render_many(
+        [_decode_text(data) for _, _, _, data in markdown_pages], render_workers
+    )
+    for (i, key, cid, data), html in zip(markdown_pages, rendered):
+        docs[i] = scanner.scan_markdown(sources[i][0], base_path, data, html)
+        if cache is not None:
+            cache.put(key, cid, docs[i])
 
-    for md_file in scanner.find_markdown_files(base_path):
-        page_doc = scanner.scan_markdown(md_file, base_path)
-        pages.append(page_doc)
+    modules = [d for (f, _), d in zip(sources, docs) if f.suffix == ".py"]
+    pages = [d for (f, _), d in zip(sources, docs) if f.suffix != ".py"]
 
     modules.sort(key=lambda m: m.full_path)
     pages.sort(key=lambda p: (p.order, p.title))
 
+    if cache is not None:
+        cache.parse_memo = scanner.parser.memo_items()
+        cache.render_cache = renderer.used
+
+    if stats is not None:
+        stats["discovery"] = scanner.last_discovery
+        stats["files"] = len(modules) + len(pages)
+        stats["parse_memo"] = scanner.parser.memo_stats
+        stats["render"] = renderer.stats
+        stats["highlight"] = renderer.highlighter.stats
+
     return modules, pages
@@ -0,0 +1,223 @@
+"""Multi-process documentation server.
+
+``cacaodocs serve --workers N`` imports the generated ``app.py`` once, in
+a parent process, so ``data.json`` is parsed and the page tree built a
+single time. The parent then forks N uvicorn workers that accept
+connections on one shared listening socket. The workers inherit the
+loaded data and share its memory pages copy-on-write; everything loaded
+is frozen out of the garbage collector before forking, so collections in
+a worker do not write to (and copy) the shared pages.
+
+Forking needs a POSIX system; ``can_fork`` tells whether it is available.
+With one worker, ``serve_app`` serves from the current process. Either
+way the app follows rebuilds of its docs (see ``cacaodocs.live``), and
+docs built with ``--sqlite`` are searchable at ``/_cacaodocs/search``.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import signal
+import socket
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, Callable
+
+# Pending connections the shared socket holds for the workers
+BACKLOG = 2048
+
+# Most results a search request returns
+SEARCH_LIMIT = 50
+
+
+def can_fork() -> bool:
+    """Whether worker processes can be forked on this platform."""
+    return hasattr(os, "fork")
+
+
+def load_app(app_file: str | Path, live: bool = True) -> Any:
+    """Import a generated ``app.py`` and return its ASGI application.
+
+    Like ``cacao run``, this changes into the app's directory first. The
+    server modules are imported here too, so the workers share them.
+
+    Args:
+        app_file: Generated ``app.py``.
+        live: Swap in new builds of the docs while serving.
+    """
+    import uvicorn  # noqa: F401
+    from cacao.cli.runner import find_app_instance, load_app_module
+    from cacao.server.server import create_server
+
+    from .live import LiveApp
+    from .store import STORE_FILE
+
+    app_file = Path(app_file).resolve()
+    os.chdir(app_file.parent)
+    app = find_app_instance(load_app_module(app_file))
+    asgi = create_server(app)
+    add_search(asgi, app_file.parent / STORE_FILE)
+    if live:
+        LiveApp(app, app_file).install(asgi)
+    return asgi
+
+
+def add_search(asgi: Any, store_file: Path) -> None:
+    """Answer ``/_cacaodocs/search?q=...`` from the docs' full-text index.
+
+    Responds 404 while the docs have no ``docs.sqlite``.
+    """
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    from .live import ROUTE_PREFIX
+    from .store import DocStore
+
+    # A plain function: Starlette runs it in its thread pool
+    def search(request: Any) -> JSONResponse:
+        if not store_file.is_file():
+            return JSONResponse({"results": []}, status_code=404)
+        try:
+            limit = min(int(request.query_params.get("limit", 20)), SEARCH_LIMIT)
+        except ValueError:
+            limit = 20
+        # Opened per request, as rebuilds replace the file
+        store = DocStore(store_file)
+        try:
+            results = store.search(request.query_params.get("q", ""), limit)
+        finally:
+            store.close()
+        return JSONResponse({"results": results})
+
+    # Ahead of Cacao's catch-all page route
+    asgi.router.routes.insert(0, Route(f"{ROUTE_PREFIX}/search", search))
+
+
+def bind(host: str, port: int) -> socket.socket:
+    """Open the listening socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.create_server((host, port), family=family, backlog=BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(asgi: Any, sock: socket.socket) -> None:
+    """Serve ``asgi`` with uvicorn on an already bound socket."""
+    import uvicorn
+    from cacao.server.log import get_uvicorn_log_config
+
+    config = uvicorn.Config(
+        asgi,
+        log_config=get_uvicorn_log_config(),
+        # Open long polls (see cacaodocs.live) would hold up a shutdown
+        timeout_graceful_shutdown=3,
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve_app(
+    app_file: str | Path,
+    host: str,
+    port: int,
+    load: Callable[[Path], Any] = load_app,
+) -> None:
+    """Serve a docs app from the current process."""
+    asgi = load(Path(app_file))
+    with bind(host, port) as sock:
+        run_worker(asgi, sock)
+
+
+def serve_workers(
+    app_file: str | Path,
+    host: str,
+    port: int,
+    workers: int,
+    load: Callable[[Path], Any] = load_app,
+    worker: Callable[[Any, socket.socket], None] = run_worker,
+) -> int:
+    """Preload a docs app and serve it from ``workers`` forked processes.
+
+    Workers killed by a signal (e.g. by the OOM killer) are replaced. A
+    worker that exits with an error stops the server. SIGINT or SIGTERM
+    to the parent stops all workers gracefully.
+
+    Args:
+        app_file: Generated ``app.py``.
+        host: Host to bind to.
+        port: Port to listen on.
+        workers: Number of worker processes.
+        load: Callable(app_file) returning the ASGI app, run once in the
+            parent.
+        worker: Callable(asgi, sock) serving requests in a worker.
+
+    Returns:
+        Exit status: 0 after a requested stop, 1 if a worker failed.
+    """
+    asgi = load(Path(app_file))
+    sock = bind(host, port)
+
+    # Everything loaded so far is shared with the workers
+    gc.collect()
+    gc.freeze()
+
+    children: dict[int, int] = {}  # pid -> worker number
+    stopping = False
+    status = 0
+
+    def spawn(number: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                # Own process group: Ctrl+C reaches the parent only, which
+                # stops the workers once
+                os.setpgid(0, 0)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                worker(asgi, sock)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        children[pid] = number
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    handlers = {
+        signum: signal.signal(signum, stop)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        for number in range(workers):
+            spawn(number)
+        while children:
+            try:
+                pid, wait_status = os.wait()
+            except ChildProcessError:
+                break
+            exited: int | None = children.pop(pid, None)
+            if exited is None or stopping:
+                continue
+            if os.WIFSIGNALED(wait_status):
+                spawn(exited)
+            elif os.waitstatus_to_exitcode(wait_status) != 0:
+                status = 1
+                stop(signal.SIGTERM, None)
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+        sock.close()
+        gc.unfreeze()
+    return status
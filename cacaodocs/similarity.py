@@ -0,0 +1,247 @@
+"""Duplicate and near-duplicate function detection.
+
+Builds a similarity index over the per-statement body hashes captured by
+the scanner. Exact duplicates are grouped by ``body_hash``; near-duplicates
+are found with MinHash signatures over statement-hash shingles and
+locality-sensitive hashing (LSH) banding, so only functions that share a
+band bucket are ever compared. Candidate pairs are verified with the exact
+Jaccard similarity of their shingle sets before being clustered.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from .types import ModuleDoc
+
+# Mersenne prime used for the universal hash family h(x) = (a*x + b) mod p
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 64) - 1
+
+
+@dataclass
+class _Entry:
+    """A function or method participating in the index."""
+
+    full_path: str
+    name: str
+    module: str
+    kind: str
+    line_number: int
+    body_hash: str
+    statements: list[str]
+
+
+def _iter_entries(modules: list[ModuleDoc]) -> Iterator[_Entry]:
+    """Yield every function and method that carries statement hashes."""
+    for module in modules:
+        for func in module.functions:
+            yield _Entry(
+                full_path=func.full_path,
+                name=func.name,
+                module=func.module,
+                kind="function",
+                line_number=func.line_number,
+                body_hash=func.body_hash,
+                statements=func.body_statement_hashes,
+            )
+        for cls in module.classes:
+            for method in cls.methods:
+                yield _Entry(
+                    full_path=f"{cls.full_path}.{method.name}",
+                    name=method.name,
+                    module=method.module,
+                    kind="method",
+                    line_number=method.line_number,
+                    body_hash=method.body_hash,
+                    statements=method.body_statement_hashes,
+                )
+
+
+def _shingles(statements: list[str]) -> set[int]:
+    """Turn a statement-hash sequence into a set of integer shingles.
+
+    Single statements capture shared content; consecutive pairs capture
+    ordering, so reordered bodies score lower than verbatim copies.
+    """
+    values = [int(h, 16) & _MASK for h in statements]
+    result = set(values)
+    for a, b in zip(values, values[1:]):
+        result.add(((a * 0x9E3779B97F4A7C15) ^ b) & _MASK)
+    return result
+
+
+def _jaccard(a: set[int], b: set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Deterministic MinHash signature generator.
+
+    Args:
+        num_perm: Number of hash permutations (signature length).
+        seed: Seed for the permutation coefficients.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._coeffs = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: set[int]) -> tuple[int, ...]:
+        """Compute the MinHash signature of a shingle set."""
+        if not shingles:
+            return tuple([_PRIME] * self.num_perm)
+        return tuple(
+            min((a * x + b) % _PRIME for x in shingles) for a, b in self._coeffs
+        )
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def _member(entry: _Entry) -> dict[str, Any]:
+    return {
+        "full_path": entry.full_path,
+        "name": entry.name,
+        "module": entry.module,
+        "doc_type": entry.kind,
+        "line_number": entry.line_number,
+        "statements": len(entry.statements),
+    }
+
+
+def find_duplicates(
+    modules: list[ModuleDoc],
+    threshold: float = 0.8,
+    min_statements: int = 3,
+    num_perm: int = 64,
+    bands: int = 16,
+) -> dict[str, Any]:
+    """Find exact and near-duplicate function bodies across modules.
+
+    Runs in roughly linear time: each body is hashed once, and only bodies
+    that collide in at least one LSH band are compared pairwise.
+
+    Args:
+        modules: Scanned modules.
+        threshold: Minimum Jaccard similarity for a near-duplicate pair.
+        min_statements: Bodies shorter than this are ignored (trivial
+            getters, ``pass`` stubs, etc.).
+        num_perm: MinHash signature length. Must be divisible by ``bands``.
+        bands: Number of LSH bands.
+
+    Returns:
+        Dict with ``exact`` groups, ``near`` clusters and ``stats``.
+    """
+    if num_perm % bands:
+        raise ValueError("num_perm must be divisible by bands")
+
+    entries = [
+        e
+        for e in _iter_entries(modules)
+        if e.body_hash and len(e.statements) >= min_statements
+    ]
+
+    # --- Exact duplicates: group by whole-body hash ---
+    by_body: dict[str, list[_Entry]] = {}
+    for entry in entries:
+        by_body.setdefault(entry.body_hash, []).append(entry)
+
+    groups = [sorted(g, key=lambda e: e.full_path) for g in by_body.values()]
+    groups.sort(key=lambda g: g[0].full_path)
+
+    exact = [
+        {
+            "body_hash": g[0].body_hash,
+            "statements": len(g[0].statements),
+            "members": [_member(e) for e in g],
+        }
+        for g in groups
+        if len(g) > 1
+    ]
+
+    # --- Near duplicates: MinHash + LSH over one representative per group ---
+    hasher = MinHasher(num_perm=num_perm)
+    rows = num_perm // bands
+    shingle_sets = [_shingles(g[0].statements) for g in groups]
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    for idx, shingles in enumerate(shingle_sets):
+        sig = hasher.signature(shingles)
+        for band in range(bands):
+            key = (band, sig[band * rows : (band + 1) * rows])
+            buckets.setdefault(key, []).append(idx)
+
+    candidates: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for i, a in enumerate(members):
+            for b in members[i + 1 :]:
+                candidates.add((a, b))
+
+    uf = _UnionFind(len(groups))
+    edges: list[tuple[int, float]] = []
+    for a, b in candidates:
+        score = _jaccard(shingle_sets[a], shingle_sets[b])
+        if score >= threshold:
+            uf.union(a, b)
+            edges.append((a, score))
+
+    # Weakest verified link per cluster
+    cluster_score: dict[int, float] = {}
+    for a, score in edges:
+        root = uf.find(a)
+        cluster_score[root] = min(score, cluster_score.get(root, 1.0))
+
+    clusters: dict[int, list[int]] = {}
+    for idx in range(len(groups)):
+        root = uf.find(idx)
+        if root in cluster_score:
+            clusters.setdefault(root, []).append(idx)
+
+    near: list[dict[str, Any]] = []
+    for root, idxs in clusters.items():
+        cluster = sorted(
+            (e for i in idxs for e in groups[i]), key=lambda e: e.full_path
+        )
+        near.append(
+            {
+                "similarity": round(cluster_score[root], 3),
+                "members": [_member(e) for e in cluster],
+            }
+        )
+    near.sort(key=lambda c: (-len(c["members"]), c["members"][0]["full_path"]))
+
+    return {
+        "exact": exact,
+        "near": near,
+        "stats": {
+            "indexed": len(entries),
+            "unique_bodies": len(groups),
+            "candidate_pairs": len(candidates),
+            "threshold": threshold,
+            "min_statements": min_statements,
+        },
+    }
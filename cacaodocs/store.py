@@ -0,0 +1,724 @@
+"""SQLite store of built documentation.
+
+With ``sqlite: true`` in the config (``cacaodocs build --sqlite``) a
+build also writes ``docs.sqlite``: modules, classes, functions, methods,
+documented arguments, calls, TODOs and changes in indexed tables, and an
+FTS5 index over names, summaries and descriptions.
+
+The generated app then reads its data through ``StoreData``, a mapping
+shaped like ``data.json`` whose entries are fetched when they are
+accessed. The app only touches what it displays, so undocumented items,
+the call graph and the other sections it does not show are never
+loaded. ``DocStore`` answers call graph and full-text queries with SQL.
+
+SQLite ships with Python, so none of this needs a network or a server.
+Python builds whose SQLite lacks FTS5 get a plain table searched with
+``LIKE`` instead.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Iterator
+
+STORE_FILE = "docs.sqlite"
+
+# Bump when the schema changes (stored as PRAGMA user_version)
+STORE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE modules (
+    id INTEGER PRIMARY KEY,
+    full_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE classes (
+    id INTEGER PRIMARY KEY,
+    module_id INTEGER NOT NULL REFERENCES modules (id),
+    position INTEGER NOT NULL,
+    full_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+-- list: "functions" or "api_endpoints", the data.json list holding the
+-- function at list_index
+CREATE TABLE functions (
+    id INTEGER PRIMARY KEY,
+    module_id INTEGER NOT NULL REFERENCES modules (id),
+    position INTEGER NOT NULL,
+    list TEXT NOT NULL,
+    list_index INTEGER NOT NULL,
+    full_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    complexity INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE methods (
+    id INTEGER PRIMARY KEY,
+    class_id INTEGER NOT NULL REFERENCES classes (id),
+    position INTEGER NOT NULL,
+    full_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    complexity INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+-- Documented arguments; owner is the full_path of the function or method
+CREATE TABLE args (
+    owner TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    default_value TEXT,
+    required INTEGER
+);
+-- callee is a full_path, or the raw call string when it did not resolve
+CREATE TABLE calls (
+    caller TEXT NOT NULL,
+    callee TEXT NOT NULL,
+    resolved INTEGER NOT NULL,
+    PRIMARY KEY (caller, callee)
+) WITHOUT ROWID;
+CREATE TABLE todos (
+    id INTEGER PRIMARY KEY,
+    module_id INTEGER NOT NULL REFERENCES modules (id),
+    tag TEXT NOT NULL,
+    text TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    line_number INTEGER NOT NULL,
+    module TEXT NOT NULL
+);
+CREATE TABLE changes (
+    id INTEGER PRIMARY KEY,
+    full_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    change TEXT NOT NULL
+);
+CREATE TABLE pages (
+    id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL,
+    title TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX modules_path ON modules (full_path);
+CREATE INDEX classes_module ON classes (module_id, position);
+CREATE INDEX classes_path ON classes (full_path);
+CREATE INDEX functions_module ON functions (module_id, position);
+CREATE UNIQUE INDEX functions_list ON functions (list, list_index);
+CREATE INDEX functions_path ON functions (full_path);
+CREATE INDEX methods_class ON methods (class_id, position);
+CREATE INDEX methods_path ON methods (full_path);
+CREATE INDEX args_owner ON args (owner, position);
+CREATE INDEX args_name ON args (name);
+CREATE INDEX calls_callee ON calls (callee, caller);
+CREATE INDEX todos_module ON todos (module_id);
+CREATE INDEX todos_tag ON todos (tag);
+CREATE INDEX changes_path ON changes (full_path);
+"""
+
+# Columns of the search index; kind and full_path identify the match
+_SEARCH_COLUMNS = "name, full_path, summary, description, kind"
+_FTS_SEARCH = f"CREATE VIRTUAL TABLE search USING fts5({_SEARCH_COLUMNS} UNINDEXED)"
+_PLAIN_SEARCH = f"CREATE TABLE search ({_SEARCH_COLUMNS})"
+
+# bm25 weights of the search columns: names count most
+_RANK = "bm25(search, 10.0, 5.0, 2.0, 1.0)"
+
+# data.json lists whose entries are rows of their own tables
+_LISTS = ("modules", "classes", "functions", "api_endpoints")
+
+# Fields refilled from other tables when an entry is read
+_MODULE_CHILDREN = ("classes", "functions", "todos")
+
+_TAG = re.compile(r"<[^>]+>")
+
+
+def _json(value: Any) -> str:
+    # Records from lazy builds are DocView mappings
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=lambda o: dict(o) if isinstance(o, Mapping) else str(o),
+    )
+
+
+def _summary(item: Mapping[str, Any]) -> tuple[str, str]:
+    ds = item.get("docstring") or {}
+    if isinstance(ds, str):
+        summary, _, description = ds.strip().partition("\n")
+        return summary, description.strip()
+    return ds.get("summary", ""), ds.get("description", "")
+
+
+def _without(item: Mapping[str, Any], children: tuple[str, ...]) -> str:
+    # Keep the keys (and so their order) of the children stored elsewhere
+    return _json({k: [] if k in children else item[k] for k in item})
+
+
+def fts5_available() -> bool:
+    """Whether the SQLite library Python uses has FTS5."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+# --- Writing ---
+
+
+def write_store(data: Mapping[str, Any], path: str | Path) -> None:
+    """Write documentation data to a new ``docs.sqlite`` file.
+
+    The same data always produces the same bytes, so a build can leave
+    an unchanged store in place.
+
+    Args:
+        data: Documentation data as written to ``data.json``.
+        path: File to create; an existing file is replaced.
+    """
+    path = Path(path)
+    path.unlink(missing_ok=True)
+    fts = fts5_available()
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(_SCHEMA)
+        conn.execute(_FTS_SEARCH if fts else _PLAIN_SEARCH)
+        with conn:
+            _insert(conn, data)
+            if fts:
+                # Merge the index into one segment for faster queries
+                conn.execute("INSERT INTO search (search) VALUES ('optimize')")
+        conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+    finally:
+        conn.close()
+
+
+def _insert(conn: sqlite3.Connection, data: Mapping[str, Any]) -> None:
+    search: list[tuple[str, str, str, str, str]] = []
+    args: list[tuple[Any, ...]] = []
+
+    def add_args(owner: str, item: Mapping[str, Any]) -> None:
+        ds = item.get("docstring") or {}
+        for pos, arg in enumerate(ds.get("args") or []):
+            args.append(
+                (
+                    owner,
+                    pos,
+                    arg["name"],
+                    arg.get("type") or "",
+                    arg.get("description") or "",
+                    arg.get("default"),
+                    arg.get("required"),
+                )
+            )
+
+    list_index = {"functions": 0, "api_endpoints": 0}
+    class_id = function_id = 0
+    for module_id, mod in enumerate(data.get("modules", [])):
+        summary, description = _summary(mod)
+        conn.execute(
+            "INSERT INTO modules VALUES (?, ?, ?, ?, ?)",
+            (
+                module_id,
+                mod["full_path"],
+                mod["name"],
+                mod.get("file_path", ""),
+                _without(mod, _MODULE_CHILDREN),
+            ),
+        )
+        label = mod["full_path"] if mod["name"] == "__init__" else mod["name"]
+        search.append((label, mod["full_path"], summary, description, "module"))
+
+        for pos, cls in enumerate(mod.get("classes", [])):
+            summary, description = _summary(cls)
+            conn.execute(
+                "INSERT INTO classes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    class_id,
+                    module_id,
+                    pos,
+                    cls["full_path"],
+                    cls["name"],
+                    summary,
+                    _without(cls, ("methods",)),
+                ),
+            )
+            search.append(
+                (cls["name"], cls["full_path"], summary, description, "class")
+            )
+            for mpos, method in enumerate(cls.get("methods", [])):
+                path = f"{cls['full_path']}.{method['name']}"
+                summary, description = _summary(method)
+                conn.execute(
+                    "INSERT INTO methods (class_id, position, full_path, name, "
+                    "doc_type, complexity, summary, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        class_id,
+                        mpos,
+                        path,
+                        method["name"],
+                        method.get("doc_type", "function"),
+                        method.get("complexity", 1),
+                        summary,
+                        _json(method),
+                    ),
+                )
+                search.append((method["name"], path, summary, description, "method"))
+                add_args(path, method)
+            class_id += 1
+
+        for pos, func in enumerate(mod.get("functions", [])):
+            doc_type = func.get("doc_type", "function")
+            # build_json splits endpoints from the other functions
+            name = "api_endpoints" if doc_type == "api" else "functions"
+            summary, description = _summary(func)
+            conn.execute(
+                "INSERT INTO functions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    function_id,
+                    module_id,
+                    pos,
+                    name,
+                    list_index[name],
+                    func["full_path"],
+                    func["name"],
+                    doc_type,
+                    func.get("complexity", 1),
+                    summary,
+                    _json(func),
+                ),
+            )
+            kind = "api" if doc_type == "api" else "function"
+            search.append((func["name"], func["full_path"], summary, description, kind))
+            add_args(func["full_path"], func)
+            list_index[name] += 1
+            function_id += 1
+
+        conn.executemany(
+            "INSERT INTO todos (module_id, tag, text, file_path, line_number, module) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    module_id,
+                    t["tag"],
+                    t["text"],
+                    t.get("file_path", ""),
+                    t.get("line_number", 0),
+                    t.get("module", ""),
+                )
+                for t in mod.get("todos", [])
+            ),
+        )
+
+    conn.executemany("INSERT INTO args VALUES (?, ?, ?, ?, ?, ?, ?)", args)
+
+    nodes = set(data.get("call_graph", {}).get("nodes", ()))
+    conn.executemany(
+        "INSERT OR IGNORE INTO calls VALUES (?, ?, ?)",
+        (
+            (caller, callee, callee in nodes)
+            for callee, callers in data.get("called_by", {}).items()
+            for caller in callers
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO changes (full_path, name, doc_type, change) VALUES (?, ?, ?, ?)",
+        (
+            (ch["full_path"], ch["name"], ch["doc_type"], ch["change"])
+            for ch in data.get("changes", [])
+        ),
+    )
+    for page in data.get("pages", []):
+        conn.execute(
+            "INSERT INTO pages (slug, title, data) VALUES (?, ?, ?)",
+            (page["slug"], page["title"], _json(page)),
+        )
+        text = " ".join(_TAG.sub(" ", page.get("content", "")).split())
+        search.append((page["title"], page["slug"], "", text, "page"))
+
+    conn.executemany(
+        f"INSERT INTO search ({_SEARCH_COLUMNS}) VALUES (?, ?, ?, ?, ?)", search
+    )
+    conn.executemany(
+        "INSERT INTO meta VALUES (?, ?)",
+        (
+            (key, _json(value))
+            for key, value in data.items()
+            if key not in _LISTS
+            and key not in ("pages", "todos", "changes", "called_by")
+        ),
+    )
+
+
+# --- Reading ---
+
+# Everything reached from :start over resolved calls, following calls
+# from {src} to {dst}
+_CLOSURE = """
+WITH RECURSIVE walk (name) AS (
+    SELECT {dst} FROM calls WHERE {src} = :start AND resolved
+    UNION
+    SELECT c.{dst} FROM calls c JOIN walk w ON c.{src} = w.name WHERE c.resolved
+)
+SELECT name FROM walk ORDER BY name
+"""
+_WITHIN = """
+WITH RECURSIVE walk (name, depth) AS (
+    SELECT {dst}, 1 FROM calls WHERE {src} = :start AND resolved
+    UNION
+    SELECT c.{dst}, w.depth + 1 FROM calls c JOIN walk w ON c.{src} = w.name
+    WHERE c.resolved AND w.depth < :depth
+)
+SELECT DISTINCT name FROM walk ORDER BY name
+"""
+
+
+class DocStore:
+    """Queries against a ``docs.sqlite`` file.
+
+    The file is opened read-only on first use in each process (SQLite
+    connections must not cross a fork) and shared by its threads.
+
+    Args:
+        path: The ``docs.sqlite`` file.
+
+    Raises:
+        ValueError: On first use, if the file was written by an
+            incompatible version of CacaoDocs.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            uri = self.path.resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != STORE_VERSION:
+                conn.close()
+                raise ValueError(
+                    f"{self.path}: store version {version}, expected {STORE_VERSION}"
+                )
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def query(self, sql: str, params: Any = ()) -> list[tuple[Any, ...]]:
+        """Run a read-only query and return all rows."""
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        """Close this process's connection (reopened when queried again)."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    # --- Documentation data ---
+
+    def meta(self, key: str) -> Any:
+        """A ``data.json`` section stored as a whole.
+
+        Raises:
+            KeyError: If the data has no such section.
+        """
+        rows = self.query("SELECT value FROM meta WHERE key = ?", (key,))
+        if not rows:
+            raise KeyError(key)
+        return json.loads(rows[0][0])
+
+    def length(self, name: str) -> int:
+        """Number of entries in one of the ``data.json`` lists."""
+        params: tuple[str, ...]
+        if name in ("functions", "api_endpoints"):
+            sql, params = "SELECT count(*) FROM functions WHERE list = ?", (name,)
+        else:
+            sql, params = f"SELECT count(*) FROM {name}", ()
+        return self.query(sql, params)[0][0]
+
+    def entry(self, name: str, index: int) -> dict[str, Any]:
+        """Entry ``index`` of ``modules``, ``classes``, ``functions`` or
+        ``api_endpoints``, as it appears in ``data.json``.
+
+        Raises:
+            IndexError: If there is no such entry.
+        """
+        if name == "modules":
+            rows = self.query("SELECT id, data FROM modules WHERE id = ?", (index,))
+        elif name == "classes":
+            rows = self.query("SELECT id, data FROM classes WHERE id = ?", (index,))
+        else:
+            rows = self.query(
+                "SELECT id, data FROM functions WHERE list = ? AND list_index = ?",
+                (name, index),
+            )
+        if not rows:
+            raise IndexError(f"{name} index out of range")
+        row_id, data = rows[0]
+        if name == "modules":
+            return self._module(row_id, data)
+        if name == "classes":
+            return self._class(row_id, data)
+        return json.loads(data)
+
+    def _class(self, class_id: int, data: str) -> dict[str, Any]:
+        cls = json.loads(data)
+        cls["methods"] = [
+            json.loads(m)
+            for (m,) in self.query(
+                "SELECT data FROM methods WHERE class_id = ? ORDER BY position",
+                (class_id,),
+            )
+        ]
+        return cls
+
+    def _module(self, module_id: int, data: str) -> dict[str, Any]:
+        mod = json.loads(data)
+        mod["classes"] = [
+            self._class(class_id, cls)
+            for class_id, cls in self.query(
+                "SELECT id, data FROM classes WHERE module_id = ? ORDER BY position",
+                (module_id,),
+            )
+        ]
+        mod["functions"] = [
+            json.loads(f)
+            for (f,) in self.query(
+                "SELECT data FROM functions WHERE module_id = ? ORDER BY position",
+                (module_id,),
+            )
+        ]
+        mod["todos"] = self.todos(module_id)
+        return mod
+
+    def pages(self) -> list[dict[str, Any]]:
+        """All Markdown pages, in order."""
+        rows = self.query("SELECT data FROM pages ORDER BY id")
+        return [json.loads(page) for (page,) in rows]
+
+    def todos(self, module_id: int | None = None) -> list[dict[str, Any]]:
+        """TODO comments, of all modules or of one."""
+        sql = "SELECT tag, text, file_path, line_number, module FROM todos"
+        params: tuple[Any, ...] = ()
+        if module_id is not None:
+            sql += " WHERE module_id = ?"
+            params = (module_id,)
+        keys = ("tag", "text", "file_path", "line_number", "module")
+        rows = self.query(sql + " ORDER BY id", params)
+        return [dict(zip(keys, row)) for row in rows]
+
+    def changes(self) -> list[dict[str, str]]:
+        """Changes since the previous build."""
+        keys = ("full_path", "name", "doc_type", "change")
+        rows = self.query(f"SELECT {', '.join(keys)} FROM changes ORDER BY id")
+        return [dict(zip(keys, row)) for row in rows]
+
+    # --- Calls ---
+
+    def called_by(self, name: str) -> list[str]:
+        """Direct callers of ``name``, resolved or not, sorted."""
+        rows = self.query(
+            "SELECT caller FROM calls WHERE callee = ? ORDER BY caller", (name,)
+        )
+        return [caller for (caller,) in rows]
+
+    def _walk(self, name: str, depth: int | None, src: str, dst: str) -> list[str]:
+        if depth is None:
+            rows = self.query(_CLOSURE.format(src=src, dst=dst), {"start": name})
+        else:
+            rows = self.query(
+                _WITHIN.format(src=src, dst=dst), {"start": name, "depth": depth}
+            )
+        return [n for (n,) in rows]
+
+    def callees(self, name: str, depth: int | None = 1) -> list[str]:
+        """Functions called by ``name``, directly or transitively.
+
+        Same results as ``CallGraph.callees``, from the calls table.
+
+        Args:
+            name: Canonical full_path of the caller.
+            depth: Maximum number of hops; None for the full closure.
+        """
+        return self._walk(name, depth, "caller", "callee")
+
+    def callers(self, name: str, depth: int | None = 1) -> list[str]:
+        """Functions that call ``name``, directly or transitively.
+
+        Args:
+            name: Canonical full_path of the callee.
+            depth: Maximum number of hops; None for the full closure.
+        """
+        return self._walk(name, depth, "callee", "caller")
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Whether ``source`` transitively calls ``target``."""
+        return target in self.callees(source, depth=None)
+
+    # --- Search ---
+
+    def search(self, query: str, limit: int = 20) -> list[dict[str, str]]:
+        """Modules, classes, functions, methods and pages matching ``query``.
+
+        Every word must match; the last one may be a prefix, so results
+        follow what is being typed. Best matches come first.
+
+        Returns:
+            Dicts with ``kind``, ``name``, ``full_path`` (the slug for
+            pages) and ``summary``.
+        """
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return []
+        sql = self.query("SELECT sql FROM sqlite_master WHERE name = 'search'")[0][0]
+        if sql.startswith("CREATE VIRTUAL"):
+            match = " ".join(f'"{t}"' for t in terms) + "*"
+            # Items named exactly as searched first
+            rows = self.query(
+                f"SELECT kind, name, full_path, summary FROM search "
+                f"WHERE search MATCH ? "
+                f"ORDER BY name = ? COLLATE NOCASE DESC, {_RANK} LIMIT ?",
+                (match, query.strip(), limit),
+            )
+        else:
+            text = "name || ' ' || full_path || ' ' || summary || ' ' || description"
+            where = " AND ".join([f"{text} LIKE ? ESCAPE '\\'"] * len(terms))
+            # \w+ terms can hold "_", a LIKE wildcard
+            patterns = ["%" + t.replace("_", "\\_") + "%" for t in terms]
+            rows = self.query(
+                f"SELECT kind, name, full_path, summary FROM search WHERE {where} "
+                "ORDER BY name = ? COLLATE NOCASE DESC, length(name), name LIMIT ?",
+                (*patterns, query.strip(), limit),
+            )
+        keys = ("kind", "name", "full_path", "summary")
+        return [dict(zip(keys, row)) for row in rows]
+
+
+class _Entries(Sequence[dict[str, Any]]):
+    """A ``data.json`` list whose entries are fetched when indexed.
+
+    Each access returns a new dict; nothing is kept.
+    """
+
+    def __init__(self, store: DocStore, name: str):
+        self.store = store
+        self.name = name
+        self._length: int | None = None
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = self.store.length(self.name)
+        return self._length
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self.store.entry(self.name, index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for i in range(len(self)):
+            yield self.store.entry(self.name, i)
+
+
+class _CalledBy(Mapping[str, list[str]]):
+    """The ``called_by`` map of ``data.json``, answered from the calls table."""
+
+    def __init__(self, store: DocStore):
+        self.store = store
+
+    def __getitem__(self, name: str) -> list[str]:
+        callers = self.store.called_by(name)
+        if not callers:
+            raise KeyError(name)
+        return callers
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self.store.query("SELECT DISTINCT callee FROM calls ORDER BY callee")
+        return (callee for (callee,) in rows)
+
+    def __len__(self) -> int:
+        return self.store.query("SELECT count(DISTINCT callee) FROM calls")[0][0]
+
+
+class StoreData(Mapping[str, Any]):
+    """``data.json`` contents read from ``docs.sqlite`` as they are used.
+
+    ``modules``, ``classes``, ``functions`` and ``api_endpoints`` are
+    sequences that fetch an entry when it is indexed, and ``called_by``
+    looks callers up per name. Other sections are decoded on first
+    access and kept.
+
+    Args:
+        store: A ``DocStore`` or the path of a ``docs.sqlite`` file.
+    """
+
+    def __init__(self, store: DocStore | str | Path):
+        self.store = store if isinstance(store, DocStore) else DocStore(store)
+        self._sections: dict[str, Any] = {}
+        self._keys: list[str] | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._sections:
+            self._sections[key] = self._load(key)
+        return self._sections[key]
+
+    def _load(self, key: str) -> Any:
+        if key in _LISTS:
+            return _Entries(self.store, key)
+        if key == "pages":
+            return self.store.pages()
+        if key == "todos":
+            return self.store.todos()
+        if key == "called_by":
+            return _CalledBy(self.store)
+        if key == "changes":
+            changes = self.store.changes()
+            if not changes:
+                # Like data.json, which only has changes when there are any
+                raise KeyError(key)
+            return changes
+        return self.store.meta(key)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._keys is None:
+            keys = [*_LISTS, "pages", "todos", "called_by"]
+            if self.store.query("SELECT 1 FROM changes LIMIT 1"):
+                keys.append("changes")
+            rows = self.store.query("SELECT key FROM meta ORDER BY key")
+            self._keys = keys + [key for (key,) in rows]
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
@@ -1,8 +1,14 @@
-"""Data structures for parsed documentation."""
+"""Data structures for parsed documentation.
+
+All records use ``__slots__``. List and dict fields default to shared,
+immutable empty containers (``EMPTY_LIST``/``EMPTY_DICT``) instead of a
+fresh container per instance, since most of them stay empty; assign a new
+list or dict to populate such a field rather than modifying it in place.
+"""
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, NoReturn, Optional
 
 
 class DocType(str, Enum):
@@ -20,10 +26,55 @@ class DocType(str, Enum):
     CUSTOM = "custom"
 
 
+# --- Shared empty defaults ---
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        "shared empty default cannot be modified; assign a new container instead"
+    )
+
+
+class _EmptyList(list):  # type: ignore[type-arg]
+    """Immutable empty list; pickles and copies as the shared singleton."""
+
+    __slots__ = ()
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _empty_list, ()
+
+
+class _EmptyDict(dict):  # type: ignore[type-arg]
+    """Immutable empty dict; pickles and copies as the shared singleton."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _empty_dict, ()
+
+
+EMPTY_LIST: Any = _EmptyList()
+EMPTY_DICT: Any = _EmptyDict()
+
+
+def _empty_list() -> Any:
+    return EMPTY_LIST
+
+
+def _empty_dict() -> Any:
+    return EMPTY_DICT
+
+
 # --- Shared doc atoms ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ArgDoc:
     """Represents a function/method argument or parameter."""
 
@@ -34,7 +85,7 @@ class ArgDoc:
     required: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnDoc:
     """Represents return value documentation."""
 
@@ -42,7 +93,7 @@ class ReturnDoc:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RaiseDoc:
     """Represents an exception that may be raised."""
 
@@ -53,16 +104,16 @@ class RaiseDoc:
 # --- API-specific types ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseDoc:
     """Represents an API response for a specific status code."""
 
     status_code: int
     description: str
-    fields: list[ArgDoc] = field(default_factory=list)
+    fields: list[ArgDoc] = field(default_factory=_empty_list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeaderDoc:
     """Represents an HTTP header."""
 
@@ -75,7 +126,7 @@ class HeaderDoc:
 # --- Event-specific types ---
 
 
-@dataclass
+@dataclass(slots=True)
 class PayloadFieldDoc:
     """Represents a field in an event payload."""
 
@@ -87,7 +138,7 @@ class PayloadFieldDoc:
 # --- Config-specific types ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigFieldDoc:
     """Represents a configuration field or env var."""
 
@@ -102,7 +153,7 @@ class ConfigFieldDoc:
 # --- Custom type definition ---
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomSectionDef:
     """Definition for a custom section in a user-defined doc type."""
 
@@ -110,20 +161,20 @@ class CustomSectionDef:
     format: str = "text"  # "text", "args", "code", "list"
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomDocTypeDef:
     """User-defined doc type from cacao.yaml."""
 
     name: str
     label: str
     icon: str = "file"
-    sections: list[CustomSectionDef] = field(default_factory=list)
+    sections: list[CustomSectionDef] = field(default_factory=_empty_list)
 
 
 # --- Parsed docstring (extended) ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDocstring:
     """Parsed docstring with sections for all doc types."""
 
@@ -132,37 +183,60 @@ class ParsedDocstring:
     doc_type: DocType = DocType.FUNCTION
 
     # Function sections
-    args: list[ArgDoc] = field(default_factory=list)
+    args: list[ArgDoc] = field(default_factory=_empty_list)
     returns: Optional[ReturnDoc] = None
-    raises: list[RaiseDoc] = field(default_factory=list)
-    examples: list[str] = field(default_factory=list)
-    attributes: list[ArgDoc] = field(default_factory=list)
-    notes: list[str] = field(default_factory=list)
+    raises: list[RaiseDoc] = field(default_factory=_empty_list)
+    examples: list[str] = field(default_factory=_empty_list)
+    attributes: list[ArgDoc] = field(default_factory=_empty_list)
+    notes: list[str] = field(default_factory=_empty_list)
 
     # API sections
     http_method: str = ""
     path: str = ""
-    path_params: list[ArgDoc] = field(default_factory=list)
-    query_params: list[ArgDoc] = field(default_factory=list)
-    request_body: list[ArgDoc] = field(default_factory=list)
-    responses: list[ResponseDoc] = field(default_factory=list)
-    headers: list[HeaderDoc] = field(default_factory=list)
+    path_params: list[ArgDoc] = field(default_factory=_empty_list)
+    query_params: list[ArgDoc] = field(default_factory=_empty_list)
+    request_body: list[ArgDoc] = field(default_factory=_empty_list)
+    responses: list[ResponseDoc] = field(default_factory=_empty_list)
+    headers: list[HeaderDoc] = field(default_factory=_empty_list)
 
     # Event sections
     trigger: str = ""
-    payload: list[PayloadFieldDoc] = field(default_factory=list)
+    payload: list[PayloadFieldDoc] = field(default_factory=_empty_list)
 
     # Config sections
-    config_fields: list[ConfigFieldDoc] = field(default_factory=list)
+    config_fields: list[ConfigFieldDoc] = field(default_factory=_empty_list)
 
     # Custom sections (name -> content)
-    custom_sections: dict[str, Any] = field(default_factory=dict)
+    custom_sections: dict[str, Any] = field(default_factory=_empty_dict)
+
+
+# --- Signature types ---
+
+
+class ParamKind(str, Enum):
+    """How a parameter can be passed (mirrors ``inspect.Parameter.kind``)."""
+
+    POSITIONAL_ONLY = "positional_only"
+    POSITIONAL = "positional"
+    VAR_POSITIONAL = "var_positional"
+    KEYWORD_ONLY = "keyword_only"
+    VAR_KEYWORD = "var_keyword"
+
+
+@dataclass(slots=True)
+class ParamDoc:
+    """A parameter as declared in a function signature."""
+
+    name: str
+    kind: ParamKind = ParamKind.POSITIONAL
+    annotation: str = ""
+    default: Optional[str] = None  # source text; None if there is no default
 
 
 # --- Document-level types ---
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodDoc:
     """Represents a class method."""
 
@@ -176,12 +250,15 @@ class MethodDoc:
     is_property: bool
     source: str
     line_number: int
-    decorators: list[str] = field(default_factory=list)
-    calls: list[str] = field(default_factory=list)
+    params: list[ParamDoc] = field(default_factory=_empty_list)
+    return_annotation: str = ""
+    decorators: list[str] = field(default_factory=_empty_list)
+    calls: list[str] = field(default_factory=_empty_list)
+    resolved_calls: list[str] = field(default_factory=_empty_list)
     doc_type: DocType = DocType.FUNCTION
     signature_hash: str = ""
     body_hash: str = ""
-    body_statement_hashes: list[str] = field(default_factory=list)
+    body_statement_hashes: list[str] = field(default_factory=_empty_list)
     call_graph_hash: str = ""
     complexity: int = 1
     cognitive_weight: int = 0
@@ -193,7 +270,7 @@ class MethodDoc:
     hidden: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDoc:
     """Represents a standalone function."""
 
@@ -205,12 +282,15 @@ class FunctionDoc:
     is_async: bool
     source: str
     line_number: int
-    decorators: list[str] = field(default_factory=list)
-    calls: list[str] = field(default_factory=list)
+    params: list[ParamDoc] = field(default_factory=_empty_list)
+    return_annotation: str = ""
+    decorators: list[str] = field(default_factory=_empty_list)
+    calls: list[str] = field(default_factory=_empty_list)
+    resolved_calls: list[str] = field(default_factory=_empty_list)
     doc_type: DocType = DocType.FUNCTION
     signature_hash: str = ""
     body_hash: str = ""
-    body_statement_hashes: list[str] = field(default_factory=list)
+    body_statement_hashes: list[str] = field(default_factory=_empty_list)
     call_graph_hash: str = ""
     complexity: int = 1
     cognitive_weight: int = 0
@@ -222,7 +302,7 @@ class FunctionDoc:
     hidden: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassDoc:
     """Represents a class."""
 
@@ -234,13 +314,14 @@ class ClassDoc:
     methods: list[MethodDoc]
     source: str
     line_number: int
-    decorators: list[str] = field(default_factory=list)
+    decorators: list[str] = field(default_factory=_empty_list)
     doc_type: DocType = DocType.CLASS
     signature_hash: str = ""
     body_hash: str = ""
+    attribute_types: dict[str, str] = field(default_factory=_empty_dict)  # attr -> type
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoDoc:
     """A TODO/FIXME/HACK comment found in source code."""
 
@@ -251,7 +332,7 @@ class TodoDoc:
     module: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleDoc:
     """Represents a Python module."""
 
@@ -259,12 +340,14 @@ class ModuleDoc:
     full_path: str  # e.g., "cacao.server.signal"
     file_path: str
     docstring: str
-    classes: list[ClassDoc] = field(default_factory=list)
-    functions: list[FunctionDoc] = field(default_factory=list)
-    todos: list[TodoDoc] = field(default_factory=list)
+    classes: list[ClassDoc] = field(default_factory=_empty_list)
+    functions: list[FunctionDoc] = field(default_factory=_empty_list)
+    todos: list[TodoDoc] = field(default_factory=_empty_list)
+    imports: dict[str, str] = field(default_factory=_empty_dict)  # local name -> target
+    calls: list[str] = field(default_factory=_empty_list)  # module-level calls
 
 
-@dataclass
+@dataclass(slots=True)
 class PageDoc:
     """Represents a Markdown documentation page."""
 
@@ -276,7 +359,7 @@ class PageDoc:
     doc_type: DocType = DocType.PAGE
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentationData:
     """Complete documentation data structure."""
 
@@ -0,0 +1,174 @@
+"""Local load test for ``cacaodocs serve``.
+
+Starts ``cacaodocs serve`` on a built docs directory once per worker
+count, drives it with keep-alive HTTP clients for a fixed time, and
+reports requests/sec, latency, and the memory of every server process.
+RSS counts pages shared with other processes in full; PSS splits them
+between the sharers, so total PSS is what the server costs (Linux only).
+
+Usage:
+    python scripts/loadtest.py ./docs --workers 1,4 --path /api/pages
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+def wait_ready(host: str, port: int, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server did not start on {host}:{port}")
+
+
+def wait_closed(host: str, port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                time.sleep(0.2)
+        except OSError:
+            return
+
+
+def client(
+    host: str, port: int, path: str, duration: float
+) -> tuple[int, collections.Counter, list]:
+    """One keep-alive connection issuing requests until ``duration`` ends."""
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    ok = 0
+    errors: collections.Counter = collections.Counter()
+    latencies = []
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException) as e:
+            errors[type(e).__name__] += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - start)
+        if response.status == 200:
+            ok += 1
+        else:
+            errors[f"HTTP {response.status}"] += 1
+    conn.close()
+    return ok, errors, latencies
+
+
+def process_tree(pid: int) -> list[int]:
+    """``pid`` and all of its descendants (Linux)."""
+    tree = [pid]
+    for parent in tree:
+        try:
+            with open(f"/proc/{parent}/task/{parent}/children") as f:
+                tree.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+    return tree
+
+
+def memory(pid: int) -> dict[str, int]:
+    """RSS, PSS and private (USS) memory of a process in KiB (Linux)."""
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if value.strip().endswith("kB"):
+                    fields[name] = int(value.split()[0])
+    except OSError:
+        return {}
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def run(args: argparse.Namespace, workers: int) -> None:
+    cmd = [sys.executable, "-m", "cacaodocs.cli", "serve", args.directory]
+    cmd += ["--host", args.host, "--port", str(args.port), "--workers", str(workers)]
+    server = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    try:
+        wait_ready(args.host, args.port)
+        # Warm up every worker before measuring
+        client(args.host, args.port, args.path, 1.0)
+
+        with ProcessPoolExecutor(args.clients) as pool:
+            runs = [
+                pool.submit(client, args.host, args.port, args.path, args.duration)
+                for _ in range(args.clients)
+            ]
+            results = [r.result() for r in runs]
+        ok = sum(r[0] for r in results)
+        errors = sum((r[1] for r in results), collections.Counter())
+        latencies = sorted(t for r in results for t in r[2])
+
+        print(f"\nworkers={workers} clients={args.clients} path={args.path}")
+        print(f"  requests/sec: {ok / args.duration:.1f}  ({ok} ok)")
+        if errors:
+            print(f"  errors:       {dict(errors.most_common())}")
+        if latencies:
+            p50 = latencies[len(latencies) // 2] * 1000
+            p99 = latencies[int(len(latencies) * 0.99)] * 1000
+            print(f"  latency:      p50 {p50:.1f} ms, p99 {p99:.1f} ms")
+        total = 0
+        for pid in process_tree(server.pid):
+            mem = memory(pid)
+            if not mem:
+                continue
+            total += mem["pss"]
+            print(
+                f"  pid {pid:>7}:  RSS {mem['rss'] / 1024:7.1f} MiB  "
+                f"PSS {mem['pss'] / 1024:7.1f} MiB  USS {mem['uss'] / 1024:7.1f} MiB"
+            )
+        if total:
+            print(f"  total PSS:    {total / 1024:.1f} MiB")
+    finally:
+        os.killpg(server.pid, signal.SIGTERM)
+        server.wait(timeout=30)
+        wait_closed(args.host, args.port)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", help="Built docs directory (holds app.py)")
+    parser.add_argument(
+        "--workers", default="1,4", help="Comma-separated worker counts to compare"
+    )
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    parser.add_argument("--path", default="/", help="Path to request")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18502)
+    args = parser.parse_args()
+    for workers in (int(n) for n in args.workers.split(",")):
+        run(args, workers)
+
+
+if __name__ == "__main__":
+    main()
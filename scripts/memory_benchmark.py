@@ -0,0 +1,132 @@
+"""Memory benchmark for scanning a source tree.
+
+Runs ``scan_directory`` under tracemalloc and reports the memory the
+resulting document model retains (after a garbage collection) and the
+peak reached while scanning. Files are read one at a time and the scan
+cache is not used, so only the model itself is measured.
+
+With ``--ref``, the same measurement also runs against other versions
+of CacaoDocs (any git ref, extracted to a temporary directory), so a
+change can be compared with the code before it.
+
+Usage:
+    python scripts/memory_benchmark.py /usr/lib/python3.11 \\
+        --exclude site-packages --exclude idlelib --ref HEAD~1
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import inspect
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+MIB = 1024 * 1024
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def measure(directory: str, exclude: list[str]) -> dict[str, float]:
+    """Scan ``directory`` with the importable CacaoDocs and measure it."""
+    from cacaodocs.config import DEFAULT_CONFIG
+    from cacaodocs.scanner import scan_directory
+
+    options: dict[str, int] = {}
+    # Versions before read-ahead existed read files one at a time anyway
+    if "read_ahead" in inspect.signature(scan_directory).parameters:
+        options["read_ahead"] = 0
+    patterns = DEFAULT_CONFIG["exclude_patterns"] + exclude
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    modules, _ = scan_directory(directory, patterns, **options)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "modules": len(modules),
+        "functions": sum(
+            len(m.functions) + sum(len(c.methods) for c in m.classes)
+            for m in modules
+        ),
+        "seconds": elapsed,
+        "retained": retained / MIB,
+        "peak": peak / MIB,
+    }
+
+
+def measure_ref(ref: str, directory: str, exclude: list[str]) -> dict[str, float]:
+    """Run ``measure`` in a subprocess against CacaoDocs as of ``ref``."""
+    archive = subprocess.run(
+        ["git", "-C", str(REPO), "archive", "--format=tar", ref, "cacaodocs"],
+        check=True,
+        capture_output=True,
+    ).stdout
+    with tempfile.TemporaryDirectory() as tree:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tree, filter="data")
+        command = [sys.executable, __file__, directory, "--json"]
+        for pattern in exclude:
+            command += ["--exclude", pattern]
+        env = dict(os.environ, PYTHONPATH=tree)
+        out = subprocess.run(
+            command, check=True, capture_output=True, text=True, env=env
+        ).stdout
+    return json.loads(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", help="Source tree to scan")
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help="Extra exclude pattern (repeatable)",
+    )
+    parser.add_argument(
+        "--ref",
+        action="append",
+        default=[],
+        help="Git ref of CacaoDocs to compare with (repeatable)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print one JSON result")
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(measure(args.directory, args.exclude)))
+        return
+
+    results = {ref: measure_ref(ref, args.directory, args.exclude) for ref in args.ref}
+    # The working tree, whether or not CacaoDocs is installed
+    sys.path.insert(0, str(REPO))
+    results["working tree"] = measure(args.directory, args.exclude)
+
+    first = next(iter(results.values()))
+    print(f"modules: {first['modules']}  functions and methods: {first['functions']}")
+    print(f"{'version':<16} {'retained':>12} {'peak':>12} {'scan time':>10}")
+    for name, r in results.items():
+        change = ""
+        if r is not first:
+            change = f"  ({(r['retained'] / first['retained'] - 1) * 100:+.0f}%)"
+        print(
+            f"{name:<16} {r['retained']:>8.1f} MiB {r['peak']:>8.1f} MiB"
+            f" {r['seconds']:>8.1f} s{change}"
+        )
+    print("(scan times are slowed down by tracemalloc)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _user_cache_dir(tmp_path_factory, monkeypatch):
+    # Keep build caches out of the real user cache directory
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
@@ -0,0 +1,193 @@
+"""Tests for cacaodocs.builder analyses."""
+
+import textwrap
+
+from cacaodocs.builder import (
+    CHAT_CONTEXT_FILE,
+    _compute_coverage,
+    _detect_breaking_changes,
+    build_docs,
+    build_json,
+)
+from cacaodocs.scanner import scan_directory
+
+
+def _build(tmp_path, source):
+    (tmp_path / "mod.py").write_text(textwrap.dedent(source), encoding="utf-8")
+    modules, pages = scan_directory(tmp_path)
+    return build_json(modules, pages, {})
+
+
+def _without_params(data):
+    """Strip structured params, as in a data.json from an older build."""
+    funcs = [
+        {k: v for k, v in f.items() if k not in ("params", "return_annotation")}
+        for f in data["functions"]
+    ]
+    return dict(data, functions=funcs)
+
+
+class TestSignatureAnalysis:
+    def test_coverage_uses_params(self, tmp_path):
+        data = _build(
+            tmp_path,
+            '''\
+            def f(self, x: dict[str, int] = {"a": (1, 2)}, *, y=None) -> int:
+                """Do f.
+
+                Args:
+                    x: The x.
+                """
+            ''',
+        )
+        checks = _compute_coverage(data)["items"][0]["checks"]
+        assert checks["args_total"] == 2
+        assert checks["args_missing"] == ["y"]
+        assert checks["has_return_annotation"] is True
+        assert _compute_coverage(_without_params(data)) == _compute_coverage(data)
+
+    def test_breaking_changes(self, tmp_path):
+        old = _build(tmp_path, "def f(a: int, b=1) -> str:\n    pass\n")
+        new = _build(tmp_path, "def f(a: str, *, c, d=(1, 2)) -> bytes:\n    pass\n")
+
+        for before in (old, _without_params(old)):
+            details = _detect_breaking_changes(before, new)[0]["details"]
+            changes = {(d["type"], d.get("arg")) for d in details}
+            assert changes == {
+                ("arg_removed", "b"),
+                ("required_arg_added", "c"),
+                ("optional_arg_added", "d"),
+                ("type_changed", "a"),
+                ("return_type_changed", None),
+            }
+
+    def test_variadic_args_not_breaking(self, tmp_path):
+        old = _build(tmp_path, "def f(a, **kw):\n    pass\n")
+        new = _build(tmp_path, "def f(a, *args, **kw2):\n    pass\n")
+
+        for before in (old, _without_params(old)):
+            (change,) = _detect_breaking_changes(before, new)
+            assert change["is_breaking"] is False
+            assert change["details"] == [
+                {"type": "optional_arg_added", "arg": "args", "breaking": False}
+            ]
+
+
+VIEWS_SOURCE = '''\
+"""Shop."""
+
+
+@app.get("/users/{id}")
+def get_user(id):
+    """Get a user."""
+    return load(id)
+
+
+@app.post("/users")
+def create_user(name):
+    """Create a user."""
+    return save(name)
+
+
+def load(id):
+    """Load."""
+    return id
+
+
+def save(name):
+    """Save.
+
+    Deprecated: use store.
+    """
+    return len(name)
+
+
+def bare():
+    pass
+
+
+class Store:
+    """A store."""
+
+    def __init__(self):
+        pass
+
+    def get(self, k):
+        """Get."""
+        return load(k)
+
+    def nodoc(self):
+        pass
+
+
+class Undocumented:
+    def m(self):
+        """M."""
+# TODO: one
+# FIXME: two
+# TODO: three
+'''
+
+
+class TestViews:
+    def test_documented_items_selected(self, tmp_path):
+        data = _build(tmp_path, VIEWS_SOURCE)
+        views = data["views"]
+
+        assert [data["functions"][i]["name"] for i in views["functions"]] == [
+            "load",
+            "save",
+        ]
+        assert [data["api_endpoints"][i]["name"] for i in views["api_endpoints"]] == [
+            "get_user",
+            "create_user",
+        ]
+        (store,) = views["classes"]
+        cls = data["classes"][store["index"]]
+        assert cls["name"] == "Store"
+        assert [cls["methods"][i]["name"] for i in store["methods"]] == ["__init__", "get"]
+        assert views["class_groups"] == {"mod": [0]}
+        assert views["endpoint_groups"] == {"/users": [0, 1]}
+        assert views["api_method_counts"] == {"GET": 1, "POST": 1}
+
+    def test_aggregates(self, tmp_path):
+        data = _build(tmp_path, VIEWS_SOURCE)
+        views = data["views"]
+
+        assert views["todo_counts"] == {"FIXME": 1, "TODO": 2}
+        assert [d["full_path"] for d in views["deprecated"]] == ["mod.save"]
+        callers = {e["caller"]: e["internal"] for e in views["call_entries"]}
+        assert callers["mod.get_user"] == ["mod.load"]
+        assert callers["mod.Store.get"] == ["mod.load"]
+        reach = {r["endpoint"]: r["sample"] for r in views["endpoint_reach"]}
+        assert reach == {"mod.get_user": ["mod.load"], "mod.create_user": ["mod.save"]}
+        scores = [i["score"] for i in views["low_coverage"]]
+        assert scores == sorted(scores) and all(s < 100 for s in scores)
+
+    def test_lazy_views_match(self, tmp_path):
+        (tmp_path / "mod.py").write_text(VIEWS_SOURCE, encoding="utf-8")
+        modules, pages = scan_directory(tmp_path)
+        lazy = build_json(modules, pages, {}, lazy=True)
+        assert lazy["views"] == build_json(modules, pages, {})["views"]
+
+
+class TestChatContext:
+    def test_context_kept_out_of_app_code(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        out = tmp_path / "out"
+        config = {"chat": True, "cache": False, "custom_doc_types": []}
+
+        (src / "mod.py").write_text('def f():\n    """Frobnicate widgets."""\n')
+        build_docs(str(src), str(out), dict(config))
+        app_code = (out / "app.py").read_text(encoding="utf-8")
+        context = (out / CHAT_CONTEXT_FILE).read_text(encoding="utf-8")
+        assert "Frobnicate widgets." in context
+        assert "Frobnicate" not in app_code
+        compile(app_code, "app.py", "exec")
+
+        # Docstring edits only touch the context file
+        (src / "mod.py").write_text('def f():\n    """Polish gadgets."""\n')
+        build_docs(str(src), str(out), dict(config))
+        assert (out / "app.py").read_text(encoding="utf-8") == app_code
+        assert "Polish gadgets." in (out / CHAT_CONTEXT_FILE).read_text(encoding="utf-8")
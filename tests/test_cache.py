@@ -0,0 +1,131 @@
+"""Tests for cacaodocs.cache scan cache."""
+
+import os
+
+from cacaodocs.builder import build_docs
+from cacaodocs.cache import ScanCache, cache_dir, content_id
+from cacaodocs.scanner import scan_directory, scan_fingerprint
+
+
+class TestScanCache:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "scan.pickle"
+        cache = ScanCache(path, "fp")
+        cache.put("a.py", "git:abc", {"doc": 1})
+        cache.save()
+
+        reloaded = ScanCache(path, "fp")
+        reloaded.load()
+        assert reloaded.get("a.py", "git:abc") == {"doc": 1}
+        assert reloaded.get("a.py", "git:def") is None
+        assert reloaded.stats == {"hits": 1, "misses": 1}
+
+    def test_fingerprint_mismatch_discards(self, tmp_path):
+        path = tmp_path / "scan.pickle"
+        cache = ScanCache(path, "old")
+        cache.put("a.py", "x", 1)
+        cache.save()
+
+        reloaded = ScanCache(path, "new")
+        reloaded.load()
+        assert reloaded.get("a.py", "x") is None
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "scan.pickle"
+        path.write_bytes(b"not a pickle")
+        cache = ScanCache(path, "fp")
+        cache.load()
+        assert cache.get("a.py", "x") is None
+
+    def test_unseen_entries_dropped_on_save(self, tmp_path):
+        path = tmp_path / "scan.pickle"
+        cache = ScanCache(path, "fp")
+        cache.put("a.py", "x", 1)
+        cache.put("b.py", "y", 2)
+        cache.save()
+
+        second = ScanCache(path, "fp")
+        second.load()
+        second.get("a.py", "x")
+        second.save()
+
+        third = ScanCache(path, "fp")
+        third.load()
+        assert third.get("b.py", "y") is None
+
+    def test_content_id(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        assert content_id(f, "abc") == "git:abc"
+        assert content_id(f).startswith("stat:")
+
+
+class TestCachedScan:
+    def test_unchanged_files_reused(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text('def f():\n    """F."""\n')
+        (src / "b.py").write_text('def g():\n    """G."""\n')
+        cache_path = tmp_path / "cache.pickle"
+        fp = scan_fingerprint(src)
+
+        first = ScanCache(cache_path, fp)
+        scan_directory(src, cache=first)
+        first.save()
+        assert first.stats == {"hits": 0, "misses": 2}
+
+        (src / "b.py").write_text('def g():\n    """Changed."""\n')
+        st = os.stat(src / "b.py")
+        os.utime(src / "b.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        second = ScanCache(cache_path, fp)
+        second.load()
+        modules, _ = scan_directory(src, cache=second)
+        assert second.stats == {"hits": 1, "misses": 1}
+        b = next(m for m in modules if m.name == "b")
+        assert b.functions[0].docstring.summary == "Changed."
+
+    def test_parse_memo_persisted(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        body = 'def f():\n    """Shared."""\n\ndef g():\n    """Shared."""\n'
+        (src / "a.py").write_text(body)
+        cache_path = tmp_path / "cache.pickle"
+        fp = scan_fingerprint(src)
+
+        first = ScanCache(cache_path, fp)
+        stats = {}
+        scan_directory(src, cache=first, stats=stats)
+        first.save()
+        assert stats["parse_memo"] == {"hits": 0, "misses": 2}
+
+        (src / "b.py").write_text('def h():\n    """Shared."""\n')
+        second = ScanCache(cache_path, fp)
+        second.load()
+        stats = {}
+        scan_directory(src, cache=second, stats=stats)
+        assert stats["parse_memo"] == {"hits": 1, "misses": 0}
+
+
+class TestCacheLocation:
+    def test_cache_kept_outside_output(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text('def f():\n    """F."""\n')
+        out = tmp_path / "docs"
+        legacy = out / ".cache"
+        legacy.mkdir(parents=True)
+        (legacy / "scan.pickle").write_bytes(b"planted")
+
+        build_docs(src, out, {"custom_doc_types": []})
+        assert not legacy.exists()
+        directory = cache_dir(out)
+        assert not directory.is_relative_to(out)
+        assert (directory / "scan.pickle").exists()
+        assert (directory / ".gitignore").read_text() == "*\n"
+
+        configured = tmp_path / "cache"
+        config = {"custom_doc_types": [], "cache_dir": str(configured)}
+        build_docs(src, out, config)
+        assert (configured / "scan.pickle").exists()
+        assert cache_dir(out, configured) == configured
@@ -0,0 +1,230 @@
+"""Tests for cacaodocs.callgraph call resolution and graph queries."""
+
+import random
+import textwrap
+
+import pytest
+
+from cacaodocs.builder import build_json
+from cacaodocs.callgraph import CallGraph, build_call_graph
+from cacaodocs.plugin import DocsPlugin
+from cacaodocs.scanner import scan_directory
+
+
+def _write(root, rel, source):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(source))
+
+
+def _project(tmp_path):
+    _write(tmp_path, "pkg/__init__.py", "from .core import Engine\n")
+    _write(
+        tmp_path,
+        "pkg/core.py",
+        """
+        from .util import helper as assist
+
+
+        class Parser:
+            def parse(self, text):
+                return assist(text)
+
+
+        class Engine:
+            parser: "Parser"
+
+            def __init__(self, parser: Parser | None = None):
+                self.parser = parser or Parser()
+
+            def run(self, text):
+                return self.parser.parse(text)
+
+            def start(self):
+                return self.run("x")
+        """,
+    )
+    _write(
+        tmp_path,
+        "pkg/util.py",
+        """
+        import json
+
+
+        def helper(text):
+            return json.dumps(text)
+
+
+        def orphan():
+            return lonely()
+
+
+        def lonely():
+            return 1
+        """,
+    )
+    _write(
+        tmp_path,
+        "app.py",
+        """
+        from pkg import Engine
+
+
+        def main():
+            engine = Engine()
+            engine.start()
+        """,
+    )
+    modules, _ = scan_directory(tmp_path)
+    return modules
+
+
+class TestScannerTables:
+    def test_relative_import_table(self, tmp_path):
+        modules = {m.full_path: m for m in _project(tmp_path)}
+        assert modules["pkg.core"].imports["assist"] == "pkg.util.helper"
+        assert modules["pkg"].imports["Engine"] == "pkg.core.Engine"
+        assert modules["pkg.util"].imports["json"] == "json"
+
+    def test_attribute_types(self, tmp_path):
+        modules = {m.full_path: m for m in _project(tmp_path)}
+        engine = next(c for c in modules["pkg.core"].classes if c.name == "Engine")
+        assert engine.attribute_types == {"parser": "Parser"}
+
+
+class TestResolution:
+    def test_resolved_calls(self, tmp_path):
+        modules = _project(tmp_path)
+        build_call_graph(modules)
+        by_path = {}
+        for m in modules:
+            for f in m.functions:
+                by_path[f.full_path] = f
+            for c in m.classes:
+                for meth in c.methods:
+                    by_path[f"{c.full_path}.{meth.name}"] = meth
+
+        # alias of a relative import
+        assert by_path["pkg.core.Parser.parse"].resolved_calls == [
+            "pkg.util.helper"
+        ]
+        # self.attr.method via inferred attribute type
+        assert by_path["pkg.core.Engine.run"].resolved_calls == [
+            "pkg.core.Parser.parse"
+        ]
+        # class call resolves to __init__ through a package re-export
+        assert by_path["app.main"].resolved_calls == ["pkg.core.Engine.__init__"]
+
+    def test_external_calls_unresolved(self, tmp_path):
+        graph = build_call_graph(_project(tmp_path))
+        assert graph.unresolved["json.dumps"] == ["pkg.util.helper"]
+
+    def test_short_name_does_not_match(self, tmp_path):
+        _write(tmp_path, "a.py", "def load():\n    return 1\n")
+        _write(tmp_path, "b.py", "import json\n\ndef read(f):\n    return json.load(f)\n")
+        modules, _ = scan_directory(tmp_path)
+        graph = build_call_graph(modules)
+        assert len(graph.predecessors(graph.index["a.load"])) == 0
+
+
+class TestCallGraph:
+    def test_csr_adjacency(self):
+        graph = CallGraph(["a", "b", "c"], [(0, 1), (0, 2), (1, 2), (0, 1)])
+        assert list(graph.successors(0)) == [1, 2]
+        assert list(graph.predecessors(2)) == [0, 1]
+        assert graph.num_edges == 3
+
+    def test_reachable(self):
+        graph = CallGraph(["a", "b", "c", "d"], [(0, 1), (1, 2)])
+        live = graph.reachable([0])
+        assert list(live) == [1, 1, 1, 0]
+
+
+class TestDeadCode:
+    def test_transitively_dead(self, tmp_path):
+        modules = _project(tmp_path)
+        data = build_json(modules, [], {})
+        dead = {d["full_path"] for d in data["dead_code"]}
+        # orphan is never called; lonely is only called by orphan
+        assert dead == {"pkg.util.orphan", "pkg.util.lonely"}
+
+    def test_called_by_uses_canonical_paths(self, tmp_path):
+        data = build_json(_project(tmp_path), [], {})
+        assert data["called_by"]["pkg.util.helper"] == ["pkg.core.Parser.parse"]
+        assert "helper" not in data["called_by"]
+
+
+def _brute_reach(num_nodes, edges, source):
+    adj = [[] for _ in range(num_nodes)]
+    for a, b in edges:
+        adj[a].append(b)
+    seen, stack = set(), list(adj[source])
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(adj[node])
+    return seen
+
+
+class TestReachability:
+    def _graph(self):
+        # a -> b -> c -> b (cycle), c -> d, e isolated
+        names = ["a", "b", "c", "d", "e"]
+        return CallGraph(names, [(0, 1), (1, 2), (2, 1), (2, 3)])
+
+    def test_reaches(self):
+        graph = self._graph()
+        assert graph.reaches("a", "d") is True
+        assert graph.reaches("d", "a") is False
+        assert graph.reaches("a", "e") is False
+
+    def test_self_reach_requires_cycle(self):
+        graph = self._graph()
+        assert graph.reaches("b", "b") is True
+        assert graph.reaches("a", "a") is False
+
+    def test_callees_depth(self):
+        graph = self._graph()
+        assert graph.callees("a") == ["b"]
+        assert graph.callees("a", depth=2) == ["b", "c"]
+        assert graph.callees("a", depth=None) == ["b", "c", "d"]
+
+    def test_callers_depth(self):
+        graph = self._graph()
+        assert graph.callers("d") == ["c"]
+        assert graph.callers("d", depth=None) == ["a", "b", "c"]
+
+    def test_unknown_name(self):
+        with pytest.raises(KeyError):
+            self._graph().callers("missing")
+
+    def test_round_trip(self):
+        graph = self._graph()
+        restored = CallGraph.from_dict(graph.to_dict())
+        assert restored.nodes == graph.nodes
+        assert restored.reaches("a", "d") is True
+        assert restored.callers("b") == ["a", "c"]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            n = rng.randint(1, 25)
+            edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(n * 2)]
+            graph = CallGraph([str(i) for i in range(n)], edges)
+            for a in range(n):
+                expected = _brute_reach(n, edges, a)
+                for b in range(n):
+                    assert graph.reaches(str(a), str(b)) == (b in expected)
+
+
+class TestPluginQueries:
+    def test_docs_plugin_queries(self, tmp_path):
+        docs = DocsPlugin(build_json(_project(tmp_path), [], {}))
+        assert docs.callees("app.main") == ["pkg.core.Engine.__init__"]
+        assert "pkg.core.Engine.run" in docs.callers(
+            "pkg.util.helper", depth=None
+        )
+        assert docs.reaches("pkg.core.Engine.run", "pkg.util.helper") is True
+        assert docs.reaches("pkg.util.helper", "pkg.core.Engine.run") is False
+        assert docs.callers("not.a.function") == []
@@ -0,0 +1,66 @@
+"""Tests for cacaodocs.changelog append-only changelog store."""
+
+import json
+
+from cacaodocs.changelog import INDEX_FILE, ChangelogStore
+
+
+def _entry(i):
+    return {"timestamp": f"2024-01-{i:02d}", "changes": [{"name": f"f{i}"}] * i}
+
+
+class TestChangelogStore:
+    def test_append_tail_get(self, tmp_path):
+        store = ChangelogStore(tmp_path, max_segment_bytes=200)
+        builds = [store.append(_entry(i)) for i in range(1, 11)]
+        assert builds == list(range(1, 11))
+        assert len(list(tmp_path.glob("*.jsonl"))) > 1
+
+        reopened = ChangelogStore(tmp_path)
+        assert len(reopened) == 10
+        assert [e["build"] for e in reopened.tail(4)] == [7, 8, 9, 10]
+        assert reopened.tail(4)[0]["timestamp"] == "2024-01-07"
+        assert [e["build"] for e in reopened.tail(50)] == builds
+        assert reopened.tail(0) == []
+        assert reopened.get(3)["changes"] == [{"name": "f3"}] * 3
+        assert reopened.get(11) is None
+        assert [e["build"] for e in reopened] == builds
+
+    def test_segments_are_append_only(self, tmp_path):
+        store = ChangelogStore(tmp_path, max_segment_bytes=1 << 20)
+        store.append(_entry(1))
+        segment = next(tmp_path.glob("*.jsonl"))
+        before = segment.read_bytes()
+        store.append(_entry(2))
+        assert segment.read_bytes().startswith(before)
+
+    def test_unindexed_line_dropped(self, tmp_path):
+        store = ChangelogStore(tmp_path)
+        store.append(_entry(1))
+        segment = next(tmp_path.glob("*.jsonl"))
+        # An append interrupted before the index was written
+        with open(segment, "ab") as f:
+            f.write(b'{"build": 2, "partial')
+
+        store = ChangelogStore(tmp_path)
+        assert store.append(_entry(2)) == 2
+        assert [e["build"] for e in store] == [1, 2]
+
+    def test_index_rebuilt(self, tmp_path):
+        store = ChangelogStore(tmp_path, max_segment_bytes=100)
+        for i in range(1, 6):
+            store.append(_entry(i))
+        (tmp_path / INDEX_FILE).write_text("garbage")
+
+        rebuilt = ChangelogStore(tmp_path)
+        assert rebuilt.last_build == 5
+        assert rebuilt.get(4)["build"] == 4
+
+    def test_legacy_changelog_imported(self, tmp_path):
+        legacy = tmp_path / "changelog.json"
+        legacy.write_text(json.dumps([_entry(1), _entry(2)]), encoding="utf-8")
+
+        store = ChangelogStore.for_output(tmp_path)
+        assert not legacy.exists()
+        assert [e["timestamp"] for e in store] == ["2024-01-01", "2024-01-02"]
+        assert store.append(_entry(3)) == 3
@@ -0,0 +1,145 @@
+"""Tests for cacaodocs.encoder streaming JSON encoder."""
+
+import io
+import json
+import textwrap
+from pathlib import Path
+
+from cacaodocs.builder import build_json
+from cacaodocs.encoder import DocEncoder, DocView, dumps, to_dict
+from cacaodocs.scanner import scan_directory
+from cacaodocs.types import DocType, ParsedDocstring, ResponseDoc
+
+SOURCE = textwrap.dedent('''\
+    """Module döc."""
+
+
+    class Store:
+        """A store.
+
+        Attributes:
+            items (list): Stored items.
+        """
+
+        def get(self, key: str) -> str:
+            """Get a value.
+
+            Args:
+                key (str): The key.
+
+            Returns:
+                str: The value.
+
+            Raises:
+                KeyError: Missing key.
+            """
+            return self.items[key]
+
+
+    def list_users(limit: int = 10):
+        """List users.
+
+        Type: api
+        Method: GET
+        Path: /users
+
+        Query Params:
+            limit (int): Max results.
+
+        Response (200):
+            users (list): The users.
+        """
+
+
+    def on_signup(user):
+        """Fired on signup.
+
+        Type: event
+        Trigger: user created
+
+        Payload:
+            user_id (str): New user.
+        """
+
+
+    def settings():
+        """Settings.
+
+        Type: config
+
+        Fields:
+            DEBUG (bool, default=false): Debug mode.
+
+        Usage:
+            Call it.
+        """
+    # TODO: tidy up
+''')
+
+
+def _scan(tmp_path: Path):
+    (tmp_path / "shop.py").write_text(SOURCE, encoding="utf-8")
+    (tmp_path / "guide.md").write_text("# Guide\n\nÜber alles.\n", encoding="utf-8")
+    return scan_directory(tmp_path)
+
+
+class TestDocEncoder:
+    def test_matches_json_dump(self, tmp_path):
+        modules, pages = _scan(tmp_path)
+        config = {"title": "Ünïcode", "ratio": 1.5, "path": tmp_path, 3: None}
+
+        expected = json.dumps(
+            build_json(modules, pages, config),
+            indent=2,
+            ensure_ascii=False,
+            default=str,
+        )
+        lazy = build_json(modules, pages, config, lazy=True)
+        assert dumps(lazy) == expected
+
+        out = io.StringIO()
+        DocEncoder().dump(lazy, out, buffer=3)
+        assert out.getvalue() == expected
+
+    def test_records_encoded_directly(self):
+        doc = ParsedDocstring(
+            summary="S",
+            doc_type=DocType.API,
+            responses=[ResponseDoc(status_code=404, description="Gone")],
+        )
+        expected = json.dumps(to_dict(doc), indent=2, ensure_ascii=False)
+        assert dumps(doc) == expected
+        assert dumps([{"doc": doc}]) == json.dumps(
+            [{"doc": to_dict(doc)}], indent=2, ensure_ascii=False
+        )
+
+    def test_empty_containers_and_scalars(self):
+        data = {"a": [], "b": {}, "c": [1, True, None, -2.5], "d": float("inf")}
+        assert dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+class TestDocView:
+    def test_view_matches_dict(self, tmp_path):
+        modules, pages = _scan(tmp_path)
+        assert build_json(modules, pages, {}, lazy=True) == build_json(
+            modules, pages, {}
+        )
+
+    def test_conditional_sections(self):
+        view = DocView(ParsedDocstring(summary="S"))
+        assert view["summary"] == "S"
+        assert view["doc_type"] == "function"
+        assert "http_method" not in view
+        assert view.get("custom_sections") is None
+
+        api = DocView(ParsedDocstring(doc_type=DocType.API, path="/x"))
+        assert api["path"] == "/x"
+        assert api["responses"] == []
+
+    def test_nested_records_are_views(self, tmp_path):
+        modules, _ = _scan(tmp_path)
+        module = DocView(modules[0])
+        method = module["classes"][0]["methods"][0]
+        assert isinstance(method, DocView)
+        assert method["docstring"]["args"][0]["name"] == "key"
+        assert method["docstring"]["returns"] == {"type": "str", "description": "The value."}
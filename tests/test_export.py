@@ -0,0 +1,270 @@
+"""Tests for cacaodocs.export static export."""
+
+import gzip
+import json
+
+from cacaodocs.builder import build_docs
+from cacaodocs.export import (
+    SITE_MANIFEST,
+    export_site,
+    fingerprint_assets,
+    fingerprint,
+    search_terms,
+    shard_site,
+)
+
+
+def _site_build(app_file, output, base_path):
+    """Stand-in for ``cacao build``: one page per build plus a fixed asset."""
+    output.mkdir(parents=True, exist_ok=True)
+    data = (app_file.parent / "data.json").read_text(encoding="utf-8")
+    (output / "index.html").write_text(base_path + data, encoding="utf-8")
+    (output / "assets").mkdir()
+    (output / "assets" / "app.js").write_text("render();", encoding="utf-8")
+
+
+def _cacao_html(pages):
+    """Page shell in the shape written by ``cacao build``."""
+    return (
+        "<html><body>\n    <script>\n"
+        f"    window.__CACAO_PAGES__ = {json.dumps({'pages': pages})};\n"
+        "    </script>\n"
+        '    <script src="./cacao.js"></script>\n'
+        "    <script>\n    Cacao.initStatic({}); Cacao.mount();\n    </script>\n"
+        "</body></html>"
+    )
+
+
+def _panel(key, text):
+    return {
+        "type": "NavPanel",
+        "props": {"panelKey": key},
+        "children": [{"type": "Text", "props": {"content": text}}],
+    }
+
+
+def _build(src, out, docstring):
+    (src / "a.py").write_text(f'def f():\n    """{docstring}"""\n')
+    (src / "b.py").write_text('def g():\n    """G."""\n')
+    build_docs(str(src), str(out), {"custom_doc_types": []})
+
+
+class TestShardSite:
+    def test_panels_and_search_sharded(self, tmp_path):
+        pages = {
+            "/": [
+                {
+                    "type": "AppShell",
+                    "props": {},
+                    "children": [
+                        {"type": "NavSidebar", "props": {}, "children": []},
+                        {
+                            "type": "ShellContent",
+                            "props": {},
+                            "children": [
+                                _panel("home", "Welcome </script>"),
+                                _panel("mod_shop", "Shop"),
+                            ],
+                        },
+                    ],
+                }
+            ]
+        }
+        for name in ("index.html", "404.html"):
+            (tmp_path / name).write_text(_cacao_html(pages), encoding="utf-8")
+        data = {
+            "modules": [{"name": "shop", "full_path": "shop"}],
+            "classes": [
+                {
+                    "name": "ScanCache",
+                    "module": "shop",
+                    "full_path": "shop.ScanCache",
+                    "methods": [{"name": "get_item"}],
+                }
+            ],
+            "functions": [
+                {"name": "orphan", "module": "gone", "full_path": "gone.orphan"}
+            ],
+        }
+
+        manifest = shard_site(tmp_path, data)
+        assert manifest == json.loads((tmp_path / SITE_MANIFEST).read_text())
+        assert set(manifest["panels"]) == {"home", "mod_shop"}
+        home = json.loads((tmp_path / manifest["panels"]["home"]).read_text())
+        assert home == [{"type": "Text", "props": {"content": "Welcome </script>"}}]
+
+        html = (tmp_path / "index.html").read_text(encoding="utf-8")
+        assert html == (tmp_path / "404.html").read_text(encoding="utf-8")
+        assert "Welcome" not in html
+        assert html.index('Cacao.registerComponent("NavPanel"') < html.index(
+            "Cacao.initStatic("
+        )
+        tree = json.loads(html.split("window.__CACAO_PAGES__ = ")[1].split(";\n")[0])
+        panel = tree["pages"]["/"][0]["children"][1]["children"][1]
+        assert panel["children"] == []
+        assert panel["props"]["shard"] == manifest["panels"]["mod_shop"]
+
+        # Entries are grouped by term prefix; ones without a panel dropped
+        assert set(manifest["search"]) == {"ca", "ge", "it", "sc", "sh"}
+        sc = json.loads((tmp_path / manifest["search"]["sc"]).read_text())
+        assert sc == {
+            "scan": [["shop.ScanCache (class)", "mod_shop"]],
+            "scancache": [["shop.ScanCache (class)", "mod_shop"]],
+        }
+
+    def test_mount_call_in_page_content(self, tmp_path):
+        pages = {"/": [_panel("home", "Call Cacao.initStatic() first.")]}
+        (tmp_path / "index.html").write_text(_cacao_html(pages), encoding="utf-8")
+
+        manifest = shard_site(tmp_path)
+        assert manifest is not None
+        assert set(manifest["panels"]) == {"home"}
+        html = (tmp_path / "index.html").read_text(encoding="utf-8")
+        assert "first." not in html
+        assert html.index('Cacao.registerComponent("NavPanel"') < html.index(
+            "Cacao.initStatic({})"
+        )
+
+    def test_unknown_html_left_alone(self, tmp_path):
+        (tmp_path / "index.html").write_text("<html></html>")
+        assert shard_site(tmp_path) is None
+        assert (tmp_path / "index.html").read_text() == "<html></html>"
+        assert not (tmp_path / SITE_MANIFEST).exists()
+
+    def test_search_terms(self):
+        assert search_terms("HTTPServer") == {"http", "server", "httpserver"}
+        assert search_terms("scan_dir") == {"scan", "dir", "scan_dir"}
+
+
+class TestFingerprintAssets:
+    def test_assets_renamed_and_linked(self, tmp_path):
+        html = (
+            '<link rel="stylesheet" href="/repo/cacao-core.css">\n'
+            '<link rel="stylesheet" href="/repo/cacao-cat-charts.css">\n'
+            '<script src="/repo/cacao.js"></script>\n'
+            '<script>window.__CACAO_PAGES__ = {"t": "<a href=\\"/cacao.js\\">"};'
+            "</script>"
+        )
+        (tmp_path / "index.html").write_text(html, encoding="utf-8")
+        (tmp_path / "cacao.js").write_text("var Cacao = {};")
+        (tmp_path / "cacao-core.css").write_text("body {}")
+        (tmp_path / "cacao-cat-charts.css").write_text("canvas {}")
+        (tmp_path / "app.js").write_text("other();")
+
+        files = fingerprint_assets(tmp_path)
+        assert files == {
+            "cacao-cat-charts.css": fingerprint("cacao-cat-charts.css", b"canvas {}"),
+            "cacao-core.css": fingerprint("cacao-core.css", b"body {}"),
+            "cacao.js": fingerprint("cacao.js", b"var Cacao = {};"),
+        }
+        for name, published in files.items():
+            assert not (tmp_path / name).exists()
+            assert (tmp_path / published).exists()
+        assert (tmp_path / "app.js").exists()
+
+        out = (tmp_path / "index.html").read_text(encoding="utf-8")
+        assert f'href="/repo/{files["cacao-core.css"]}"' in out
+        assert f'src="/repo/{files["cacao.js"]}"' in out
+        # Page content that merely mentions the files is left alone
+        assert '\\"/cacao.js\\"' in out
+
+
+class TestExportSite:
+    def test_unchanged_files_not_rewritten(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        docs = tmp_path / "docs"
+        dist = tmp_path / "dist"
+        _build(src, docs, "F.")
+
+        result = export_site(docs, dist, build=_site_build)
+        assert result["written"] == ["assets/app.js", "index.html"]
+        asset_mtime = (dist / "assets" / "app.js").stat().st_mtime_ns
+
+        def fail(*args):
+            raise AssertionError("site rebuilt without changes")
+
+        result = export_site(docs, dist, build=fail)
+        assert result["up_to_date"] is True
+        assert result["unchanged"] == ["assets/app.js", "index.html"]
+
+        _build(src, docs, "F, reworded.")
+        result = export_site(docs, dist, build=_site_build)
+        assert result["written"] == ["index.html"]
+        assert result["unchanged"] == ["assets/app.js"]
+        assert (dist / "assets" / "app.js").stat().st_mtime_ns == asset_mtime
+
+    def test_unshardable_site_warns(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        docs = tmp_path / "docs"
+        _build(src, docs, "F.")
+
+        result = export_site(docs, tmp_path / "dist", build=_site_build)
+        assert result["sharded"] is False
+        assert len(result["warnings"]) == 1
+        assert export_site(docs, tmp_path / "dist", build=_site_build)["warnings"]
+
+        result = export_site(docs, tmp_path / "flat", build=_site_build, shard=False)
+        assert result["warnings"] == []
+
+    def test_stale_files_removed(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        docs = tmp_path / "docs"
+        dist = tmp_path / "dist"
+        _build(src, docs, "F.")
+        dist.mkdir()
+        (dist / "CNAME").write_text("docs.example.com")
+
+        export_site(docs, dist, build=_site_build)
+
+        def without_assets(app_file, output, base_path):
+            output.mkdir(parents=True, exist_ok=True)
+            (output / "index.html").write_text("<html>", encoding="utf-8")
+
+        result = export_site(docs, dist, base_path="/x", build=without_assets)
+        assert result["removed"] == ["assets/app.js"]
+        assert not (dist / "assets" / "app.js").exists()
+        # Files the export did not write are kept
+        assert (dist / "CNAME").read_text() == "docs.example.com"
+
+    def test_precompressed_and_fingerprinted(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        docs = tmp_path / "docs"
+        dist = tmp_path / "dist"
+        _build(src, docs, "F.")
+        embeddings = json.dumps({"chunks": [{"text": "f"}] * 200}).encode()
+        (docs / "embeddings.json").write_bytes(embeddings)
+
+        def build(app_file, output, base_path):
+            _site_build(app_file, output, base_path)
+            (output / "cacao.js").write_text("var Cacao = {};")
+
+        result = export_site(docs, dist, build=build, precompress=True)
+        name = fingerprint("embeddings.json", embeddings)
+        script = fingerprint("cacao.js", b"var Cacao = {};")
+        assert result["files"] == {"embeddings.json": name, "cacao.js": script}
+        assert (dist / name).read_bytes() == embeddings
+        assert not (dist / "embeddings.json").exists()
+        assert not (dist / "cacao.js").exists()
+        manifest = json.loads((dist / SITE_MANIFEST).read_text())
+        assert manifest["files"] == result["files"]
+
+        # Small files are left uncompressed
+        assert result["compressed"] == [name + ".gz", "index.html.gz"]
+        for gz in result["compressed"]:
+            original = (dist / gz[: -len(".gz")]).read_bytes()
+            assert gzip.decompress((dist / gz).read_bytes()) == original
+
+        assert export_site(docs, dist, build=build, precompress=True)["up_to_date"]
+        result = export_site(docs, dist, build=build)
+        assert set(result["removed"]) == {
+            name,
+            script,
+            name + ".gz",
+            "index.html.gz",
+            SITE_MANIFEST,
+        }
+        assert (dist / "embeddings.json").read_bytes() == embeddings
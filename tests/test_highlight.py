@@ -0,0 +1,84 @@
+"""Tests for cacaodocs.highlight code highlight cache."""
+
+import markdown
+
+from cacaodocs.highlight import CachedCodeHiliteExtension, HighlightCache
+from cacaodocs.render import MARKDOWN_EXTENSIONS, MarkdownRenderer
+
+PAGE = """# Title
+
+```python
+def f(x):
+    return x + 1
+```
+
+Text between blocks.
+
+    indented = True
+
+```{.python #anchor}
+y = 2
+```
+
+``` hl_lines="1"
+z = 3
+```
+"""
+
+
+class TestHighlightCache:
+    def test_matches_codehilite(self):
+        expected = markdown.markdown(PAGE, extensions=list(MARKDOWN_EXTENSIONS))
+        cache = HighlightCache()
+        md = markdown.Markdown(
+            extensions=[
+                "fenced_code",
+                "tables",
+                CachedCodeHiliteExtension(cache=cache),
+                "toc",
+            ]
+        )
+        assert md.convert(PAGE) == expected
+        assert md.reset().convert(PAGE) == expected
+        assert cache.hits == cache.misses
+
+    def test_identical_blocks_highlighted_once(self):
+        cache = HighlightCache()
+        renderer = MarkdownRenderer(highlighter=cache)
+        renderer.render_many(["```python\nx = 1\n```\n# A", "```python\nx = 1\n```\n# B"], 1)
+        assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+
+    def test_options_are_part_of_key(self):
+        cache = HighlightCache()
+        plain = cache.highlight("x = 1", "python")
+        numbered = cache.highlight("x = 1", "python", linenums=True)
+        assert plain != numbered
+        assert cache.misses == 2
+
+    def test_lru_eviction(self):
+        cache = HighlightCache(max_entries=2)
+        for code in ("a = 1", "b = 2", "a = 1", "c = 3"):
+            cache.highlight(code, "python")
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        # "a" was used most recently before "c", so "b" went first
+        cache.highlight("a = 1", "python")
+        assert cache.hits == 2
+
+    def test_persist(self, tmp_path):
+        cache = HighlightCache.in_dir(tmp_path)
+        cache.highlight("def f():\n    pass", "python")
+        cache.save()
+
+        reloaded = HighlightCache.in_dir(tmp_path)
+        assert len(reloaded) == 1
+        reloaded.highlight("def f():\n    pass", "python")
+        assert reloaded.stats == {"hits": 1, "misses": 0, "evictions": 0}
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "highlight.json"
+        cache = HighlightCache()
+        for text in ("not json", '{"version": 1, "entries": [["k", 2], "x"]}'):
+            path.write_text(text)
+            cache.load(path)
+            assert len(cache) == 0
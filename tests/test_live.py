@@ -0,0 +1,76 @@
+"""Tests for cacaodocs.live reloading of served docs."""
+
+import asyncio
+import copy
+
+from cacaodocs import live
+from cacaodocs.live import LiveApp
+from cacaodocs.manifest import BuildManifest
+
+
+class FakeApp:
+    def __init__(self, texts):
+        self.title = "Docs"
+        self._pages = {
+            "/": [
+                {
+                    "type": "Layout",
+                    "children": [
+                        {
+                            "type": "NavPanel",
+                            "props": {"panelKey": key},
+                            "children": [{"type": "Text", "props": {"content": text}}],
+                        }
+                        for key, text in texts.items()
+                    ],
+                }
+            ]
+        }
+
+    def get_all_pages(self):
+        # Serialized afresh on every call, like Cacao's
+        return copy.deepcopy(self._pages)
+
+
+class TestLiveApp:
+    def test_panel_hashes_follow_content(self, tmp_path):
+        before = LiveApp(FakeApp({"home": "a", "api": "b"}), tmp_path / "app.py")
+        after = LiveApp(FakeApp({"home": "a", "api": "c"}), tmp_path / "app.py")
+        assert before.nav == after.nav
+        assert before.hashes["home"] == after.hashes["home"]
+        assert before.hashes["api"] != after.hashes["api"]
+        version, panels = after.panels()
+        assert version == after.version
+        assert panels["api"][0]["props"]["content"] == "c"
+
+    def test_reloads_when_build_has_new_inputs(self, tmp_path, monkeypatch):
+        BuildManifest(tmp_path).save("one")
+        renders = []
+
+        def render(app_file):
+            renders.append(app_file)
+            return FakeApp({"home": "new"})
+
+        monkeypatch.setattr(live, "render_app", render)
+        app = FakeApp({"home": "old"})
+        watcher = LiveApp(app, tmp_path / "app.py")
+        version = watcher.version
+        assert watcher.check() is False
+
+        async def reload_while_waiting():
+            waiting = asyncio.ensure_future(watcher.wait(version, timeout=5))
+            await asyncio.sleep(0)
+            BuildManifest(tmp_path).save("two")
+            await asyncio.get_running_loop().run_in_executor(None, watcher.check)
+            await asyncio.wait_for(waiting, 1)
+
+        asyncio.run(reload_while_waiting())
+        assert renders == [(tmp_path / "app.py").resolve()]
+        assert watcher.version != version
+        assert watcher.panels()[1]["home"][0]["props"]["content"] == "new"
+        assert app._pages["/"][0]["children"][0]["children"][0]["props"] == {
+            "content": "new"
+        }
+        # Same inputs again: nothing to do
+        BuildManifest(tmp_path).save("two")
+        assert watcher.check() is False
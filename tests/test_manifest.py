@@ -0,0 +1,100 @@
+"""Tests for cacaodocs.manifest write-if-changed outputs."""
+
+import json
+import os
+
+from cacaodocs.builder import build_docs
+from cacaodocs.manifest import MANIFEST_FILE, BuildManifest, input_digest
+
+
+class TestBuildManifest:
+    def test_unchanged_bytes_not_rewritten(self, tmp_path):
+        manifest = BuildManifest.for_output(tmp_path)
+        assert manifest.write_text("a.txt", "one") is True
+        with manifest.open("b.json") as f:
+            f.write('{"b": 1}')
+        manifest.save("inputs")
+        os.utime(tmp_path / "a.txt", ns=(1, 1))
+        os.utime(tmp_path / "b.json", ns=(1, 1))
+
+        manifest = BuildManifest.for_output(tmp_path)
+        assert manifest.write_text("a.txt", "one") is False
+        with manifest.open("b.json") as f:
+            f.write('{"b": 2}')
+        assert manifest.stats == {"changed": ["b.json"], "unchanged": ["a.txt"]}
+        assert (tmp_path / "a.txt").stat().st_mtime_ns == 1
+        assert (tmp_path / "b.json").read_text() == '{"b": 2}'
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_failed_write_keeps_previous(self, tmp_path):
+        manifest = BuildManifest(tmp_path)
+        manifest.write_text("data.json", "old")
+        try:
+            with manifest.open("data.json") as f:
+                f.write("partial")
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        assert (tmp_path / "data.json").read_text() == "old"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_is_current(self, tmp_path):
+        manifest = BuildManifest(tmp_path)
+        manifest.write_text("app.py", "x = 1\n")
+        manifest.save("abc")
+
+        assert BuildManifest.for_output(tmp_path).is_current("abc")
+        assert not BuildManifest.for_output(tmp_path).is_current("def")
+        (tmp_path / "app.py").write_text("x = 2\n")
+        assert not BuildManifest.for_output(tmp_path).is_current("abc")
+
+    def test_input_digest(self):
+        config = {"title": "T", "custom_doc_types": [object()]}
+        digest = input_digest("fp", config, [("b.py", "1"), ("a.py", "2")])
+        assert digest == input_digest(
+            "fp", dict(config, custom_doc_types=[]), [("a.py", "2"), ("b.py", "1")]
+        )
+        assert digest != input_digest("fp", config, [("a.py", "2"), ("b.py", "3")])
+        assert digest != input_digest("fp", {"title": "U"}, [("a.py", "2"), ("b.py", "1")])
+
+
+class TestIncrementalBuild:
+    def test_noop_and_partial_rebuilds(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        out = tmp_path / "out"
+        config = {"custom_doc_types": []}
+        (src / "mod.py").write_text('def f():\n    """Do f."""\n')
+
+        stats = {}
+        build_docs(str(src), str(out), dict(config), stats=stats)
+        assert stats["outputs"]["changed"] == ["app.py", "data.json"]
+        assert "_build_stats" not in json.loads((out / "data.json").read_text())
+        assert json.loads((out / MANIFEST_FILE).read_text())["inputs"]
+        mtimes = {p: (out / p).stat().st_mtime_ns for p in ("app.py", "data.json")}
+
+        stats = {}
+        data = build_docs(str(src), str(out), dict(config), stats=stats)
+        outputs = stats["outputs"]
+        assert outputs["up_to_date"] is True
+        assert outputs["changed"] == []
+        assert stats["counts"]["functions"] == 1
+        assert [f["name"] for f in data["functions"]] == ["f"]
+        assert {p: (out / p).stat().st_mtime_ns for p in mtimes} == mtimes
+
+        # A docstring edit rewrites data.json only
+        (src / "mod.py").write_text('def f():\n    """Do f better."""\n')
+        stats = {}
+        build_docs(str(src), str(out), dict(config), stats=stats)
+        outputs = stats["outputs"]
+        assert outputs == {
+            "changed": ["data.json"],
+            "unchanged": ["app.py"],
+            "up_to_date": False,
+        }
+        assert (out / "app.py").stat().st_mtime_ns == mtimes["app.py"]
+
+        # Disabling the cache forces a rebuild, which still skips writes
+        stats = {}
+        build_docs(str(src), str(out), dict(config, cache=False), stats=stats)
+        assert stats["outputs"]["up_to_date"] is False
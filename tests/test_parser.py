@@ -80,6 +80,40 @@ class TestDirectives:
         result = parser.parse("Type: event\nTrigger: When user signs up\nUser signup.")
         assert result.trigger == "When user signs up"
 
+    def test_directive_inside_section(self):
+        parser = DocstringParser()
+        result = parser.parse(
+            "Create a user.\n\nArgs:\n    name (str): The name.\n"
+            "Method: PUT\n    email (str): The email."
+        )
+        assert result.http_method == "PUT"
+        assert [a.name for a in result.args] == ["name", "email"]
+
+    def test_only_first_directive_taken(self):
+        parser = DocstringParser()
+        result = parser.parse("Summary.\n\nMethod: GET\nMethod: POST")
+        assert result.http_method == "GET"
+        assert result.description == "Method: POST"
+
+
+class TestSectionBoundaries:
+    def test_header_ends_summary(self):
+        parser = DocstringParser()
+        result = parser.parse("Do a thing.\nReturns:\n    int: Count.")
+        assert result.summary == "Do a thing."
+        assert result.returns.type == "int"
+
+    def test_response_sections_in_order(self):
+        parser = DocstringParser()
+        result = parser.parse(
+            "Get.\n\nResponse (200):\n    OK.\n    id (int): Id.\n"
+            "Response (404):\n    Missing.\nNotes:\n    Cached."
+        )
+        assert [r.status_code for r in result.responses] == [200, 404]
+        assert result.responses[0].fields[0].name == "id"
+        assert result.responses[1].description == "Missing."
+        assert result.notes == ["Cached."]
+
 
 class TestArgsSection:
     def test_simple_args(self):
@@ -330,3 +364,95 @@ Attributes:
         result = parser.parse(docstring)
         assert len(result.attributes) == 2
         assert result.attributes[0].name == "name"
+
+
+class TestParseMemo:
+    DOC = "Summary.\n\nArgs:\n    a (int): First."
+
+    def test_repeated_docstring_hits_memo(self):
+        parser = DocstringParser()
+        results = [parser.parse(self.DOC) for _ in range(4)]
+        assert parser.memo_stats == {"hits": 2, "misses": 2}
+        assert all(r == results[0] for r in results)
+
+    def test_hint_type_is_part_of_key(self):
+        parser = DocstringParser()
+        for _ in range(3):
+            parser.parse(self.DOC, hint_type=DocType.API)
+        assert parser.parse(self.DOC).doc_type == DocType.FUNCTION
+        assert parser.parse(self.DOC, hint_type=DocType.API).doc_type == DocType.API
+
+    def test_results_are_isolated(self):
+        parser = DocstringParser()
+        for _ in range(3):
+            first = parser.parse(self.DOC)
+            first.summary = "changed"
+            first.http_method = "GET"
+            first.args.append(first.args[0])
+        result = parser.parse(self.DOC)
+        assert parser.memo_hits >= 2
+        assert result.summary == "Summary."
+        assert result.http_method == ""
+        assert len(result.args) == 1
+
+    def test_lru_bound(self):
+        parser = DocstringParser(memo_size=2)
+        for text in ("A.", "B.", "C.", "A."):
+            parser.parse(text)
+        assert len(parser._memo) == 2
+        assert parser.memo_hits == 0
+
+    def test_disabled(self):
+        parser = DocstringParser(memo_size=0)
+        parser.parse(self.DOC)
+        parser.parse(self.DOC)
+        assert parser.memo_stats == {"hits": 0, "misses": 0}
+
+    def test_load_memo(self):
+        parser = DocstringParser()
+        parser.parse(self.DOC)
+        parser.parse(self.DOC)
+        restored = DocstringParser()
+        restored.load_memo(parser.memo_items())
+        assert restored.parse(self.DOC).args[0].name == "a"
+        assert restored.memo_hits == 1
+
+
+class TestSectionDispatch:
+    def test_header_requires_colon_at_end(self):
+        parser = DocstringParser()
+        result = parser.parse("Summary.\n\nArgs :\n    a (int): x\nArgs: extra")
+        assert result.args == []
+        assert "Args :" in result.description
+
+    def test_case_insensitive_header_keeps_name(self):
+        parser = DocstringParser(
+            custom_types=[
+                CustomDocTypeDef(
+                    name="recipe",
+                    label="Recipe",
+                    sections=[CustomSectionDef(name="Größe")],
+                )
+            ]
+        )
+        result = parser.parse("Cake.\n\nARGS:\n    a (int): x\n\nGRÖßE:\n    Large.")
+        assert [a.name for a in result.args] == ["a"]
+        assert result.custom_sections == {"GRÖßE": "Large."}
+
+    def test_register_custom_handler(self):
+        parser = DocstringParser()
+        before = parser.fingerprint
+
+        def steps(header, lines, result):
+            result.custom_sections[header] = [ln.strip() for ln in lines if ln.strip()]
+
+        parser.register_section("Steps", steps)
+        result = parser.parse("Cook.\n\nsteps:\n    Mix.\n    Bake.")
+        assert result.custom_sections == {"steps": ["Mix.", "Bake."]}
+        assert parser.fingerprint != before
+
+    def test_register_without_handler_keeps_builtin(self):
+        parser = DocstringParser()
+        parser.register_section("Args")
+        result = parser.parse("F.\n\nArgs:\n    a (int): x")
+        assert result.args[0].name == "a"
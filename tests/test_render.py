@@ -0,0 +1,88 @@
+"""Tests for cacaodocs.render Markdown rendering."""
+
+import markdown
+
+from cacaodocs.render import MARKDOWN_EXTENSIONS, MarkdownRenderer
+from cacaodocs.scanner import scan_directory
+
+PAGE_A = """# Intro
+
+[TOC]
+
+## Setup
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+```python
+print("hi")
+```
+"""
+
+PAGE_B = """# Other
+
+## Setup
+
+Text.
+"""
+
+
+def _reference(text):
+    return markdown.markdown(text, extensions=list(MARKDOWN_EXTENSIONS))
+
+
+class TestMarkdownRenderer:
+    def test_reused_converter_matches_fresh(self):
+        renderer = MarkdownRenderer()
+        # State such as TOC ids must not leak between pages
+        for text in (PAGE_A, PAGE_B, PAGE_A):
+            assert renderer._convert(text) == _reference(text)
+
+    def test_cache_hits(self):
+        renderer = MarkdownRenderer()
+        first = renderer.render(PAGE_A)
+        assert renderer.render(PAGE_A) is first
+        assert renderer.stats == {"hits": 1, "misses": 1}
+
+    def test_render_many_dedupes(self):
+        renderer = MarkdownRenderer()
+        out = renderer.render_many([PAGE_A, PAGE_B, PAGE_A], workers=1)
+        assert out == [_reference(PAGE_A), _reference(PAGE_B), _reference(PAGE_A)]
+        assert renderer.stats == {"hits": 1, "misses": 2}
+
+    def test_process_pool(self, monkeypatch):
+        monkeypatch.setattr("cacaodocs.render.PARALLEL_MIN_PAGES", 1)
+        renderer = MarkdownRenderer()
+        out = renderer.render_many([PAGE_A, PAGE_B], workers=2)
+        assert out == [_reference(PAGE_A), _reference(PAGE_B)]
+
+    def test_inline_by_default(self, monkeypatch):
+        monkeypatch.setattr("cacaodocs.render.PARALLEL_MIN_PAGES", 1)
+        monkeypatch.setattr("cacaodocs.render.ProcessPoolExecutor", None)
+        out = MarkdownRenderer().render_many([PAGE_A, PAGE_B])
+        assert out == [_reference(PAGE_A), _reference(PAGE_B)]
+
+    def test_restored_cache(self):
+        warm = MarkdownRenderer()
+        warm.render(PAGE_B)
+        renderer = MarkdownRenderer(cache=warm.used)
+        renderer.render_many([PAGE_B], workers=1)
+        assert renderer.stats == {"hits": 1, "misses": 0}
+
+    def test_extensions_change_key(self):
+        assert MarkdownRenderer().key(PAGE_A) != MarkdownRenderer(("tables",)).key(
+            PAGE_A
+        )
+
+
+class TestScanPages:
+    def test_pages_rendered(self, tmp_path):
+        (tmp_path / "a.md").write_text(PAGE_A)
+        (tmp_path / "b.md").write_text(PAGE_B)
+        stats = {}
+        _, pages = scan_directory(tmp_path, stats=stats)
+        by_title = {p.title: p for p in pages}
+        assert by_title["Intro"].content == _reference(PAGE_A)
+        assert by_title["Other"].content == _reference(PAGE_B)
+        assert stats["render"] == {"hits": 0, "misses": 2}
@@ -1,17 +1,25 @@
 """Tests for cacaodocs.scanner file discovery and AST extraction."""
 
+import ast
+import fnmatch
+import os
+import shutil
+import subprocess
 import textwrap
 from pathlib import Path
 
 import pytest
 
+from cacaodocs.discovery import compile_patterns, git_sources, parse_gitignore
 from cacaodocs.scanner import (
     Scanner,
+    _SourceIndex,
     _extract_http_method,
     _is_api_decorator,
+    prefetch_files,
     scan_directory,
 )
-from cacaodocs.types import DocType
+from cacaodocs.types import DocType, ParamKind
 
 
 class TestIsAPIDecorator:
@@ -91,6 +99,187 @@ class TestScannerFileDiscovery:
         assert "bad.py" not in names
 
 
+class TestSinglePassDiscovery:
+    def test_yields_python_and_markdown(self, tmp_path):
+        (tmp_path / "a.py").write_text("")
+        (tmp_path / "b.md").write_text("")
+        (tmp_path / "c.txt").write_text("")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "d.py").write_text("")
+
+        files = list(Scanner().find_source_files(tmp_path))
+        assert sorted(f.name for f in files) == ["a.py", "b.md", "d.py"]
+        # Files of a directory come before its subdirectories (os.walk order)
+        assert files[-1].name == "d.py"
+
+    def test_compiled_patterns_match_fnmatch(self):
+        patterns = ["*.egg-info", "build", "tests/*.py", "[ab]?.py"]
+        regex = compile_patterns(patterns)
+        for name in ["x.egg-info", "build", "builder", "tests/t.py", "a1.py", "c1.py"]:
+            expected = any(fnmatch.fnmatch(name, p) for p in patterns)
+            assert bool(regex.match(os.path.normcase(name))) == expected
+
+    def test_exclude_relative_path(self, tmp_path):
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_a.py").write_text("")
+        (tmp_path / "keep.py").write_text("")
+
+        scanner = Scanner(exclude_patterns=["tests/*.py"])
+        names = [f.name for f in scanner.find_python_files(tmp_path)]
+        assert names == ["keep.py"]
+
+    def test_symlinked_dirs_not_followed(self, tmp_path):
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "mod.py").write_text("")
+        (tmp_path / "link").symlink_to(real, target_is_directory=True)
+
+        files = list(Scanner().find_python_files(tmp_path))
+        assert [f.parent.name for f in files] == ["real"]
+
+
+class TestGitIgnore:
+    def _names(self, tmp_path, **kwargs):
+        files = Scanner(exclude_patterns=[], **kwargs).find_source_files(tmp_path)
+        return sorted(f.relative_to(tmp_path).as_posix() for f in files)
+
+    def test_basic_ignore_and_negation(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("*.md\n!KEEP.md\ngen_*.py\n")
+        for name in ["a.py", "gen_x.py", "notes.md", "KEEP.md"]:
+            (tmp_path / name).write_text("")
+
+        assert self._names(tmp_path) == ["KEEP.md", "a.py"]
+
+    def test_dir_only_and_anchored(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("out/\n/top.py\n")
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "x.py").write_text("")
+        (tmp_path / "top.py").write_text("")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "top.py").write_text("")
+        (tmp_path / "pkg" / "out.py").write_text("")
+
+        assert self._names(tmp_path) == ["pkg/out.py", "pkg/top.py"]
+
+    def test_double_star(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("**/migrations/*.py\n")
+        deep = tmp_path / "app" / "db" / "migrations"
+        deep.mkdir(parents=True)
+        (deep / "0001.py").write_text("")
+        (tmp_path / "app" / "db" / "models.py").write_text("")
+
+        assert self._names(tmp_path) == ["app/db/models.py"]
+
+    def test_nested_gitignore_overrides_parent(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("*.md\n")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / ".gitignore").write_text("!guide.md\n")
+        (docs / "guide.md").write_text("")
+        (docs / "draft.md").write_text("")
+
+        assert self._names(tmp_path) == ["docs/guide.md"]
+
+    def test_parent_gitignore_applies_to_subdirectory_scan(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".gitignore").write_text("generated.py\n")
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "generated.py").write_text("")
+        (src / "real.py").write_text("")
+
+        assert self._names(src) == ["real.py"]
+
+    def test_respect_gitignore_disabled(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("*.py\n")
+        (tmp_path / "a.py").write_text("")
+
+        assert self._names(tmp_path, respect_gitignore=False) == ["a.py"]
+
+    def test_rule_parsing(self):
+        rules = parse_gitignore("# comment\n\n\\#literal\nfoo/\n")
+        assert len(rules) == 2
+        assert rules[0].matches("#literal", False)
+        assert rules[1].dir_only and not rules[1].matches("foo", False)
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitDiscovery:
+    def test_lists_tracked_and_untracked(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        (tmp_path / ".gitignore").write_text("ignored.py\n")
+        (tmp_path / "tracked.py").write_text("x = 1\n")
+        (tmp_path / "changed.py").write_text("y = 1\n")
+        (tmp_path / "ignored.py").write_text("")
+        (tmp_path / "venv").mkdir()
+        (tmp_path / "venv" / "lib.py").write_text("")
+        _git(tmp_path, "add", ".gitignore", "tracked.py", "changed.py", "venv")
+        _git(tmp_path, "commit", "-q", "-m", "init")
+        (tmp_path / "changed.py").write_text("y = 2\n")
+        (tmp_path / "new.md").write_text("# New")
+
+        listed = dict(git_sources(tmp_path, ["venv"]))
+        names = {p.name: blob for p, blob in listed.items()}
+
+        assert set(names) == {"tracked.py", "changed.py", "new.md"}
+        assert len(names["tracked.py"]) == 40
+        # Modified and untracked files have no usable blob id
+        assert names["changed.py"] is None
+        assert names["new.md"] is None
+
+    def test_scanner_git_mode(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        (tmp_path / "a.py").write_text('"""A."""\n')
+        _git(tmp_path, "add", "a.py")
+        _git(tmp_path, "commit", "-q", "-m", "init")
+
+        scanner = Scanner(discovery="git")
+        assert [p.name for p in scanner.find_source_files(tmp_path)] == ["a.py"]
+        assert scanner.last_discovery == "git"
+
+    def test_falls_back_outside_repo(self, tmp_path):
+        (tmp_path / "a.py").write_text("")
+        assert git_sources(tmp_path, []) is None
+
+        scanner = Scanner(discovery="git")
+        assert [p.name for p in scanner.find_source_files(tmp_path)] == ["a.py"]
+        assert scanner.last_discovery == "filesystem"
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            Scanner(discovery="svn")
+
+
+class TestSourceIndex:
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "def f():\n    return 1\n",
+            "x = 'é😀'; y = 2\r\ndef g(a='ü'):\r\n    return a\r\n",
+            "x = 1\rclass A:\n    def m(self): return 'ß'\n",
+        ],
+    )
+    def test_matches_get_source_segment(self, source):
+        index = _SourceIndex(source)
+        for node in ast.walk(ast.parse(source)):
+            if hasattr(node, "end_col_offset"):
+                expected = ast.get_source_segment(source, node) or ""
+                assert index.segment(node) == expected
+
+    def test_node_without_position(self):
+        assert _SourceIndex("x = 1\n").segment(ast.Module()) == ""
+
+
 class TestScanModule:
     def test_scan_simple_function(self, tmp_path):
         code = textwrap.dedent('''\
@@ -119,6 +308,40 @@ class TestScanModule:
         assert func.docstring.returns is not None
         assert func.is_async is False
 
+    def test_structured_params(self, tmp_path):
+        code = textwrap.dedent('''\
+            def f(a, b=(1, [2, 3]), /, c: dict[str, int] = {"x": 1}, *args,
+                  d, e: int = 0, **kw) -> list[int]:
+                pass
+
+            def g(*, key=None):
+                pass
+        ''')
+        py_file = tmp_path / "sig.py"
+        py_file.write_text(code)
+
+        f, g = Scanner().scan_module(py_file, tmp_path).functions
+        assert [(p.name, p.kind) for p in f.params] == [
+            ("a", ParamKind.POSITIONAL_ONLY),
+            ("b", ParamKind.POSITIONAL_ONLY),
+            ("c", ParamKind.POSITIONAL),
+            ("args", ParamKind.VAR_POSITIONAL),
+            ("d", ParamKind.KEYWORD_ONLY),
+            ("e", ParamKind.KEYWORD_ONLY),
+            ("kw", ParamKind.VAR_KEYWORD),
+        ]
+        assert f.params[1].default == "(1, [2, 3])"
+        assert f.params[2].annotation == "dict[str, int]"
+        assert f.params[2].default == "{'x': 1}"
+        assert f.params[3].default is None
+        assert f.return_annotation == "list[int]"
+        assert f.signature == (
+            "(a, b=(1, [2, 3]), /, c: dict[str, int]={'x': 1}, *args, "
+            "d, e: int=0, **kw) -> list[int]"
+        )
+        assert g.signature == "(*, key=None)"
+        assert g.return_annotation == ""
+
     def test_scan_async_function(self, tmp_path):
         code = textwrap.dedent('''\
             async def fetch(url: str) -> dict:
@@ -208,6 +431,66 @@ class TestScanModule:
         module = scanner.scan_module(pkg / "__init__.py", tmp_path)
         assert module.full_path == "mypackage"
 
+    def test_identifiers_interned(self, tmp_path):
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.py").write_text(
+                "import functools\n\n"
+                "@functools.lru_cache\n"
+                "def f():\n"
+                "    return helper.run()\n"
+            )
+
+        scanner = Scanner()
+        a = scanner.scan_module(tmp_path / "a.py", tmp_path).functions[0]
+        b = scanner.scan_module(tmp_path / "b.py", tmp_path).functions[0]
+        assert a.decorators == ["functools.lru_cache"]
+        assert a.decorators[0] is b.decorators[0]
+        assert a.calls[0] is b.calls[0]
+        # Computed per file, so equal hashes are only shared if interned
+        assert a.body_statement_hashes == b.body_statement_hashes
+        assert a.body_statement_hashes[0] is b.body_statement_hashes[0]
+
+
+class TestFileReading:
+    def test_pep263_encoding(self, tmp_path):
+        f = tmp_path / "legacy.py"
+        f.write_bytes(
+            b"# -*- coding: latin-1 -*-\n"
+            b'def greet():\n    """Say gr\xfc\xdf gott."""\n'
+        )
+        scanner = Scanner()
+        module = scanner.scan_module(f, tmp_path)
+        assert module.functions[0].docstring.summary == "Say grüß gott."
+
+    def test_invalid_bytes_replaced(self, tmp_path):
+        f = tmp_path / "broken.py"
+        f.write_bytes(b'def f():\n    """Bad \xff byte."""\n')
+        module = Scanner().scan_module(f, tmp_path)
+        assert module.functions[0].docstring.summary == "Bad \ufffd byte."
+
+    def test_preread_bytes(self, tmp_path):
+        f = tmp_path / "mod.py"
+        f.write_text("")
+        data = b'def f():\r\n    """From memory."""\r\n'
+        module = Scanner().scan_module(f, tmp_path, data)
+        assert module.functions[0].docstring.summary == "From memory."
+        assert "\r" not in module.functions[0].source
+
+    @pytest.mark.parametrize("depth", [0, 1, 3, 16])
+    def test_prefetch_preserves_order(self, tmp_path, depth):
+        paths = []
+        for i in range(10):
+            path = tmp_path / f"f{i}.py"
+            path.write_bytes(str(i).encode())
+            paths.append(path)
+        result = list(prefetch_files(paths, depth=depth))
+        assert [p for p, _ in result] == paths
+        assert [d for _, d in result] == [str(i).encode() for i in range(10)]
+
+    def test_prefetch_missing_file_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            list(prefetch_files([tmp_path / "missing.py"], depth=4))
+
 
 class TestScanMarkdown:
     def test_scan_markdown(self, tmp_path):
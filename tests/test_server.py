@@ -0,0 +1,39 @@
+"""Tests for cacaodocs.server pre-forked workers."""
+
+import os
+
+import pytest
+
+from cacaodocs.server import can_fork, serve_workers
+
+pytestmark = pytest.mark.skipif(not can_fork(), reason="needs os.fork")
+
+
+class TestServeWorkers:
+    def test_workers_share_preloaded_app(self, tmp_path):
+        loads = []
+
+        def load(app_file):
+            loads.append(app_file)
+            return {"data": list(range(1000))}
+
+        def worker(asgi, sock):
+            (tmp_path / str(os.getpid())).write_text(
+                f"{sock.getsockname()[1]} {len(asgi['data'])}"
+            )
+
+        status = serve_workers(tmp_path / "app.py", "127.0.0.1", 0, 3, load, worker)
+        assert status == 0
+        assert loads == [tmp_path / "app.py"]
+        reports = [p.read_text().split() for p in tmp_path.iterdir()]
+        assert len(reports) == 3
+        # One socket, bound once in the parent
+        assert len({port for port, _ in reports}) == 1
+        assert {size for _, size in reports} == {"1000"}
+
+    def test_failed_worker_stops_server(self, tmp_path):
+        def worker(asgi, sock):
+            raise RuntimeError("cannot serve")
+
+        status = serve_workers("app.py", "127.0.0.1", 0, 2, lambda f: None, worker)
+        assert status == 1
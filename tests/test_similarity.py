@@ -0,0 +1,111 @@
+"""Tests for cacaodocs.similarity duplicate detection."""
+
+import textwrap
+
+import pytest
+
+from cacaodocs.scanner import scan_directory
+from cacaodocs.similarity import MinHasher, _jaccard, _shingles, find_duplicates
+
+
+BODY = """
+    total = 0
+    for item in items:
+        total += item.price * item.qty
+    if total > 100:
+        total *= 0.9
+    log(total)
+    return round(total, 2)
+"""
+
+
+def _write(tmp_path, name, source):
+    (tmp_path / name).write_text(textwrap.dedent(source))
+
+
+class TestMinHash:
+    def test_identical_sets_identical_signatures(self):
+        hasher = MinHasher(num_perm=32)
+        s = _shingles(["a1", "b2", "c3"])
+        assert hasher.signature(s) == hasher.signature(set(s))
+
+    def test_deterministic_across_instances(self):
+        s = _shingles(["a1", "b2", "c3"])
+        assert MinHasher(seed=7).signature(s) == MinHasher(seed=7).signature(s)
+
+    def test_shingles_capture_order(self):
+        a = _shingles(["a1", "b2", "c3"])
+        b = _shingles(["c3", "b2", "a1"])
+        assert _jaccard(a, b) < 1.0
+
+
+class TestFindDuplicates:
+    def test_exact_duplicates_grouped(self, tmp_path):
+        _write(tmp_path, "a.py", "def checkout(items):" + BODY)
+        _write(tmp_path, "b.py", "def basket_total(items):" + BODY)
+        modules, _ = scan_directory(tmp_path)
+
+        result = find_duplicates(modules)
+
+        assert len(result["exact"]) == 1
+        paths = [m["full_path"] for m in result["exact"][0]["members"]]
+        assert paths == ["a.checkout", "b.basket_total"]
+
+    def test_methods_are_indexed(self, tmp_path):
+        _write(tmp_path, "a.py", "def checkout(items):" + BODY)
+        method = textwrap.indent("def total(self, items):" + BODY, "    ")
+        _write(tmp_path, "b.py", "class Cart:\n" + method)
+        modules, _ = scan_directory(tmp_path)
+
+        result = find_duplicates(modules)
+
+        members = result["exact"][0]["members"]
+        assert {m["doc_type"] for m in members} == {"function", "method"}
+        assert "b.Cart.total" in [m["full_path"] for m in members]
+
+    def test_near_duplicates_clustered(self, tmp_path):
+        _write(tmp_path, "a.py", "def checkout(items):" + BODY)
+        near = BODY.replace("log(total)", "log(total)\n    audit(total)")
+        _write(tmp_path, "b.py", "def basket_total(items):" + near)
+        modules, _ = scan_directory(tmp_path)
+
+        result = find_duplicates(modules, threshold=0.5)
+
+        assert result["exact"] == []
+        assert len(result["near"]) == 1
+        cluster = result["near"][0]
+        assert 0.5 <= cluster["similarity"] < 1.0
+        assert len(cluster["members"]) == 2
+
+    def test_unrelated_functions_not_reported(self, tmp_path):
+        _write(tmp_path, "a.py", "def checkout(items):" + BODY)
+        _write(
+            tmp_path,
+            "b.py",
+            """
+            def parse(text):
+                lines = text.splitlines()
+                out = [l.strip() for l in lines]
+                return [l for l in out if l]
+            """,
+        )
+        modules, _ = scan_directory(tmp_path)
+
+        result = find_duplicates(modules)
+
+        assert result["exact"] == []
+        assert result["near"] == []
+
+    def test_short_bodies_ignored(self, tmp_path):
+        _write(tmp_path, "a.py", "def a(x):\n    return x\n")
+        _write(tmp_path, "b.py", "def b(x):\n    return x\n")
+        modules, _ = scan_directory(tmp_path)
+
+        result = find_duplicates(modules)
+
+        assert result["exact"] == []
+        assert result["stats"]["indexed"] == 0
+
+    def test_invalid_banding(self):
+        with pytest.raises(ValueError):
+            find_duplicates([], num_perm=64, bands=10)
@@ -0,0 +1,157 @@
+"""Tests for cacaodocs.store SQLite documentation store."""
+
+import json
+
+import pytest
+
+from cacaodocs import store as store_module
+from cacaodocs.builder import build_docs, build_json
+from cacaodocs.callgraph import CallGraph
+from cacaodocs.encoder import dumps
+from cacaodocs.plugin import DocsPlugin
+from cacaodocs.scanner import scan_directory
+from cacaodocs.store import STORE_FILE, DocStore, StoreData, write_store
+
+SOURCE = '''\
+"""Shop."""
+
+
+@app.get("/users/{id}")
+def get_user(id):
+    """Get a user."""
+    return load(id)
+
+
+@app.post("/users")
+def create_user(name):
+    """Create a user.
+
+    Args:
+        name: Full name.
+    """
+    return save(name)
+
+
+def load(id):
+    """Load."""
+    return id
+
+
+def save(name):
+    """Save."""
+    return print(name)
+
+
+def bare():
+    pass
+
+
+class Store:
+    """A store."""
+
+    def get(self, k):
+        """Get."""
+        return load(k)
+
+    def nodoc(self):
+        pass
+# TODO: one
+'''
+
+
+def _data(tmp_path):
+    (tmp_path / "mod.py").write_text(SOURCE, encoding="utf-8")
+    modules, pages = scan_directory(tmp_path)
+    # As read back from data.json
+    return json.loads(dumps(build_json(modules, pages, {})))
+
+
+def _store(tmp_path, data):
+    path = tmp_path / STORE_FILE
+    write_store(data, path)
+    return DocStore(path)
+
+
+class TestStoreData:
+    def test_matches_data_json(self, tmp_path):
+        data = _data(tmp_path)
+        data["changes"] = [
+            {
+                "full_path": "mod.bare",
+                "name": "bare",
+                "doc_type": "function",
+                "change": "new",
+            }
+        ]
+        store = _store(tmp_path, data)
+        stored = StoreData(store)
+
+        assert sorted(stored) == sorted(data)
+        for key in data:
+            value = stored[key]
+            if key == "called_by":
+                value = dict(value)
+            elif key in ("modules", "classes", "functions", "api_endpoints"):
+                value = list(value)
+            assert value == data[key], key
+        assert stored["functions"][-1] == data["functions"][-1]
+
+        graph = CallGraph.from_dict(data["call_graph"])
+        for name in graph.nodes:
+            for depth in (1, None):
+                assert store.callers(name, depth) == graph.callers(name, depth)
+                assert store.callees(name, depth) == graph.callees(name, depth)
+        assert store.reaches("mod.get_user", "mod.load")
+        assert not store.reaches("mod.load", "mod.get_user")
+
+        # The plugin picks the same documented items from either
+        plugin = DocsPlugin(StoreData(store))
+        expected = DocsPlugin(json.loads(json.dumps(data)))
+        for attr in ("modules", "classes", "functions", "api_endpoints"):
+            assert getattr(plugin, attr) == getattr(expected, attr), attr
+        assert plugin.callers("mod.load") == ["mod.Store.get", "mod.get_user"]
+        for docs in (plugin, expected):
+            assert docs.search("create user")[0]["full_path"] == "mod.create_user"
+
+
+class TestSearch:
+    @pytest.mark.parametrize("fts", [True, False])
+    def test_search(self, tmp_path, monkeypatch, fts):
+        monkeypatch.setattr(store_module, "fts5_available", lambda: fts)
+        store = _store(tmp_path, _data(tmp_path))
+
+        def found(query):
+            return [r["full_path"] for r in store.search(query)]
+
+        assert found("create user") == ["mod.create_user"]
+        # The last word may be a prefix
+        assert "mod.Store" in found("sto")
+        assert found("Store")[0] == "mod.Store"
+        assert found("get_user") == ["mod.get_user"]
+        assert found("nothing matches") == []
+        assert found("  ") == []
+
+
+class TestBuild:
+    def test_sqlite_build(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text(SOURCE, encoding="utf-8")
+        out = tmp_path / "out"
+        config = {"sqlite": True, "cache": False, "custom_doc_types": []}
+
+        build_docs(src, out, dict(config))
+        app_code = (out / "app.py").read_text(encoding="utf-8")
+        assert "StoreData(" in app_code and "json.load(" not in app_code
+        compile(app_code, "app.py", "exec")
+        data = json.loads((out / "data.json").read_text(encoding="utf-8"))
+        assert list(StoreData(out / STORE_FILE)["classes"]) == data["classes"]
+
+        # Same data, same bytes: the store is left alone
+        stats: dict = {}
+        build_docs(src, out, dict(config), stats=stats)
+        assert STORE_FILE in stats["outputs"]["unchanged"]
+
+        build_docs(src, out, dict(config, sqlite=False))
+        assert not (out / STORE_FILE).exists()
+        assert "json.load(" in (out / "app.py").read_text(encoding="utf-8")
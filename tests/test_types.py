@@ -1,6 +1,13 @@
 """Tests for cacaodocs.types dataclasses and enums."""
 
+import copy
+import pickle
+
+import pytest
+
 from cacaodocs.types import (
+    EMPTY_DICT,
+    EMPTY_LIST,
     ArgDoc,
     ClassDoc,
     ConfigFieldDoc,
@@ -102,3 +109,34 @@ class TestDocumentationData:
         assert d.modules == []
         assert d.pages == []
         assert d.config == {}
+
+
+class TestCompactModel:
+    def test_slots(self):
+        p = ParsedDocstring()
+        assert not hasattr(p, "__dict__")
+        with pytest.raises(AttributeError):
+            p.unknown = 1
+
+    def test_empty_defaults_shared(self):
+        a, b = ParsedDocstring(), ParsedDocstring()
+        assert a.args is b.args is EMPTY_LIST
+        assert a.custom_sections is EMPTY_DICT
+        assert a == ParsedDocstring(args=[], custom_sections={})
+
+    def test_empty_defaults_read_only(self):
+        p = ParsedDocstring()
+        with pytest.raises(TypeError):
+            p.args.append(ArgDoc(name="x", type="", description=""))
+        with pytest.raises(TypeError):
+            p.custom_sections["Usage"] = "text"
+        p.args = [ArgDoc(name="x", type="", description="")]
+        assert len(p.args) == 1
+        assert ParsedDocstring().args == []
+
+    def test_pickle_and_copy_keep_singletons(self):
+        p = ParsedDocstring()
+        for clone in (pickle.loads(pickle.dumps(p)), copy.deepcopy(p)):
+            assert clone.args is EMPTY_LIST
+            assert clone.custom_sections is EMPTY_DICT
+        assert EMPTY_LIST.copy() == [] and EMPTY_LIST.copy() is not EMPTY_LIST